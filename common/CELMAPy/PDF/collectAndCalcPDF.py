@@ -6,7 +6,7 @@ function of time traces.
 """
 
 from ..timeTrace import CollectAndCalcTimeTrace
-import numpy as np
+from ..collectAndCalcHelpers import RunningHistogram, RunningMoments
 
 #{{{CollectAndCalcPDF
 class CollectAndCalcPDF(CollectAndCalcTimeTrace):
@@ -41,6 +41,96 @@ class CollectAndCalcPDF(CollectAndCalcTimeTrace):
         super().__init__(*args, **kwargs)
     #}}}
 
+    #{{{executeCollectAndCalcPDF
+    def executeCollectAndCalcPDF(self                ,\
+                                 chunkSize   = 100   ,\
+                                 nBins       = None  ,\
+                                 binRange    = None  ,\
+                                 returnStats = False ,\
+                                 ):
+        #{{{docstring
+        """
+        Collects the time traces chunk by chunk in time, and calculates
+        the probability density function incrementally.
+
+        The time traces are read twice: Once to find the range of the
+        bins (and the statistics), and once to count the occurrences.
+        Passing binRange and nBins skips the range pass, unless
+        returnStats is True.
+        With the default arguments the result equals the one obtained
+        by calling calcPDF on the 1D output of executeCollectAndCalc,
+        but only one chunk of each time trace is held in memory.
+
+        Parameters
+        ----------
+        chunkSize : int
+            Number of time points to collect at a time.
+        nBins : [None|int]
+            Number of bins.
+            If None, the square root of the number of samples is used,
+            which requires the range pass.
+        binRange : [None|tuple]
+            The lower and upper edge of the bins.
+            If given, samples outside the range are not counted.
+            If given together with nBins (and returnStats is False),
+            the time traces are only read once.
+        returnStats : bool
+            Whether or not to return the skewness and the kurtosis.
+            These are accumulated in the range pass, so the time
+            traces are read twice if this is True.
+
+        Returns
+        -------
+        PDF : dict
+            Dictionary where the keys are on the form "rho,theta,z".
+            The value is a dict containing of
+            {varPDFX:pdfX, varPDFY:pdfY}
+        PDFStats : dict
+            Only returned if returnStats is True
+            Dictionary where the keys are on the form "rho,theta,z".
+            The value is a dict containing of
+            {"skew":skewness, "kurtExcess":excessKurtosis}
+        """
+        #}}}
+
+        # Make the keys
+        xKey = "{}PDFX".format(self._varName)
+        yKey = "{}PDFY".format(self._varName)
+
+        # Initialize the output
+        PDF      = {}
+        PDFStats = {}
+
+        for key, getChunks in self._iterChunks(chunkSize):
+            histogram = RunningHistogram()
+            moments   = RunningMoments()
+
+            # NOTE: The range pass is only needed if some of the range
+            #       or the number of bins is to be found from the data
+            if binRange is None or nBins is None or returnStats:
+                for chunk in getChunks():
+                    histogram.addRange(chunk)
+                    moments.add(chunk)
+
+            histogram.setEdges(nBins = nBins, binRange = binRange)
+            for chunk in getChunks():
+                histogram.add(chunk)
+
+            PDF[key] = {}
+            PDF[key][xKey], PDF[key][yKey] = histogram.getPDF()
+
+            if returnStats:
+                PDFStats[key] = {"skew"       : moments.getSkewness()[0],\
+                                 "kurtExcess" : moments.getKurtosis()[0]}
+
+        # NOTE: If convertToPhysical is set, then PDF is in physical
+        #       units as well
+        if returnStats:
+            return PDF, PDFStats
+        else:
+            return PDF
+    #}}}
+
     @staticmethod
     #{{{calcPDF
     def calcPDF(timeTraces):
@@ -88,18 +178,15 @@ class CollectAndCalcPDF(CollectAndCalcTimeTrace):
             # Initialize the PDF
             PDF[key] = {}
 
-            # Calculate pdfY
-            PDF[key][yKey], bins =\
-                np.histogram(timeTraces[key][varName],\
-                             bins="sqrt",\
-                             density=True)
-
-            # Initialize x
-            PDF[key][xKey] = np.zeros(PDF[key][yKey].size)
+            # NOTE: RunningHistogram gives the same edges as
+            #       bins="sqrt"
+            histogram = RunningHistogram()
+            histogram.addRange(timeTraces[key][varName])
+            histogram.setEdges()
+            histogram.add(timeTraces[key][varName])
 
-            # Only the bin edges are saved. Interpolate to bin center
-            for k in range(PDF[key][yKey].size):
-                PDF[key][xKey][k] = 0.5*(bins[k]+bins[k+1])
+            # Only the bin edges are saved. The x values are the bin centers
+            PDF[key][xKey], PDF[key][yKey] = histogram.getPDF()
 
         # NOTE: If timeTraces was converted to physical units, then PDF is
         #       in physical units as well
@@ -8,8 +8,6 @@ from ..driverHelpers import onlyScan
 from .collectAndCalcPDF import CollectAndCalcPDF
 from ..superClasses import DriverPointsSuperClass
 from .plotPDF import PlotPDF
-from scipy import stats
-from multiprocessing import Process
 import os, pickle
 
 #{{{driverPDF
@@ -132,22 +130,14 @@ def getPDF(collectPaths       ,\
     # Set name
     ccPDF.setVarName(varName)
 
-    # Execute the collection
-    tt = ccPDF.executeCollectAndCalc()
-    tt = ccPDF.convertTo1D(tt)
-
-    # Calculate the PDF
-    PDF = ccPDF.calcPDF(tt)
-
+    # Collect and calculate the PDF chunk by chunk
+    # NOTE: The skewness and kurtosis are accumulated in the same pass
+    #       as the range of the bins
     if returnStats:
-        # Calculate the skewness and kurtosis
-        PDFStats = {}
-        for key in tt.keys():
-            PDFStats[key] = {"skew":stats.skew(tt[key][varName]),\
-                             "kurtExcess":stats.kurtosis(tt[key][varName])}
-
+        PDF, PDFStats = ccPDF.executeCollectAndCalcPDF(returnStats = True)
         return PDF, ccPDF.uc, PDFStats
     else:
+        PDF = ccPDF.executeCollectAndCalcPDF()
         return PDF, ccPDF.uc
 #}}}
 
@@ -226,10 +216,6 @@ class DriverPDF(DriverPointsSuperClass):
                  self._indicesKwargs   ,\
                  self._plotSuperKwargs ,\
                 )
-        if self._useMultiProcess:
-            processes = Process(target = driverPDF, args = args)
-            processes.start()
-        else:
-            driverPDF(*args)
+        self._runTask(driverPDF, args)
     #}}}
 #}}}
@@ -6,7 +6,16 @@ function of the time traces.
 """
 
 from ..timeTrace import CollectAndCalcTimeTrace
+from ..collectAndCalcHelpers import (RunningPSD,\
+                                     calcN,\
+                                     calcUIPar,\
+                                     calcUEPar,\
+                                     collectiveCollectChunks,\
+                                     collectTime,\
+                                     polAvg,\
+                                     slicesToIndices)
 from scipy.signal import periodogram
+import numpy as np
 
 #{{{CollectAndCalcPSD
 class CollectAndCalcPSD(CollectAndCalcTimeTrace):
@@ -28,6 +37,12 @@ class CollectAndCalcPSD(CollectAndCalcTimeTrace):
           transformed of the cross correlation function
         * The periodogram estimate is the same as autocorrelation with a
           triangular window
+        * The Welch estimate averages the periodograms of (overlapping)
+          windowed segments, which reduces the variance at the cost of
+          the frequency resolution
+        * The multitaper estimate averages the periodograms obtained
+          with orthogonal tapers, which reduces the variance without
+          splitting the signal into segments
     """
 
     #{{{constructor
@@ -52,12 +67,201 @@ class CollectAndCalcPSD(CollectAndCalcTimeTrace):
         super().__init__(*args, **kwargs)
     #}}}
 
+    #{{{executeCollectAndCalcPSD
+    def executeCollectAndCalcPSD(self                     ,\
+                                 chunkSize = 100          ,\
+                                 method    = "periodogram",\
+                                 nperseg   = None         ,\
+                                 noverlap  = None         ,\
+                                 NW        = 4            ,\
+                                ):
+        #{{{docstring
+        """
+        Collects the time traces chunk by chunk in time, and calculates
+        the PSD incrementally.
+
+        The points in the same parallel plane (and with the same time
+        slice) are collected together, and the spectra of all the
+        points are calculated at once.
+        Only one chunk of the time traces (and the samples needed to
+        complete the current segment) is held in memory.
+
+        Parameters
+        ----------
+        chunkSize : int
+            Number of time points to collect at a time.
+        method : ["periodogram"|"welch"|"multitaper"]
+            The estimate to use. See calcPSD for details.
+            NOTE: "periodogram" is one segment spanning the whole
+                  trace, so the samples of the whole trace are held
+                  until the end. Use "welch" or "multitaper" with a
+                  given nperseg to bound the memory.
+        nperseg : [None|int]
+            Number of samples in each segment. See calcPSD for details.
+        noverlap : [None|int]
+            Number of samples the segments overlap.
+            See calcPSD for details.
+        NW : float
+            The time half-bandwidth product used by "multitaper".
+
+        Returns
+        -------
+        PSD : dict
+            Dictionary where the keys are on the form "rho,theta,z".
+            The value is a dict containing of
+            {varPSDX:pdfX, varPSDY:pdfY}
+        """
+        #}}}
+
+        # Guard
+        if len(self._notCalled) > 0:
+            message = "The following functions were not called:\n{}".\
+                        format("\n".join(self._notCalled))
+            raise RuntimeError(message)
+
+        # Make sure zInd is not None
+        self._zInd =\
+            tuple(zInd if zInd is not None else 0 for zInd in self._zInd)
+
+        # Make the keys
+        xKey = "{}PSDX".format(self._varName)
+        yKey = "{}PSDY".format(self._varName)
+
+        if self._varName == "n":
+            varNames = ("lnN",)
+        elif self._varName == "uIPar":
+            varNames = ("lnN", "momDensPar")
+        elif self._varName == "uEPar":
+            varNames = ("lnN", "momDensPar", "jPar")
+        else:
+            varNames = (self._varName,)
+
+        # Group the points by the parallel plane and the time indices
+        groups = {}
+        for pointNr, (x, y, z) in\
+                enumerate(zip(self._xInd, self._yInd, self._zInd)):
+            # NOTE: The step of the slice is dealt with in the collect
+            if self._tSlice is not None:
+                t = slicesToIndices(self._collectPaths,\
+                                    self._tSlice[pointNr], "t")
+                t = tuple(t) if t is not None else None
+            else:
+                t = None
+            groups.setdefault((y, t), []).append((pointNr, x, z))
+
+        spectra = {}
+        for (y, t), points in groups.items():
+            pointNrs, xs, zs = (np.array(ind) for ind in zip(*points))
+            xMin, xMax = xs.min(), xs.max()
+
+            time = collectTime(self._collectPaths, tInd=t)
+            if self.uc.convertToPhysical:
+                time = self.uc.physicalConversion(time, "t")
+
+            # Sampling frequency
+            fs = 1/(time[1] - time[0])
+            runningPSD =\
+                self._makeRunningPSD(fs, len(time), method, nperseg,\
+                                     noverlap, NW)
+
+            if self._mode == "fluct":
+                # The poloidal average needs the whole poloidal profile
+                zInd   = None
+                zStart = 0
+            else:
+                zInd   = (zs.min(), zs.max())
+                zStart = zs.min()
+
+            for _, chunk in collectiveCollectChunks(self._collectPaths  ,\
+                                                    varNames            ,\
+                                                    chunkSize = chunkSize,\
+                                                    tInd = t            ,\
+                                                    xInd = (xMin, xMax) ,\
+                                                    yInd = (y, y)       ,\
+                                                    zInd = zInd         ,\
+                                                   ):
+                var = self._calcChunkVar(chunk)
+
+                if self._mode == "fluct":
+                    var = var - polAvg(var, compact=True)
+                if self.uc.convertToPhysical:
+                    var = self.uc.physicalConversion(var, self._varName)
+
+                # Add the time traces on the form (point, t)
+                runningPSD.add(var[:, xs - xMin, 0, zs - zStart].T)
+
+            freq, PSD = runningPSD.getPSD()
+            for ind, pointNr in enumerate(pointNrs):
+                spectra[pointNr] = {xKey:freq, yKey:PSD[ind]}
+
+        # Make the output in the order of the points
+        PSD = {}
+        for pointNr, (x, y, z) in\
+                enumerate(zip(self._xInd, self._yInd, self._zInd)):
+            rho   = self._dh.rho     [x]
+            theta = self._dh.thetaDeg[z]
+            par   = self._dh.z       [y]
+            key = "{},{},{}".format(rho,theta,par)
+            PSD[key] = spectra[pointNr]
+
+        # NOTE: If converted to physical units, then PSD is in physical
+        #       units as well
+        return PSD
+    #}}}
+
+    #{{{_calcChunkVar
+    def _calcChunkVar(self, chunk):
+        #{{{docstring
+        """
+        Calculates the variable from a collected chunk
+
+        NOTE: As in _calcNonSolvedVars the chunk is normalized, and the
+              conversion to physical happens afterwards.
+
+        Parameters
+        ----------
+        chunk : dict
+            Dictionary of the collected variables.
+
+        Returns
+        -------
+        var : 4d-array
+            The variable.
+        """
+        #}}}
+
+        normalized = True
+
+        if not(self._varName == "n" or\
+               self._varName == "uIPar" or\
+               self._varName == "uEPar"):
+            return chunk[self._varName]
+
+        n = calcN(chunk["lnN"], normalized, uc = self.uc)
+        if self._varName == "n":
+            return n
+
+        uIPar = calcUIPar(chunk["momDensPar"], n)
+        if self._varName == "uIPar":
+            return uIPar
+
+        return calcUEPar(uIPar, chunk["jPar"], n, normalized)
+    #}}}
+
     @staticmethod
     #{{{calcPSD
-    def calcPSD(timeTraces):
+    def calcPSD(timeTraces                ,\
+                method   = "periodogram"  ,\
+                nperseg  = None           ,\
+                noverlap = None           ,\
+                NW       = 4              ,\
+               ):
         #{{{docstring
         """
-        Function which calculates the probability density function.
+        Function which calculates the power spectral density.
+
+        The time traces with the same length and sampling frequency are
+        stacked, so that the spectra are calculated in one call.
 
         Parameters
         ----------
@@ -68,6 +272,28 @@ class CollectAndCalcPSD(CollectAndCalcTimeTrace):
             And additional key "zInd" will be given in addition to varName
             and "time" if mode is set to "fluct".
             The timeTrace is a 1d array.
+        method : ["periodogram"|"welch"|"multitaper"]
+            The estimate to use
+                * "periodogram" - The periodogram of the whole trace
+                                  (boxcar window).
+                * "welch"       - The average of the periodograms of
+                                  overlapping segments with a Hann
+                                  window.
+                * "multitaper"  - The average of the periodograms
+                                  obtained with the discrete prolate
+                                  spheroidal sequences as tapers.
+        nperseg : [None|int]
+            Number of samples in each segment (not used by
+            "periodogram").
+            If None, 256 is used for "welch", and the length of the
+            trace for "multitaper".
+            The number is capped by the length of the trace.
+        noverlap : [None|int]
+            Number of samples the segments overlap.
+            If None, nperseg//2 is used for "welch" and 0 for
+            "multitaper".
+        NW : float
+            The time half-bandwidth product used by "multitaper".
 
         Returns
         -------
@@ -90,22 +316,77 @@ class CollectAndCalcPSD(CollectAndCalcTimeTrace):
         xKey = "{}PSDX".format(varName)
         yKey = "{}PSDY".format(varName)
 
-        # Obtain the PSD
+        # Group the traces by the length and the sampling frequency
+        groups = {}
         for key in timeTraces.keys():
-            # Initialize the PSD
-            PSD[key] = {}
-
             # Sampling frequency
             fs = 1/(timeTraces[key]["time"][1] - timeTraces[key]["time"][0])
+            nt = len(timeTraces[key][varName])
+            groups.setdefault((nt, fs), []).append(key)
+
+        # Obtain the PSD
+        for (nt, fs), groupKeys in groups.items():
+            # The traces on the form (probe, t)
+            traces = np.array([timeTraces[key][varName] for key in groupKeys])
+
+            if method == "periodogram":
+                # window = None => window = "boxcar"
+                # scaling = density gives the correct units
+                freq, spectra =\
+                    periodogram(traces, fs=fs, window=None, scaling="density")
+            else:
+                runningPSD =\
+                    CollectAndCalcPSD._makeRunningPSD(fs, nt, method,\
+                                                      nperseg, noverlap, NW)
+                runningPSD.add(traces)
+                freq, spectra = runningPSD.getPSD()
+
+            for key, spectrum in zip(groupKeys, spectra):
+                PSD[key] = {xKey:freq, yKey:spectrum}
 
-            # window = None => window = "boxcar"
-            # scaling = density gives the correct units
-            PSD[key][xKey], PSD[key][yKey] =\
-                periodogram(timeTraces[key][varName],\
-                            fs=fs, window=None, scaling="density")
+        # Keep the order of the input
+        PSD = {key:PSD[key] for key in timeTraces.keys()}
 
         # NOTE: If timeTraces was converted to physical units, then PSD is
         #       in physical units as well
         return PSD
     #}}}
+
+    @staticmethod
+    #{{{_makeRunningPSD
+    def _makeRunningPSD(fs, nt, method, nperseg, noverlap, NW):
+        #{{{docstring
+        """
+        Makes the RunningPSD used to estimate the PSD.
+
+        Parameters
+        ----------
+        fs : float
+            The sampling frequency.
+        nt : int
+            The length of the time traces.
+        method, nperseg, noverlap, NW
+            See calcPSD for details.
+            NOTE: "periodogram" is made as one boxcar segment spanning
+                  the whole trace, which equals
+                  scipy.signal.periodogram.
+
+        Returns
+        -------
+        runningPSD : RunningPSD
+            The object to add the time traces to.
+        """
+        #}}}
+
+        if method == "periodogram":
+            return RunningPSD(fs, nt, 0, method = "welch", window = "boxcar")
+
+        if nperseg is None:
+            nperseg = 256 if method == "welch" else nt
+        nperseg = min(nperseg, nt)
+        if noverlap is not None:
+            noverlap = min(noverlap, nperseg - 1)
+
+        return RunningPSD(fs, nperseg, noverlap, method = method, NW = NW)
+    #}}}
 #}}}
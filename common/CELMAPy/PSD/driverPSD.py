@@ -9,7 +9,6 @@ from ..collectAndCalcHelpers import getGridSizes
 from .collectAndCalcPSD import CollectAndCalcPSD
 from .plotPSD import PlotPSD
 import numpy as np
-from multiprocessing import Process
 
 #{{{driverPSD
 def driverPSD(collectPaths     ,\
@@ -120,14 +119,18 @@ def driverPSD2D(collectPaths     ,\
                 indicesKwargs    ,\
                 plotLimits       ,\
                 plotSuperKwargs  ,\
+                PSDKwargs = None ,\
                ):
     #{{{docstring
     """
     Driver for plotting power spectral density.
 
-    NOTE: In order to be efficient, one should have collected with the
-          field1D class rather than with the points collecter.
-          In any case, this gets the job done
+    NOTE: The PSD is calculated incrementally for all the radial points
+          at once (see CollectAndCalcPSD.executeCollectAndCalcPSD).
+          The default periodogram is one segment spanning the whole
+          trace, so the samples are held until the end. Choose "welch"
+          or "multitaper" with a given nperseg through PSDKwargs in
+          order to bound the memory.
 
     Parameters
     ----------
@@ -153,9 +156,19 @@ def driverPSD2D(collectPaths     ,\
         The dictionary values may be None rather than a tuple.
     plotSuperKwargs : dict
         Keyword arguments for the plot super class.
+    PSDKwargs : [None|dict]
+        Keyword arguments for CollectAndCalcPSD.executeCollectAndCalcPSD,
+        for example {"method":"welch", "nperseg":1024}.
+        If None, the boxcar periodogram of the whole trace is used (as
+        before the estimate could be chosen).
+        NOTE: "welch" and "multitaper" average over segments, which
+              gives a lower frequency resolution and less variance.
     """
     #}}}
 
+    if PSDKwargs is None:
+        PSDKwargs = {}
+
     # Create collect object
     ccPSD = CollectAndCalcPSD(collectPaths                         ,\
                               mode              = mode             ,\
@@ -175,12 +188,8 @@ def driverPSD2D(collectPaths     ,\
     # Set name
     ccPSD.setVarName(varName)
 
-    # Execute the collection
-    tt = ccPSD.executeCollectAndCalc()
-    tt = ccPSD.convertTo1D(tt)
-
-    # Calculate the PSD
-    PSD = ccPSD.calcPSD(tt)
+    # Collect and calculate the PSD
+    PSD = ccPSD.executeCollectAndCalcPSD(**PSDKwargs)
 
     # Recast to 2d np.array with dimensions (t, nx)
     keys = tuple(sorted(list(PSD.keys())))
@@ -238,6 +247,7 @@ class DriverPSD(DriverPointsSuperClass):
                  varName          = "n"    ,\
                  mode             = "fluct",\
                  plotLimits       = None   ,\
+                 PSDKwargs        = None   ,\
                  **kwargs):
         #{{{docstring
         """
@@ -268,6 +278,9 @@ class DriverPSD(DriverPointsSuperClass):
             Dictionary on the form
             {"xlim":(min,max), "ylim":(min,max), "zlim":(min,max)}
             The dictionary values may be None rather than a tuple.
+        PSDKwargs : [None|dict]
+            Keyword arguments for the PSD calculation in driverPSD2D.
+            See CollectAndCalcPSD.executeCollectAndCalcPSD for details.
         **kwargs : keyword arguments
             See parent class for details.
         """
@@ -282,6 +295,7 @@ class DriverPSD(DriverPointsSuperClass):
         self._indicesArgs   = indicesArgs
         self._indicesKwargs = indicesKwargs
         self._plotLimits    = plotLimits
+        self._PSDKwargs     = PSDKwargs
 
         # Update the plotSuperKwargs dict
         plotSuperKwargs.update({"dmp_folders":dmp_folders})
@@ -305,11 +319,7 @@ class DriverPSD(DriverPointsSuperClass):
                  self._indicesKwargs   ,\
                  self._plotSuperKwargs ,\
                 )
-        if self._useMultiProcess:
-            processes = Process(target = driverPSD, args = args)
-            processes.start()
-        else:
-            driverPSD(*args)
+        self._runTask(driverPSD, args)
     #}}}
 
     #{{{driverPSD2D
@@ -328,11 +338,8 @@ class DriverPSD(DriverPointsSuperClass):
                  self._indicesKwargs   ,\
                  self._plotLimits      ,\
                  self._plotSuperKwargs ,\
+                 self._PSDKwargs       ,\
                 )
-        if self._useMultiProcess:
-            processes = Process(target = driverPSD2D, args = args)
-            processes.start()
-        else:
-            driverPSD2D(*args)
+        self._runTask(driverPSD2D, args)
     #}}}
 #}}}
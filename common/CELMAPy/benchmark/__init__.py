@@ -0,0 +1,10 @@
+#!/usr/bin/env python
+
+"""
+Init-file for benchmark
+"""
+
+from .syntheticDumps import makeSyntheticDumps
+from .benchmarkCollectAndCalc import (benchmarks,\
+                                      runBenchmarks,\
+                                      formatResult)
@@ -0,0 +1,324 @@
+#!/usr/bin/env python
+
+"""
+Contains functions for benchmarking the collectAndCalc layer
+"""
+
+from ..collectAndCalcHelpers import (collectiveCollect,\
+                                     polAvg,\
+                                     DDX,\
+                                     DDZ,\
+                                     DimensionsHelper,\
+                                     resetPeakRSS,\
+                                     getRSS)
+from ..unitsConverter import UnitsConverter
+from ..fields2D import CollectAndCalcFields2D
+from ..blobs import CollectAndCalcBlobs
+from ..PSD import CollectAndCalcPSD
+from multiprocessing import Process, Queue
+import time
+import traceback
+
+#{{{_setupPaths
+def _setupPaths(paths):
+    """
+    Setup which passes the paths on to the benchmark
+    """
+
+    return (paths,)
+#}}}
+
+#{{{_setupField
+def _setupField(paths):
+    """
+    Setup which collects lnN and the radial grid spacing
+    """
+
+    uc = UnitsConverter(paths[0], convertToPhysical=False)
+    dh = DimensionsHelper(paths[0], uc)
+    var = collectiveCollect(paths, ("lnN",))["lnN"]
+
+    return var, dh.dx
+#}}}
+
+#{{{_getIndices
+def _getIndices(paths):
+    """
+    Returns the x, y and z index of the probe used in the benchmarks
+    """
+
+    uc = UnitsConverter(paths[0], convertToPhysical=False)
+    dh = DimensionsHelper(paths[0], uc)
+
+    # NOTE: The synthetic blobs are born at 40 % of the radial extent
+    xInd = int(0.4*len(dh.rho))
+    yInd = int(0.5*len(dh.z))
+    zInd = 0
+
+    return xInd, yInd, zInd
+#}}}
+
+#{{{_runCollectiveCollect
+def _runCollectiveCollect(paths):
+    """
+    Collects lnN and phi from all the paths
+    """
+
+    collectiveCollect(paths, ("lnN", "phi"))
+#}}}
+
+#{{{_runPolAvg
+def _runPolAvg(var, dx):
+    """
+    Takes the poloidal average
+    """
+
+    polAvg(var)
+#}}}
+
+#{{{_runDDX
+def _runDDX(var, dx):
+    """
+    Takes the radial derivative
+    """
+
+    DDX(var, dx)
+#}}}
+
+#{{{_runDDZ
+def _runDDZ(var, dx):
+    """
+    Takes the poloidal derivative
+    """
+
+    DDZ(var)
+#}}}
+
+#{{{_runFields2D
+def _runFields2D(paths):
+    """
+    Collects and calculates the perpendicular density fluctuations
+    """
+
+    _, yInd, _ = _getIndices(paths)
+
+    ccf2D = CollectAndCalcFields2D(paths, fluct = True, mode = "perp")
+    ccf2D.setSlice(None, yInd, None, None)
+    ccf2D.setVarName("n")
+    ccf2D.executeCollectAndCalc()
+#}}}
+
+#{{{_runBlobs
+def _runBlobs(paths):
+    """
+    Prepares the blobs and calculates the conditional average
+    """
+
+    xInd, yInd, zInd = _getIndices(paths)
+    slices = (xInd, yInd, zInd, slice(0, None))
+
+    ccb = CollectAndCalcBlobs(paths, slices, True, useMultiProcess = False)
+    ccb.prepareCollectAndCalc()
+    ccb.executeCollectAndCalc1D()
+#}}}
+
+#{{{_runPSD
+def _runPSD(paths):
+    """
+    Collects the density fluctuations in one point and calculates the PSD
+    """
+
+    xInd, yInd, zInd = _getIndices(paths)
+
+    ccPSD = CollectAndCalcPSD(paths, mode = "fluct")
+    ccPSD.setIndices(xInd, yInd, zInd, nPoints = 1)
+    ccPSD.setVarName("n")
+    timeTraces = ccPSD.executeCollectAndCalc()
+    timeTraces = ccPSD.convertTo1D(timeTraces)
+    ccPSD.calcPSD(timeTraces)
+#}}}
+
+# The benchmarks on the form name:(setup, run)
+# NOTE: The setup is not included in the wall time and the bytes read
+benchmarks = {\
+    "collectiveCollect" : (_setupPaths, _runCollectiveCollect),\
+    "polAvg"            : (_setupField, _runPolAvg)           ,\
+    "DDX"               : (_setupField, _runDDX)              ,\
+    "DDZ"               : (_setupField, _runDDZ)              ,\
+    "fields2D"          : (_setupPaths, _runFields2D)         ,\
+    "blobs"             : (_setupPaths, _runBlobs)            ,\
+    "PSD"               : (_setupPaths, _runPSD)              ,\
+             }
+
+#{{{runBenchmarks
+def runBenchmarks(paths, names = None, repeat = 1, verbose = True):
+    #{{{docstring
+    """
+    Runs the benchmarks on the given dump folders.
+
+    Each run is made in a fresh process, so that the peak memory of one
+    benchmark does not influence the next.
+
+    Parameters
+    ----------
+    paths : tuple
+        The dump folders to collect from, for example obtained from
+        makeSyntheticDumps.
+    names : [None|sequence of str]
+        The benchmarks to run.
+        If None, all the benchmarks in the benchmarks dict are run.
+    repeat : int
+        Number of times to run each benchmark.
+    verbose : bool
+        Whether or not to print the results as they are obtained.
+
+    Returns
+    -------
+    results : dict
+        Dictionary where the keys are the benchmark names.
+        The value is a list (one element per repetition) of dicts with
+        the keys
+            * "wallTime"        - The wall time in seconds
+            * "peakRSSIncrease" - The increase of the peak resident
+                                  set size during the run in bytes
+                                  (the harness and the setup are not
+                                  included)
+            * "bytesRead"       - The bytes read by the process
+                                  (None if not available on the
+                                  platform)
+        NOTE: The collect workers (see setCollectWorkers) are separate
+              processes, so their memory and reads are not included.
+    """
+    #}}}
+
+    if names is None:
+        names = tuple(benchmarks.keys())
+
+    # Guard
+    for name in names:
+        if not(name in benchmarks.keys()):
+            message = "Benchmark '{}' not implemented".format(name)
+            raise NotImplementedError(message)
+
+    if verbose:
+        print("{:<18} {:>12} {:>13} {:>13}".\
+                format("benchmark", "wall time", "RSS increase", "bytes read"))
+
+    results = {}
+    for name in names:
+        results[name] = []
+        for _ in range(repeat):
+            queue = Queue()
+            process = Process(target=_measure, args=(name, paths, queue))
+            process.start()
+            result = queue.get()
+            process.join()
+
+            if isinstance(result, str):
+                message = "Benchmark '{}' failed with\n{}".format(name, result)
+                raise RuntimeError(message)
+
+            results[name].append(result)
+            if verbose:
+                print(formatResult(name, result))
+
+    return results
+#}}}
+
+#{{{formatResult
+def formatResult(name, result):
+    #{{{docstring
+    """
+    Formats the result of one benchmark run.
+
+    Parameters
+    ----------
+    name : str
+        Name of the benchmark.
+    result : dict
+        One of the elements in the output of runBenchmarks.
+
+    Returns
+    -------
+    line : str
+        The formatted result.
+    """
+    #}}}
+
+    if result["bytesRead"] is not None:
+        bytesRead = "{:10.1f} MB".format(result["bytesRead"]/1e6)
+    else:
+        bytesRead = "{:>10} MB".format("-")
+
+    return "{:<18} {:10.3f} s {:10.1f} MB {}".\
+            format(name                           ,\
+                   result["wallTime"]             ,\
+                   result["peakRSSIncrease"]/1e6  ,\
+                   bytesRead)
+#}}}
+
+#{{{_measure
+def _measure(name, paths, queue):
+    #{{{docstring
+    """
+    Runs one benchmark, and puts the result in the queue.
+
+    Parameters
+    ----------
+    name : str
+        Name of the benchmark.
+    paths : tuple
+        The dump folders to collect from.
+    queue : Queue
+        The queue to put the result (or the traceback) in.
+    """
+    #}}}
+
+    try:
+        setup, run = benchmarks[name]
+        args = setup(paths)
+
+        # NOTE: The process is forked from the harness and holds the
+        #       output of the setup, so only the increase of the peak
+        #       during the run is reported
+        peakReset = resetPeakRSS()
+        rssStart = getRSS(peakReset)
+
+        bytesReadStart = _getBytesRead()
+        start = time.perf_counter()
+        run(*args)
+        wallTime = time.perf_counter() - start
+        bytesReadEnd = _getBytesRead()
+
+        if bytesReadStart is not None and bytesReadEnd is not None:
+            bytesRead = bytesReadEnd - bytesReadStart
+        else:
+            bytesRead = None
+
+        peakRSSIncrease = max(getRSS(peakReset, peak=True) - rssStart, 0)
+
+        queue.put({"wallTime"        : wallTime       ,\
+                   "peakRSSIncrease" : peakRSSIncrease,\
+                   "bytesRead"       : bytesRead      })
+    except Exception:
+        # NOTE: The traceback is not pickable, so it is sent as a string
+        queue.put(traceback.format_exc())
+#}}}
+
+#{{{_getBytesRead
+def _getBytesRead():
+    """
+    Returns the bytes read by this process (None if not available)
+    """
+
+    try:
+        with open("/proc/self/io") as f:
+            for line in f:
+                key, value = line.split(":")
+                if key == "rchar":
+                    return int(value)
+    except OSError:
+        pass
+
+    return None
+#}}}
@@ -0,0 +1,231 @@
+#!/usr/bin/env python
+
+"""
+Contains functions for making synthetic dump folders
+"""
+
+from boututils.datafile import DataFile
+import numpy as np
+import os
+
+#{{{makeSyntheticDumps
+def makeSyntheticDumps(root            ,\
+                       nx        = 32  ,\
+                       ny        = 16  ,\
+                       nz        = 64  ,\
+                       nt        = 200 ,\
+                       NXPE      = 2   ,\
+                       NYPE      = 2   ,\
+                       nSegments = 1   ,\
+                       MXG       = 2   ,\
+                       MYG       = 1   ,\
+                       dt        = 1.0 ,\
+                       seed      = 0   ,\
+                       ):
+    #{{{docstring
+    """
+    Makes a chain of synthetic dump folders.
+
+    The folders mimic a simulation which has been restarted
+    nSegments-1 times: Each folder contains one BOUT.dmp.*.nc file per
+    processor, and the first time point of a folder equals the last
+    time point of the previous folder.
+
+    The fields consist of a radial density profile, rotating poloidal
+    modes and radially propagating blobs, so that the blob detection
+    and the spectra have something to work on.
+
+    Parameters
+    ----------
+    root : str
+        The folder to put the dump folders in.
+    nx : int
+        Number of inner points in x (rho).
+        Must be divisible by NXPE.
+    ny : int
+        Number of inner points in y (z).
+        Must be divisible by NYPE.
+    nz : int
+        Number of points in z (theta).
+    nt : int
+        Number of time points in each folder.
+    NXPE : int
+        Number of processors in x.
+    NYPE : int
+        Number of processors in y.
+    nSegments : int
+        Number of dump folders (restarts).
+    MXG : int
+        Number of ghost points in x.
+    MYG : int
+        Number of ghost points in y.
+    dt : float
+        The output time step.
+    seed : int
+        Seed for the random blob parameters.
+
+    Returns
+    -------
+    paths : tuple
+        The dump folders in the order they should be collected.
+    """
+    #}}}
+
+    # Guard
+    if nx % NXPE != 0 or ny % NYPE != 0:
+        message = "nx and ny must be divisible by NXPE and NYPE"
+        raise ValueError(message)
+
+    MXSUB = nx//NXPE
+    MYSUB = ny//NYPE
+
+    dx = 0.5
+    dy = 1.0
+    dz = 2.0*np.pi/nz
+
+    rng = np.random.RandomState(seed)
+
+    # The blob and mode parameters are shared by all the folders
+    nBlobs  = max(1, (nt*nSegments)//5)
+    Lx      = nx*dx
+    tEnd    = (nt - 1)*nSegments*dt
+    blobs = {"t0"    : rng.uniform(0, tEnd, nBlobs),\
+             "theta0": rng.uniform(0, 2*np.pi, nBlobs),\
+             "amp"   : rng.uniform(0.1, 0.3, nBlobs)*\
+                       rng.choice((-1, 1), nBlobs, p=(0.2, 0.8)),\
+             "v"     : rng.uniform(0.5, 1.5, nBlobs)*Lx/(20*dt),\
+            }
+    modes = {"m"    : np.arange(1, 5),\
+             "amp"  : rng.uniform(0.02, 0.08, 4),\
+             "omega": rng.uniform(0.05, 0.2, 4)/dt,\
+             "phase": rng.uniform(0, 2*np.pi, 4),\
+            }
+
+    paths = []
+    t0 = 0.0
+    for segment in range(nSegments):
+        path = os.path.join(root, "segment{}".format(segment))
+        os.makedirs(path, exist_ok=True)
+        t = t0 + np.arange(nt)*dt
+
+        for proc in range(NXPE*NYPE):
+            PEX = proc % NXPE
+            PEY = proc // NXPE
+
+            # The global indices including the ghost points
+            xInd = np.arange(PEX*MXSUB, (PEX+1)*MXSUB + 2*MXG)
+            yInd = np.arange(PEY*MYSUB, (PEY+1)*MYSUB + 2*MYG)
+
+            rho   = (xInd - MXG + 0.5)*dx
+            par   = (yInd - MYG + 0.5)*dy
+            theta = np.arange(nz)*dz
+
+            fields = _makeFields(t, rho, par, theta, Lx, blobs, modes)
+
+            fileName = os.path.join(path, "BOUT.dmp.{}.nc".format(proc))
+            with DataFile(fileName, write=True, create=True) as f:
+                # NOTE: t_array is written first, so that the time
+                #       dimension becomes unlimited
+                f.write("t_array", t)
+                for key, value in (("MXG"  , MXG)  ,\
+                                   ("MYG"  , MYG)  ,\
+                                   ("MXSUB", MXSUB),\
+                                   ("MYSUB", MYSUB),\
+                                   ("NXPE" , NXPE) ,\
+                                   ("NYPE" , NYPE) ,\
+                                   ("MZ"   , nz)   ,\
+                                   ):
+                    f.write(key, np.int32(value))
+                for key, value in (("BOUT_VERSION", 4.0)        ,\
+                                   ("dz"          , dz)         ,\
+                                   ("mu"          , 1836.15*40) ,\
+                                   ("omCI"        , 9.58e5)     ,\
+                                   ("rhoS"        , 0.0147)     ,\
+                                   ("n0"          , 1.0e19)     ,\
+                                   ("Te0"         , 3.0)        ,\
+                                   ):
+                    f.write(key, np.float64(value))
+                spacing = np.ones((len(xInd), len(yInd)))
+                f.write("dx", dx*spacing)
+                f.write("dy", dy*spacing)
+                for key, value in fields.items():
+                    f.write(key, value)
+
+        paths.append(path)
+        # The next folder starts where this one ended
+        t0 = t[-1]
+
+    return tuple(paths)
+#}}}
+
+#{{{_makeFields
+def _makeFields(t, rho, par, theta, Lx, blobs, modes):
+    #{{{docstring
+    """
+    Makes the fields of one processor.
+
+    Parameters
+    ----------
+    t : array
+        The time.
+    rho : array
+        The rho coordinate of the processor (including ghost points).
+    par : array
+        The parallel coordinate of the processor (including ghost points).
+    theta : array
+        The theta coordinate.
+    Lx : float
+        The radial extent of the domain.
+    blobs : dict
+        The blob parameters.
+    modes : dict
+        The poloidal mode parameters.
+
+    Returns
+    -------
+    fields : dict
+        The 4d fields.
+    """
+    #}}}
+
+    T     = t    [:   , None, None, None]
+    R     = rho  [None, :   , None, None]
+    Z     = par  [None, None, :   , None]
+    Theta = theta[None, None, None, :   ]
+
+    profile = 0.1 + np.exp(-(R/(0.4*Lx))**2.0)
+    parProfile = 1.0 + 0.01*Z
+
+    # Rotating modes localized around the largest gradient
+    envelope = np.exp(-((R - 0.4*Lx)/(0.2*Lx))**2.0)
+    fluct = np.zeros(np.broadcast(T, R, Z, Theta).shape)
+    for m, amp, omega, phase in\
+            zip(modes["m"], modes["amp"], modes["omega"], modes["phase"]):
+        fluct += amp*envelope*np.cos(m*Theta - omega*T + phase)
+
+    phi = 3.0*profile + 0.1*fluct
+
+    # Blobs propagating radially outwards from the gradient region
+    # NOTE: The potential of a blob is a dipole, which gives the radial
+    #       ExB velocity which transports the blob
+    width = 0.05*Lx
+    for t0, theta0, amp, v in\
+            zip(blobs["t0"], blobs["theta0"], blobs["amp"], blobs["v"]):
+        rPos = 0.4*Lx + v*(T - t0)
+        dTheta = np.angle(np.exp(1j*(Theta - theta0)))
+        blob = (T >= t0)*amp*\
+            np.exp(-((R - rPos)/width)**2.0 - (dTheta/0.5)**2.0)
+        fluct += blob
+        phi   += (dTheta/0.5)*blob
+
+    n = profile*parProfile*(1.0 + fluct)
+
+    fields = {"lnN"       : np.log(n),\
+              "phi"       : phi,\
+              "vort"      : np.gradient(fluct, axis=3),\
+              "momDensPar": 0.1*n*Z/Z.max(),\
+              "jPar"      : 0.01*fluct*parProfile,\
+             }
+
+    return fields
+#}}}
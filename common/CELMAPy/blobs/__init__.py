@@ -5,6 +5,7 @@ Init-file for blobs
 """
 
 from .collectAndCalcBlobs import CollectAndCalcBlobs
+from .collectAndCalcBlobsMultiProbe import CollectAndCalcBlobsMultiProbe
 from .driverBlobs import (DriverBlobs           ,\
                           driverPlot2DData      ,\
                           driverBlobTimeTraces  ,\
@@ -12,5 +13,6 @@ from .driverBlobs import (DriverBlobs           ,\
                           driverWaitingTimePulse,\
                           get2DData             ,\
                           prepareBlobs          ,\
+                          prepareBlobsMultiProbe,\
                           )
 from .plotBlobs import PlotBlobOrHoleTimeTraceSingle, PlotTemporalStats
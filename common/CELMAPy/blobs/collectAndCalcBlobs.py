@@ -7,10 +7,15 @@ Contains the blobs calculation
 from ..collectAndCalcHelpers import DimensionsHelper, polAvg
 from ..fields2D import CollectAndCalcFields2D
 from ..radialFlux import getRadialFlux
+from ..superClasses import getTaskScheduler
+from bisect import bisect_right
 from itertools import starmap
-from multiprocessing import Pool
 import numpy as np
 
+# Max number of spans collected at the same time in order not to
+# saturate the memory
+maxSpanWorkers = 10
+
 #{{{CollectAndCalcBlobs
 class CollectAndCalcBlobs(object):
     """
@@ -25,6 +30,9 @@ class CollectAndCalcBlobs(object):
                  condition     = 3   ,\
                  pctPadding    = 400 ,\
                  useMultiProcess = True,\
+                 offCondition  = None,\
+                 minDuration   = 1   ,\
+                 memoryBudget  = None,\
                  ):
         #{{{docstring
         """
@@ -49,15 +57,37 @@ class CollectAndCalcBlobs(object):
             Measured in percent.
         useMultiProcess : bool
             Whether or not to use sub process.
+        offCondition : [None|float]
+            An event lasts until the flux drops below
+            flux.std()*offCondition (hysteresis).
+            Must be less or equal to condition.
+            If None, condition is used.
+        minDuration : int
+            Events shorter than minDuration time indices are discarded.
+        memoryBudget : [None|int]
+            The memory (in bytes) the collection of each span is
+            expected to use.
+            Only used if useMultiProcess is True.
+            See TaskScheduler in superClasses.driverSuperClass for
+            details.
         """
         #}}}
 
+        # Guard
+        if offCondition is not None and offCondition > condition:
+            message = "offCondition ({}) must be less or equal to condition ({})"
+            raise ValueError(message.format(offCondition, condition))
+
         # Set the member data
         self._collectPaths      = collectPaths
         self._convertToPhysical = convertToPhysical
         self._condition         = condition
+        self._offCondition      =\
+            offCondition if offCondition is not None else condition
+        self._minDuration       = minDuration
         self._pctPadding        = pctPadding
         self._useMultiProcess     = useMultiProcess
+        self._memoryBudget        = memoryBudget
         self._xInd, self._yInd, self._zInd, self._tSlice = slices
 
         # Initialize the count
@@ -100,40 +130,180 @@ class CollectAndCalcBlobs(object):
         self._radialFlux, self.uc = self._collectRadialFlux()
         self._dh = DimensionsHelper(self._collectPaths[0], self.uc)
 
+        # Find the events and their windows
+        self._findEvents()
+
+        # Collect the bins
+        # NOTE: The perpendicular plane is collected once per group of
+        #       overlapping windows, and the bins are views into it
+        spans = getSpans(self._tSlices)
+        perp2DSpans = self._collect2DSpans("n", spans, False, "perp")
+        # Calculate the fluctuations once per span
+        perp2DSpansFluct =\
+            tuple(getPerp2DFluct(perp2DSpan) for perp2DSpan in perp2DSpans)
+        self.setBins(spans, perp2DSpans, perp2DSpansFluct)
+    #}}}
+
+    #{{{fromRadialFlux
+    @classmethod
+    def fromRadialFlux(cls              ,\
+                       radialFlux       ,\
+                       uc               ,\
+                       dh               ,\
+                       collectPaths     ,\
+                       slices           ,\
+                       convertToPhysical,\
+                       **kwargs):
+        #{{{docstring
+        """
+        Makes an instance from an already collected radial flux.
+
+        The events and their windows are found from the flux, whereas
+        the bins must be set with setBins prior to the execution.
+        This makes it possible to collect the flux and the
+        perpendicular planes of several probes together (see
+        CollectAndCalcBlobsMultiProbe).
+
+        Parameters
+        ----------
+        radialFlux : dict
+            Dictionary with one key on the form "rho,theta,z".
+            The value is a dict containing of
+            {"nRadialFlux":radialFlux, "time":time}
+        uc : UnitsConverter
+            The UnitsConverter object used for the flux.
+        dh : DimensionsHelper
+            The DimensionsHelper object.
+        collectPaths : tuple
+            Tuple from where to collect
+        slices : tuple of tuples
+            Tuple the indices to use.
+            On the form (xInd, yInd, zInd, tSlice)
+        convertToPhysical : bool
+            Whether or not to convert to physical
+        **kwargs : keyword arguments
+            See the constructor for details.
+
+        Returns
+        -------
+        ccb : CollectAndCalcBlobs
+            The instance with the events found.
+        """
+        #}}}
+
+        ccb = cls(collectPaths, slices, convertToPhysical, **kwargs)
+
+        ccb._notCalled.remove("prepareCollectAndCalc")
+        ccb._notCalled.append("setBins")
+
+        ccb._radialFlux = radialFlux
+        ccb.uc          = uc
+        ccb._dh         = dh
+        ccb._findEvents()
+
+        return ccb
+    #}}}
+
+    #{{{_findEvents
+    def _findEvents(self):
+        #{{{docstring
+        """
+        Finds the events in the radial flux, and sets the time slices of
+        the windows around them.
+
+        NOTE: self._radialFlux must be set prior to the call.
+        """
+        #}}}
+
         # Initialize
         key = list(self._radialFlux.keys())[0]
         flux = self._radialFlux[key]["nRadialFlux"]
 
-        condition = flux.std()*self._condition
+        condition    = flux.std()*self._condition
+        offCondition = flux.std()*self._offCondition
         time = self._radialFlux[key]["time"]
         self._dt = time[1] - time[0]
 
         # Get indices and window sizes
-        self._indices = self._getIndicesMeetingCondition(flux, condition)
-        windowSize = self._getWindowSize(self._indices, self._pctPadding)
+        indices = self._getIndicesMeetingCondition(flux, condition,\
+                                                   offCondition,\
+                                                   self._minDuration)
+        windowSize = self._getWindowSize(indices, self._pctPadding)
 
         # Correct for the start of tSlice
         maxInd = len(time)-1 + self._tSlice.start
-        self._tSlices =\
-            self._transformContiguousIndicesToSlices(self._indices   ,\
+        self._tSlices, self._indices =\
+            self._transformContiguousIndicesToSlices(indices   ,\
                                                      windowSize,\
                                                      maxInd    ,\
                                                      )
-        # Collect the bins
-        self._perp2DBins = self._collect2DBins("n",self._tSlices,False,"perp")
-        self._timeTraceBins, self._perp2DBinsFluct =\
-                self._getTimeTraceBins(self._perp2DBins)
 
-        # Sort into blobs and holes
-        self._midIndex = int((self._tSlices[0].stop - self._tSlices[0].start)/2)
-        self._blobsIndices, self._holesIndices =\
-            self._identifyBlobsAndHoles(self._timeTraceBins, self._midIndex)
+        # NOTE: The windows are centered, and the stop is included
+        self._midIndex = windowSize
 
         # Make averages
         # +1 for symmetry
         self._windowTime = np.array(range(-windowSize, windowSize+1))*self._dt
     #}}}
 
+    #{{{getWindowSlices
+    def getWindowSlices(self):
+        #{{{docstring
+        """
+        Returns the time slices of the windows around the events.
+
+        Returns
+        -------
+        tSlices : tuple
+            Tuple of time slices, where the stop is included as in the
+            collect.
+        """
+        #}}}
+
+        if "prepareCollectAndCalc" in self._notCalled:
+            message = ("'prepareCollectAndCalc' must be called before"
+                       "the execution")
+            raise RuntimeError(message)
+
+        return self._tSlices
+    #}}}
+
+    #{{{setBins
+    def setBins(self, spans, perp2DSpans, perp2DSpansFluct):
+        #{{{docstring
+        """
+        Extracts the perpendicular bins, and sorts them into blobs and
+        holes.
+
+        Parameters
+        ----------
+        spans : tuple
+            Tuple of (start, stop) of the spans as obtained from
+            getSpans.
+            The spans must cover all the windows of getWindowSlices.
+        perp2DSpans : tuple
+            The perpendicular density in the spans as obtained from
+            collect2DSpans.
+        perp2DSpansFluct : tuple
+            The fluctuations of perp2DSpans as obtained from
+            getPerp2DFluct.
+        """
+        #}}}
+
+        if "setBins" in self._notCalled:
+            self._notCalled.remove("setBins")
+
+        self._perp2DBins =\
+            self._extractBins("n", perp2DSpans, spans, self._tSlices)
+        self._perp2DBinsFluct =\
+            self._extractBins("n", perp2DSpansFluct, spans, self._tSlices)
+        self._timeTraceBins = self._getTimeTraceBins(self._perp2DBinsFluct)
+
+        # Sort into blobs and holes
+        self._blobsIndices, self._holesIndices =\
+            self._identifyBlobsAndHoles(self._timeTraceBins, self._midIndex)
+    #}}}
+
     #{{{getCounts
     def getCounts(self):
         #{{{docstring
@@ -257,9 +427,9 @@ class CollectAndCalcBlobs(object):
         """
         #}}}
 
-        if "prepareCollectAndCalc" in self._notCalled:
-            message = ("'prepareCollectAndCalc' must be called before"
-                       "the execution")
+        if len(self._notCalled) > 0:
+            message = "The following functions were not called:\n{}".\
+                        format("\n".join(self._notCalled))
             raise RuntimeError(message)
 
         # Separate into holes and blobs
@@ -321,9 +491,9 @@ class CollectAndCalcBlobs(object):
         """
         #}}}
 
-        if "prepareCollectAndCalc" in self._notCalled:
-            message = ("'prepareCollectAndCalc' must be called before"
-                       "the execution")
+        if len(self._notCalled) > 0:
+            message = "The following functions were not called:\n{}".\
+                        format("\n".join(self._notCalled))
             raise RuntimeError(message)
 
         if phiCont:
@@ -335,11 +505,6 @@ class CollectAndCalcBlobs(object):
             bins2D = self._collect2DBins(varName, self._tSlices, fluct, mode)
         else:
             if fluct:
-                # Cast to 3D from 4D
-                self._perp2DBinsFluct = list(self._perp2DBinsFluct)
-                for i in range(len(self._perp2DBinsFluct)):
-                    self._perp2DBinsFluct[i]["n"] = self._perp2DBinsFluct[i]["n"][:,:,0,:]
-                self._perp2DBinsFluct = tuple(self._perp2DBinsFluct)
                 bins2D = self._perp2DBinsFluct
             else:
                 bins2D = self._perp2DBins
@@ -394,11 +559,15 @@ class CollectAndCalcBlobs(object):
     #}}}
 
     #{{{_getIndicesMeetingCondition
-    def _getIndicesMeetingCondition(self, var, condition):
+    def _getIndicesMeetingCondition(self, var, condition,\
+                                    offCondition = None, minDuration = 1):
         #{{{docstring
         """
         Returns indices where the condition is meet.
 
+        An event starts when var reaches condition, and lasts as long as
+        var is above or equal to offCondition.
+
         The indices are corrected for the tSlice.start.
 
         Parameters
@@ -407,6 +576,11 @@ class CollectAndCalcBlobs(object):
             Array of to find where the condition is meet.
         condition : float
             The condition to check for.
+        offCondition : [None|float]
+            The condition which ends an event.
+            If None, condition is used.
+        minDuration : int
+            Events with fewer indices than this are discarded.
 
         Returns
         -------
@@ -417,31 +591,36 @@ class CollectAndCalcBlobs(object):
         """
         #}}}
 
-        # Get indices where the values are above the conditions
-        indicesMeetingCond = np.where(var >= condition)[0]
-
-        # Get contiguous indices
-        contiguousIndices = []
-        while len(indicesMeetingCond) !=0:
-            # -1 in order not to get out of index on last point
-            for i in range(len(indicesMeetingCond)-1):
-                if indicesMeetingCond[i]+1 != indicesMeetingCond[i+1]:
-                    break
-            contiguous = indicesMeetingCond[0:i+1]
-            indicesMeetingCond = indicesMeetingCond[i+1:]
-            contiguousIndices.append(contiguous)
-
-        # As i ran to len(indicesMeetingCond)-1, we make a special treatment on
-        # the last index
-        contiguousIndices[-2] =\
-            np.append(contiguousIndices[-2], contiguousIndices[-1][0])
-        contiguousIndices = contiguousIndices[:-1]
+        if offCondition is None:
+            offCondition = condition
+
+        # Find the runs above the off condition
+        # NOTE: Padding with False on both sides ensures that each run
+        #       has a start and a stop, also at the ends of var
+        above = np.concatenate(([False], var >= offCondition, [False]))
+        edges = np.diff(above.astype(np.int8))
+        starts = np.flatnonzero(edges ==  1)
+        stops  = np.flatnonzero(edges == -1)
+
+        # The event starts at the first point in the run meeting the
+        # condition
+        # NOTE: len(var) is appended so that runs without such a point
+        #       get zero length
+        onIndices = np.flatnonzero(var >= condition)
+        firstOn = np.append(onIndices, len(var))[np.searchsorted(onIndices,\
+                                                                 starts)]
+        starts = np.minimum(firstOn, stops)
+
+        # Remove runs without any points meeting the condition, and the
+        # too short events
+        keep = (stops - starts) >= max(minDuration, 1)
+        starts = starts[keep]
+        stops  = stops [keep]
 
         # Correct for tSlices.start
-        for i in range(len(contiguousIndices)):
-            contiguousIndices[i] += self._tSlice.start
-
-        contiguousIndices = tuple(contiguousIndices)
+        offset = self._tSlice.start
+        contiguousIndices = tuple(np.arange(start + offset, stop + offset)\
+                                  for start, stop in zip(starts, stops))
 
         return contiguousIndices
     #}}}
@@ -469,9 +648,8 @@ class CollectAndCalcBlobs(object):
         """
         #}}}
 
-        maxLen = 0
-        for indices in contiguousIndices:
-            maxLen = len(indices) if len(indices) > maxLen else maxLen
+        maxLen = max((len(indices) for indices in contiguousIndices),\
+                     default=0)
         windowSize = int(maxLen*(1+(pctPadding/100)))
 
         return windowSize
@@ -503,10 +681,14 @@ class CollectAndCalcBlobs(object):
         tSlices : tuple
             Tuple of time slices, where the individual slice is the slice
             which will be used to collect a theBin.
+        contiguousIndices : tuple
+            As the input, but only with the elements which windows fit
+            inside the time range, so that it matches tSlices.
         """
         #}}}
 
         tSlices = []
+        keptIndices = []
         for indices in contiguousIndices:
             # Find the mid of the indices
             mid = int(len(indices)/2)
@@ -522,10 +704,12 @@ class CollectAndCalcBlobs(object):
                 # Guard for the end
                 if curSlice.stop <= maxInd:
                     tSlices.append(curSlice)
+                    keptIndices.append(indices)
 
         tSlices = tuple(tSlices)
+        keptIndices = tuple(keptIndices)
 
-        return tSlices
+        return tSlices, keptIndices
     #}}}
 
     #{{{_collect2DBins
@@ -534,6 +718,9 @@ class CollectAndCalcBlobs(object):
         """
         Collects the bins which will be used in the average.
 
+        The time span covered by overlapping windows is only collected
+        once, and the bins are views into the collected arrays.
+
         Parameters
         ----------
         varName : str
@@ -562,97 +749,90 @@ class CollectAndCalcBlobs(object):
         """
         #}}}
 
-        args = tuple((varName, tSlice, fluct, mode) for tSlice in tSlices)
-        if self._useMultiProcess:
-            # Set a max of 10 processors in order not to saturate the memory
-            with Pool(10) as p:
-                # Here using Pool.starmap
-                tupleOfBins2D = tuple(p.starmap(self._collect2DBin, args))
-        else:
-            # Here using itertools.starmap
-            tupleOfBins2D = tuple(starmap(self._collect2DBin, args))
+        spans = getSpans(tSlices)
+        spanDicts = self._collect2DSpans(varName, spans, fluct, mode)
 
-        return tupleOfBins2D
+        return self._extractBins(varName, spanDicts, spans, tSlices)
     #}}}
 
-    #{{{_collect2DBin
-    def _collect2DBin(self, varName, tSlice, fluct, mode):
+    #{{{_collect2DSpans
+    def _collect2DSpans(self, varName, spans, fluct, mode):
+        """
+        Collects the spans in the probe position, see collect2DSpans
+        """
+
+        return collect2DSpans(self._collectPaths                    ,\
+                              (self._xInd, self._yInd, self._zInd)  ,\
+                              self._convertToPhysical               ,\
+                              varName                               ,\
+                              spans                                 ,\
+                              fluct                                 ,\
+                              mode                                  ,\
+                              useMultiProcess = self._useMultiProcess,\
+                              memoryBudget    = self._memoryBudget   ,\
+                             )
+    #}}}
+
+    #{{{_extractBins
+    def _extractBins(self, varName, spanDicts, spans, tSlices):
         #{{{docstring
         """
-        Collects the bins which will be used in the average.
+        Extracts the bins from the collected spans.
 
         Parameters
         ----------
         varName : str
-            Name of the variable to collect.
+            Name of the variable.
+        spanDicts : tuple
+            The collected spans as obtained from collect2DSpans.
+        spans : tuple
+            Tuple of (start, stop) of the spans as obtained from
+            getSpans.
         tSlices : tuple
             Tuple of time slices, where the individual slice is the slice
-            which will be used to collect a theBin.
-        fluct : bool
-            Whether or not to collect the fluctuations only.
-        mode : ["perp"|"par"|"pol"]
-            Type of 2D calculation.
+            of a theBin.
 
         Returns
         -------
-        theBin : dict
-            A dict with the keys:
-                * varName    - A 3d array (a 2d spatial array of each time)
-                               of the collected variable.
-                * varNamePPi - The field at pi away from the varName field
-                               (only if "type" == "par")
-                * "X"        - The cartesian x mesh to the field
-                * "Y"        - The cartesian Y mesh to the field
-                * "time"     - The time trace
-                * pos        - The position of the fixed index
+        bins : tuple
+            Tuple of the bins, where the arrays of varName, varNamePPi and
+            "time" are views into the arrays of the spans.
         """
         #}}}
 
-        xSlice            = None
-        ySlice            = None
-        zSlice            = None
-        xInd              = self._xInd
-        yInd              = self._yInd
-        zInd              = self._zInd
-
-        convertToPhysical = self._convertToPhysical
-
-        # Pependicular collection
-        ccf2D = CollectAndCalcFields2D(\
-                    self._collectPaths        ,\
-                    fluct             = fluct ,\
-                    mode              = mode  ,\
-                    convertToPhysical = convertToPhysical)
-
-        if mode == "perp":
-            ccf2D.setSlice(xSlice, yInd, zSlice, tSlice)
-        elif mode == "par":
-            ccf2D.setSlice(xSlice, ySlice, zInd, tSlice)
-        elif mode == "pol":
-            ccf2D.setSlice(xInd, ySlice, zSlice, tSlice)
-        else:
-            message =\
-                "'mode' expected 'perp', 'par' or 'pol', but got '{}'".\
-                format(mode)
-            raise ValueError(message)
+        starts = tuple(span[0] for span in spans)
+        keys   = (varName, "{}PPi".format(varName), "time")
 
-        ccf2D.setVarName(varName)
-        theBin = ccf2D.executeCollectAndCalc()
+        bins = []
+        for tSlice in tSlices:
+            nr       = bisect_right(starts, tSlice.start) - 1
+            spanDict = spanDicts[nr]
+            first    = tSlice.start - starts[nr]
+            # NOTE: The stop is included in the collect
+            last     = tSlice.stop  - starts[nr] + 1
 
-        return theBin
+            theBin = spanDict.copy()
+            for key in keys:
+                if key in spanDict:
+                    theBin[key] = spanDict[key][first:last]
+            bins.append(theBin)
+
+        bins = tuple(bins)
+
+        return bins
     #}}}
 
     #{{{_getTimeTraceBins
-    def _getTimeTraceBins(self, perp2DBins):
+    def _getTimeTraceBins(self, perp2DBinsFluct):
         #{{{docstring
         """
-        Get the time trace bins from perp2DBins
+        Get the time trace bins from perp2DBinsFluct
 
         Parameters
         ----------
-        perp2DBins : tuple
-            A tuple of the perpendicular 2D bins stored as dicts with
-            the keys:
+        perp2DBinsFluct : tuple
+            A tuple of the perpendicular 2D fluctuation bins stored as
+            dicts with the keys:
                 * "n"    - A 3d array (a 2d spatial array of each time)
                            of the collected variable.
                 * "X"    - The cartesian x mesh to the field
@@ -664,45 +844,25 @@ class CollectAndCalcBlobs(object):
         -------
         timeTraceBins : tuple
             A tuple of the time traces, stored as dicts with the keys:
-                * "n"    - A 3d array (a 2d spatial array of each time)
-                           of the collected variable.
+                * "n"    - A 1d array of the fluctuation in the probe
+                           position.
                 * "time" - The time trace
                 * "pos"  - Tuple of the (rho, theta, z) fixed positions.
-        perp2DBinFluct : tuple
-            A by-product of the process.
-            A tuple of the 2D bins stored as dicts with the
-            keys:
-                * "n"    - A 3d array (a 2d spatial array of each time)
-                           of the collected variable.
-                * "X"    - The cartesian x mesh to the field
-                * "Y"    - The cartesian Y mesh to the field
-                * "time" - The time trace
-                * pos    - The position of the fixed index
         """
         #}}}
 
         timeTraceBins = []
-        perp2DBinFluct = []
         rhoPos   = self._dh.rho     [self._xInd]
         thetaPos = self._dh.thetaRad[self._yInd]
-        for perp2DBin in perp2DBins:
+        for perp2DBinFluct in perp2DBinsFluct:
             curDict         = {}
-            # Must manually take the poloidal average
-            var = np.expand_dims(perp2DBin["n"], axis=2)
-            fluct = var - polAvg(var)
-            # Add to perp2DBinFluct
-            fluctDict = perp2DBin.copy()
-            fluctDict["n"] = fluct
-            perp2DBinFluct.append(fluctDict)
-
-            # Store to dict
-            curDict["n"]    = fluct[:, self._xInd, 0, self._zInd]
-            curDict["time"] = perp2DBin["time"]
-            curDict["pos"]  = (rhoPos, thetaPos, perp2DBin["zPos"])
+            curDict["n"]    = perp2DBinFluct["n"][:, self._xInd, self._zInd]
+            curDict["time"] = perp2DBinFluct["time"]
+            curDict["pos"]  = (rhoPos, thetaPos, perp2DBinFluct["zPos"])
             timeTraceBins.append(curDict)
 
-        perp2DBinFluct = tuple(perp2DBinFluct)
-        return timeTraceBins, perp2DBinFluct
+        timeTraceBins = tuple(timeTraceBins)
+        return timeTraceBins
     #}}}
 
     #{{{_identifyBlobsAndHoles
@@ -826,3 +986,199 @@ class CollectAndCalcBlobs(object):
         return binAverageDict
     #}}}
 #}}}
+
+#{{{getSpans
+def getSpans(tSlices):
+    #{{{docstring
+    """
+    Merges overlapping (or adjacent) time slices into spans.
+
+    Parameters
+    ----------
+    tSlices : tuple
+        Tuple of time slices, where the individual slice is the slice
+        which will be used to collect a theBin.
+        NOTE: As in the collect, the stop is included.
+
+    Returns
+    -------
+    spans : tuple
+        Tuple of (start, stop) of the spans in ascending order, where
+        the stop is included.
+    """
+    #}}}
+
+    spans = []
+    for tSlice in sorted(tSlices, key = lambda tSlice: tSlice.start):
+        if len(spans) > 0 and tSlice.start <= spans[-1][1] + 1:
+            spans[-1][1] = max(spans[-1][1], tSlice.stop)
+        else:
+            spans.append([tSlice.start, tSlice.stop])
+
+    spans = tuple(tuple(span) for span in spans)
+
+    return spans
+#}}}
+
+#{{{collect2DSpans
+def collect2DSpans(collectPaths            ,\
+                   indices                 ,\
+                   convertToPhysical       ,\
+                   varName                 ,\
+                   spans                   ,\
+                   fluct                   ,\
+                   mode                    ,\
+                   useMultiProcess = False ,\
+                   memoryBudget    = None  ,\
+                   ):
+    #{{{docstring
+    """
+    Collects the spans which the bins will be extracted from.
+
+    Parameters
+    ----------
+    collectPaths : tuple
+        Tuple from where to collect
+    indices : tuple
+        The fixed indices on the form (xInd, yInd, zInd).
+        yInd is used in "perp" mode, zInd in "par" mode and xInd in
+        "pol" mode.
+    convertToPhysical : bool
+        Whether or not to convert to physical
+    varName : str
+        Name of the variable to collect.
+    spans : tuple
+        Tuple of (start, stop) of the spans as obtained from getSpans.
+    fluct : bool
+        Whether or not to collect the fluctuations only.
+    mode : ["perp"|"par"|"pol"]
+        Type of 2D calculation.
+    useMultiProcess : bool
+        Whether or not to collect the spans in sub processes.
+    memoryBudget : [None|int]
+        The memory (in bytes) the collection of each span is expected
+        to use.
+        See TaskScheduler in superClasses.driverSuperClass for details.
+
+    Returns
+    -------
+    spanDicts : tuple
+        A tuple of the collected spans stored as dicts with the
+        same keys as the output of _collect2DSpan.
+    """
+    #}}}
+
+    args = tuple((collectPaths, indices, convertToPhysical,\
+                  varName, slice(*span), fluct, mode) for span in spans)
+    if useMultiProcess and len(args) > 1:
+        # NOTE: The spans are run in series if this is already a task
+        #       of the scheduler
+        spanDicts = tuple(getTaskScheduler().\
+                            starmap(_collect2DSpan,\
+                                    args,\
+                                    memoryBudget = memoryBudget,\
+                                    nWorkers     = maxSpanWorkers))
+    else:
+        # Here using itertools.starmap
+        spanDicts = tuple(starmap(_collect2DSpan, args))
+
+    return spanDicts
+#}}}
+
+#{{{_collect2DSpan
+def _collect2DSpan(collectPaths, indices, convertToPhysical,\
+                   varName, tSlice, fluct, mode):
+    #{{{docstring
+    """
+    Collects one span.
+
+    Parameters
+    ----------
+    collectPaths : tuple
+        Tuple from where to collect
+    indices : tuple
+        The fixed indices on the form (xInd, yInd, zInd).
+    convertToPhysical : bool
+        Whether or not to convert to physical
+    varName : str
+        Name of the variable to collect.
+    tSlice : slice
+        The time slice of the span.
+    fluct : bool
+        Whether or not to collect the fluctuations only.
+    mode : ["perp"|"par"|"pol"]
+        Type of 2D calculation.
+
+    Returns
+    -------
+    spanDict : dict
+        A dict with the keys:
+            * varName    - A 3d array (a 2d spatial array of each time)
+                           of the collected variable.
+            * varNamePPi - The field at pi away from the varName field
+                           (only if "type" == "par")
+            * "X"        - The cartesian x mesh to the field
+            * "Y"        - The cartesian Y mesh to the field
+            * "time"     - The time trace
+            * pos        - The position of the fixed index
+    """
+    #}}}
+
+    xSlice = None
+    ySlice = None
+    zSlice = None
+    xInd, yInd, zInd = indices
+
+    # Pependicular collection
+    ccf2D = CollectAndCalcFields2D(\
+                collectPaths              ,\
+                fluct             = fluct ,\
+                mode              = mode  ,\
+                convertToPhysical = convertToPhysical)
+
+    if mode == "perp":
+        ccf2D.setSlice(xSlice, yInd, zSlice, tSlice)
+    elif mode == "par":
+        ccf2D.setSlice(xSlice, ySlice, zInd, tSlice)
+    elif mode == "pol":
+        ccf2D.setSlice(xInd, ySlice, zSlice, tSlice)
+    else:
+        message =\
+            "'mode' expected 'perp', 'par' or 'pol', but got '{}'".\
+            format(mode)
+        raise ValueError(message)
+
+    ccf2D.setVarName(varName)
+    spanDict = ccf2D.executeCollectAndCalc()
+
+    return spanDict
+#}}}
+
+#{{{getPerp2DFluct
+def getPerp2DFluct(perp2D):
+    #{{{docstring
+    """
+    Returns the fluctuations of a perpendicular 2D field.
+
+    Parameters
+    ----------
+    perp2D : dict
+        A dict with the perpendicular 2D field stored under the key
+        "n", as obtained from collect2DSpans.
+
+    Returns
+    -------
+    perp2DFluct : dict
+        As the input, but where "n" is the fluctuations.
+    """
+    #}}}
+
+    # Must manually take the poloidal average
+    var = np.expand_dims(perp2D["n"], axis=2)
+    fluct = var - polAvg(var, compact=True)
+
+    perp2DFluct = perp2D.copy()
+    perp2DFluct["n"] = fluct[:, :, 0, :]
+
+    return perp2DFluct
+#}}}
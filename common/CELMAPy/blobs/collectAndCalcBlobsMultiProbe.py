@@ -0,0 +1,360 @@
+#!/usr/bin/env python
+
+"""
+Contains the blobs calculation for several probes
+"""
+
+from ..calcVelocities import calcRadialExBFromPhi
+from ..collectAndCalcHelpers import (DimensionsHelper,\
+                                     calcN,\
+                                     collectiveCollectChunks,\
+                                     collectTime,\
+                                     polAvg,\
+                                     slicesToIndices)
+from ..unitsConverter import UnitsConverter
+from .collectAndCalcBlobs import (CollectAndCalcBlobs,\
+                                  getSpans,\
+                                  collect2DSpans,\
+                                  getPerp2DFluct)
+import numpy as np
+
+#{{{CollectAndCalcBlobsMultiProbe
+class CollectAndCalcBlobsMultiProbe(object):
+    """
+    Class for collecting and calcuating the blobs in several probes
+
+    The radial flux and the perpendicular density are read once for all
+    the probes, whereas the blob statistics of each probe are given by a
+    CollectAndCalcBlobs object.
+    """
+
+    #{{{constructor
+    def __init__(self                  ,\
+                 collectPaths          ,\
+                 probes                ,\
+                 tSlice                ,\
+                 convertToPhysical     ,\
+                 condition       = 3   ,\
+                 pctPadding      = 400 ,\
+                 useMultiProcess = True,\
+                 offCondition    = None,\
+                 minDuration     = 1   ,\
+                 chunkSize       = 100 ,\
+                 ):
+        #{{{docstring
+        """
+        This constructor will:
+            * Set the member data
+
+        Parameters
+        ----------
+        collectPaths : tuple
+            Tuple from where to collect
+        probes : tuple of tuples
+            The probe positions on the form
+            ((xInd1, yInd1, zInd1), (xInd2, yInd2, zInd2), ...)
+            For example a radial rake of probes.
+        tSlice : slice
+            The time slice to use for all the probes.
+        convertToPhysical : bool
+            Whether or not to convert to physical
+        condition : float
+            The condition in the conditional average will be set to
+            flux.std()*condition
+        pctPadding : float
+            Padding around the maximum pulsewidth which satisfies the
+            condition.
+            Measured in percent.
+        useMultiProcess : bool
+            Whether or not to use sub process.
+        offCondition : [None|float]
+            An event lasts until the flux drops below
+            flux.std()*offCondition (hysteresis).
+            If None, condition is used.
+        minDuration : int
+            Events shorter than minDuration time indices are discarded.
+        chunkSize : int
+            Number of time points to collect at a time when calculating
+            the radial flux.
+        """
+        #}}}
+
+        probes = tuple(tuple(probe) for probe in probes)
+
+        # Guard
+        if len(set(probes)) != len(probes):
+            message = "The probes must be unique, but got {}".format(probes)
+            raise ValueError(message)
+
+        # Set the member data
+        self._collectPaths      = collectPaths
+        self._probes            = probes
+        self._tSlice            = tSlice
+        self._convertToPhysical = convertToPhysical
+        self._chunkSize         = chunkSize
+
+        # The keyword arguments of the probes
+        self._blobsKwargs = {"condition"       : condition      ,\
+                             "pctPadding"      : pctPadding     ,\
+                             "useMultiProcess" : useMultiProcess,\
+                             "offCondition"    : offCondition   ,\
+                             "minDuration"     : minDuration    ,\
+                            }
+
+        # Initialize the probes
+        self._ccbs = None
+
+        self._notCalled = ["prepareCollectAndCalc"]
+    #}}}
+
+    #{{{prepareCollectAndCalc
+    def prepareCollectAndCalc(self):
+        #{{{docstring
+        """
+        Prepares the probes for collection.
+
+        This function will:
+            * Collect the radial density flux in all the probes in one
+              pass through the data.
+            * Find the events of each probe.
+            * Collect the perpendicular 2D density once for each
+              parallel plane and group of overlapping windows (of all
+              the probes in the plane).
+            * Set which events are blobs and which are holes in each
+              probe.
+        """
+        #}}}
+
+        if "prepareCollectAndCalc" in self._notCalled:
+            self._notCalled.remove("prepareCollectAndCalc")
+        else:
+            print("The preparation has already been made")
+            return
+
+        radialFlux, self.uc, self._dh = self._collectRadialFluxes()
+
+        # Make one CollectAndCalcBlobs for each probe
+        # NOTE: The flux is already collected, so only the events are
+        #       found here
+        self._ccbs = {}
+        for (xInd, yInd, zInd), key in zip(self._probes, radialFlux.keys()):
+            self._ccbs[key] = CollectAndCalcBlobs.fromRadialFlux(\
+                                {key:radialFlux[key]}             ,\
+                                self.uc                           ,\
+                                self._dh                          ,\
+                                self._collectPaths                ,\
+                                (xInd, yInd, zInd, self._tSlice)  ,\
+                                self._convertToPhysical           ,\
+                                **self._blobsKwargs)
+
+        # Collect the bins plane by plane
+        for yInd in sorted(set(probe[1] for probe in self._probes)):
+            ccbs = tuple(ccb for ccb, probe in\
+                         zip(self._ccbs.values(), self._probes)\
+                         if probe[1] == yInd)
+
+            # The windows of all the probes in the plane
+            tSlices = tuple(tSlice for ccb in ccbs\
+                            for tSlice in ccb.getWindowSlices())
+
+            spans = getSpans(tSlices)
+            perp2DSpans =\
+                collect2DSpans(self._collectPaths                         ,\
+                               (None, yInd, None)                         ,\
+                               self._convertToPhysical                    ,\
+                               "n"                                        ,\
+                               spans                                      ,\
+                               False                                      ,\
+                               "perp"                                     ,\
+                               useMultiProcess =\
+                                self._blobsKwargs["useMultiProcess"]      ,\
+                               )
+            perp2DSpansFluct =\
+                tuple(getPerp2DFluct(perp2DSpan) for perp2DSpan in perp2DSpans)
+
+            for ccb in ccbs:
+                ccb.setBins(spans, perp2DSpans, perp2DSpansFluct)
+    #}}}
+
+    #{{{getProbes
+    def getProbes(self):
+        #{{{docstring
+        """
+        Returns the prepared probes.
+
+        Returns
+        -------
+        ccbs : dict
+            Dictionary where the keys are on the form "rho,theta,z".
+            The value is the prepared CollectAndCalcBlobs of the probe.
+        """
+        #}}}
+
+        if "prepareCollectAndCalc" in self._notCalled:
+            message = ("'prepareCollectAndCalc' must be called before "
+                       "the execution")
+            raise RuntimeError(message)
+
+        return self._ccbs
+    #}}}
+
+    #{{{getCounts
+    def getCounts(self):
+        #{{{docstring
+        """
+        Returns the blob count and the holes count of each probe.
+
+        Returns
+        -------
+        counts : dict
+            Dictionary where the keys are on the form "rho,theta,z".
+            The value is the tuple (blobCount, holeCount).
+        """
+        #}}}
+
+        return {key:ccb.getCounts() for key, ccb in self.getProbes().items()}
+    #}}}
+
+    #{{{getWaitingTimesAndPulseWidth
+    def getWaitingTimesAndPulseWidth(self, type):
+        #{{{docstring
+        """
+        Returns the waiting times and the pulse widths of each probe
+
+        Parameters
+        ----------
+        type : ["blobs"|"holes"]
+            Whether the waiting times and pulse widths for blobs or
+            holes are to be returned.
+
+        Returns
+        -------
+        waitingTimesAndPulseWidths : dict
+            Dictionary where the keys are on the form "rho,theta,z".
+            The value is the output of
+            CollectAndCalcBlobs.getWaitingTimesAndPulseWidth.
+        """
+        #}}}
+
+        return {key:ccb.getWaitingTimesAndPulseWidth(type)\
+                for key, ccb in self.getProbes().items()}
+    #}}}
+
+    #{{{executeCollectAndCalc1D
+    def executeCollectAndCalc1D(self):
+        #{{{docstring
+        """
+        Collect and calcs the blobs and holes for the 1D time traces.
+
+        Returns
+        -------
+        timeTraces : dict
+            Dictionary where the keys are on the form "rho,theta,z".
+            The value is the output of
+            CollectAndCalcBlobs.executeCollectAndCalc1D.
+        """
+        #}}}
+
+        return {key:ccb.executeCollectAndCalc1D()\
+                for key, ccb in self.getProbes().items()}
+    #}}}
+
+    #{{{executeCollectAndCalc2D
+    def executeCollectAndCalc2D(self, varName, mode, fluct, phiCont=False):
+        #{{{docstring
+        """
+        Collect and calcs the blobs and holes in 2D.
+
+        NOTE: Only the perpendicular density is shared between the
+              probes. Other variables and modes are collected probe by
+              probe.
+
+        Parameters
+        ----------
+        See CollectAndCalcBlobs.executeCollectAndCalc2D for details.
+
+        Returns
+        -------
+        fields2D : dict
+            Dictionary where the keys are on the form "rho,theta,z".
+            The value is the output of
+            CollectAndCalcBlobs.executeCollectAndCalc2D.
+        """
+        #}}}
+
+        return {key:ccb.executeCollectAndCalc2D(varName, mode, fluct, phiCont)\
+                for key, ccb in self.getProbes().items()}
+    #}}}
+
+    #{{{_collectRadialFluxes
+    def _collectRadialFluxes(self):
+        #{{{docstring
+        """
+        Collects the radial density flux in all the probes.
+
+        The density and the potential are collected chunk by chunk in
+        time, once for each parallel plane of the probes.
+
+        Returns
+        -------
+        radialFlux : dict
+            Dictionary where the keys are on the form "rho,theta,z", in
+            the same order as the probes.
+            The value is a dict containing of
+            {"nRadialFlux":radialFlux, "time":time}
+        uc : UnitsConverter
+            The UnitsConverter object.
+        dh : DimensionsHelper
+            The DimensionsHelper object.
+        """
+        #}}}
+
+        uc = UnitsConverter(self._collectPaths[0], self._convertToPhysical)
+        dh = DimensionsHelper(self._collectPaths[0], uc)
+
+        tInd = slicesToIndices(self._collectPaths, self._tSlice, "t")
+        time = collectTime(self._collectPaths, tInd)
+        if uc.convertToPhysical:
+            time = uc.physicalConversion(time, "t")
+
+        traces = {probe:[] for probe in self._probes}
+        for yInd in sorted(set(probe[1] for probe in self._probes)):
+            probes = tuple(probe for probe in self._probes if probe[1] == yInd)
+            xMin = min(probe[0] for probe in probes)
+            xMax = max(probe[0] for probe in probes)
+            rho  = dh.rho[xMin:xMax+1][np.newaxis, :, np.newaxis, np.newaxis]
+
+            for _, var in collectiveCollectChunks(self._collectPaths    ,\
+                                                  ("lnN", "phi")        ,\
+                                                  chunkSize = self._chunkSize,\
+                                                  tInd = tInd           ,\
+                                                  xInd = (xMin, xMax)   ,\
+                                                  yInd = (yInd, yInd)   ,\
+                                                 ):
+                # NOTE: As in the time traces, the fluctuations are taken
+                #       before the conversion
+                n = calcN(var["lnN"], True, uc = uc)
+                nFluct = n - polAvg(n, compact=True)
+                phi = var["phi"]
+                if uc.convertToPhysical:
+                    nFluct = uc.physicalConversion(nFluct, "n")
+                    phi    = uc.physicalConversion(phi   , "phi")
+
+                flux = nFluct*calcRadialExBFromPhi(phi, rho, uc, mode="fluct")
+
+                for probe in probes:
+                    xInd, _, zInd = probe
+                    traces[probe].append(flux[:, xInd - xMin, 0, zInd])
+
+        radialFlux = {}
+        for xInd, yInd, zInd in self._probes:
+            key = "{},{},{}".format(dh.rho     [xInd],\
+                                    dh.thetaDeg[zInd],\
+                                    dh.z       [yInd])
+            radialFlux[key] =\
+                {"nRadialFlux" : np.concatenate(traces[(xInd, yInd, zInd)]),\
+                 "time"        : time}
+
+        return radialFlux, uc, dh
+    #}}}
+#}}}
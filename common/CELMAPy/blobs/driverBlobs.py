@@ -15,10 +15,10 @@ from ..PDF import CollectAndCalcPDF, PlotPDF
 from ..superClasses import PlotSuperClass
 from ..unitsConverter import UnitsConverter
 from .collectAndCalcBlobs import CollectAndCalcBlobs
+from .collectAndCalcBlobsMultiProbe import CollectAndCalcBlobsMultiProbe
 from .plotBlobs import (PlotTemporalStats,\
                         PlotBlobOrHoleTimeTraceSingle,\
                         PlotBlobAndHoleTimeTraceDouble)
-from multiprocessing import Process
 from collections import namedtuple
 import os, pickle
 import numpy as np
@@ -33,6 +33,8 @@ def prepareBlobs(collectPaths     ,\
                  convertToPhysical,\
                  condition = 3    ,\
                  picklePath = None,\
+                 offCondition = None,\
+                 minDuration  = 1   ,\
                 ):
     #{{{docstring
     """
@@ -57,6 +59,12 @@ def prepareBlobs(collectPaths     ,\
     picklePath : [None|str]
         If set, the ccb will be pickled to the path if it doesn't
         exists, or read from the pickle if already exists
+    offCondition : [None|float]
+        An event lasts until the flux drops below
+        flux.std()*offCondition.
+        If None, condition is used.
+    minDuration : int
+        Events shorter than minDuration time indices are discarded.
 
     Returns
     -------
@@ -74,10 +82,12 @@ def prepareBlobs(collectPaths     ,\
                 ccb = pickle.load(f)
 
     if collect:
-        ccb = CollectAndCalcBlobs(collectPaths          ,\
-                                  slices                ,\
-                                  convertToPhysical     ,\
-                                  condition =  condition,\
+        ccb = CollectAndCalcBlobs(collectPaths                ,\
+                                  slices                      ,\
+                                  convertToPhysical           ,\
+                                  condition    = condition    ,\
+                                  offCondition = offCondition ,\
+                                  minDuration  = minDuration  ,\
                                   )
 
         ccb.prepareCollectAndCalc()
@@ -89,6 +99,87 @@ def prepareBlobs(collectPaths     ,\
     return ccb
 #}}}
 
+#{{{prepareBlobsMultiProbe
+def prepareBlobsMultiProbe(collectPaths       ,\
+                           probes             ,\
+                           tSlice             ,\
+                           pctPadding         ,\
+                           convertToPhysical  ,\
+                           condition    = 3   ,\
+                           picklePath   = None,\
+                           offCondition = None,\
+                           minDuration  = 1   ,\
+                          ):
+    #{{{docstring
+    """
+    Prepares the blobs of several probes in one pass through the data.
+
+    Parameters
+    ----------
+    collectPaths : tuple
+        Tuple from where to collect
+    probes : tuple of tuples
+        The probe positions on the form
+        ((xInd1, yInd1, zInd1), (xInd2, yInd2, zInd2), ...)
+    tSlice : slice
+        The time slice to use for all the probes.
+    pctPadding : float
+        Padding around the maximum pulsewidth which satisfies the
+        condition.
+        Measured in percent.
+    convertToPhysical : bool
+        Whether or not to convert to physical
+    condition : float
+        The condition in the conditional average will be set to
+        flux.std()*condition
+    picklePath : [None|str]
+        If set, the object will be pickled to the path if it doesn't
+        exists, or read from the pickle if already exists
+    offCondition : [None|float]
+        An event lasts until the flux drops below
+        flux.std()*offCondition.
+        If None, condition is used.
+    minDuration : int
+        Events shorter than minDuration time indices are discarded.
+
+    Returns
+    -------
+    ccbmp : CollectAndCalcBlobsMultiProbe
+        The initialized CollectAndCalcBlobsMultiProbe object.
+        The CollectAndCalcBlobs object of each probe is obtained with
+        getProbes().
+    """
+    #}}}
+
+    collect = True
+    if picklePath:
+        fileName = os.path.join(picklePath, "ccbMultiProbe.pickle")
+        if os.path.exists(fileName):
+            collect = False
+            with open(fileName, "rb") as f:
+                ccbmp = pickle.load(f)
+
+    if collect:
+        ccbmp = CollectAndCalcBlobsMultiProbe(\
+                        collectPaths                ,\
+                        probes                      ,\
+                        tSlice                      ,\
+                        convertToPhysical           ,\
+                        condition    = condition    ,\
+                        pctPadding   = pctPadding   ,\
+                        offCondition = offCondition ,\
+                        minDuration  = minDuration  ,\
+                        )
+
+        ccbmp.prepareCollectAndCalc()
+
+    if picklePath and collect:
+        with open(fileName, "wb") as f:
+            pickle.dump(ccbmp, f, pickle.HIGHEST_PROTOCOL)
+
+    return ccbmp
+#}}}
+
 #{{{driverRadialFlux
 def driverRadialFlux(ccb            ,\
                      plotSuperKwargs,\
@@ -696,6 +787,7 @@ class DriverBlobs(DriverSuperClass):
                  phiCont   = False,\
                  normed    = False,\
                  plotAll   = False,\
+                 probes    = None ,\
                  **kwargs):
         #{{{docstring
         """
@@ -732,6 +824,14 @@ class DriverBlobs(DriverSuperClass):
         plotAll : bool
            If True: All the individual frames making up the average will be
            plotted in the 2D plot.
+        probes : [None|tuple of tuples]
+            If given, the blobs of all the probes are found in one pass
+            through the data (see CollectAndCalcBlobsMultiProbe), and
+            the drivers are run for each of the probes.
+            On the form ((xInd1, yInd1, zInd1), (xInd2, yInd2, zInd2), ...)
+            NOTE: Only the tSlice of slices is used in this case.
+                  The plots of each probe are saved in a sub folder of
+                  the plot type named "xInd-yInd-zInd".
         **kwargs : keyword arguments
             See parent class for details.
         """
@@ -764,14 +864,35 @@ class DriverBlobs(DriverSuperClass):
         picklePath = tmp.getSavePath()
 
         # Prepare the blobs
-        self._ccb =\
-            prepareBlobs(self._collectPaths     ,\
-                         slices                 ,\
-                         pctPadding             ,\
-                         convertToPhysical      ,\
-                         condition = condition  ,\
-                         picklePath = picklePath,\
-                         )
+        # NOTE: The probes are on the form (ccb, plotSuperKwargs)
+        if probes is None:
+            ccb =\
+                prepareBlobs(self._collectPaths     ,\
+                             slices                 ,\
+                             pctPadding             ,\
+                             convertToPhysical      ,\
+                             condition = condition  ,\
+                             picklePath = picklePath,\
+                             )
+            self._probes = ((ccb, self._plotSuperKwargs),)
+        else:
+            ccbmp =\
+                prepareBlobsMultiProbe(self._collectPaths     ,\
+                                       probes                 ,\
+                                       slices[3]              ,\
+                                       pctPadding             ,\
+                                       convertToPhysical      ,\
+                                       condition = condition  ,\
+                                       picklePath = picklePath,\
+                                       )
+            self._probes = []
+            for probe, ccb in zip(probes, ccbmp.getProbes().values()):
+                probeKwargs = self._plotSuperKwargs.copy()
+                probeKwargs.update(\
+                    {"plotType":os.path.join(plotType,\
+                                             "{}-{}-{}".format(*probe))})
+                self._probes.append((ccb, probeKwargs))
+            self._probes = tuple(self._probes)
     #}}}
 
     #{{{driverAll
@@ -800,16 +921,12 @@ class DriverBlobs(DriverSuperClass):
         Wrapper to driverRadialFlux
         """
         #}}}
-        args = (\
-                self._ccb            ,\
-                self._plotSuperKwargs,\
-               )
-        if self._useMultiProcess:
-            processes = Process(target = driverRadialFlux,\
-                                args   = args             )
-            processes.start()
-        else:
-            driverRadialFlux(*args)
+        for ccb, plotSuperKwargs in self._probes:
+            args = (\
+                    ccb            ,\
+                    plotSuperKwargs,\
+                   )
+            self._runTask(driverRadialFlux, args)
     #}}}
 
     #{{{driverWaitingTimePulse
@@ -820,15 +937,10 @@ class DriverBlobs(DriverSuperClass):
         """
         #}}}
 
-        args   = (self._ccb, self._plotSuperKwargs)
-        kwargs = {"normed":self._normed}
-        if self._useMultiProcess:
-            processes = Process(target = driverWaitingTimePulse,\
-                                args   = args                  ,\
-                                kwargs = kwargs)
-            processes.start()
-        else:
-            driverWaitingTimePulse(*args, **kwargs)
+        for ccb, plotSuperKwargs in self._probes:
+            args   = (ccb, plotSuperKwargs)
+            kwargs = {"normed":self._normed}
+            self._runTask(driverWaitingTimePulse, args, kwargs)
     #}}}
 
     #{{{driverBlobTimeTraces
@@ -839,14 +951,9 @@ class DriverBlobs(DriverSuperClass):
         """
         #}}}
 
-        args  = (self._ccb, self._plotSuperKwargs, self._plotAll)
-        if self._useMultiProcess:
-            processes = Process(target = driverBlobTimeTraces,\
-                                args   = args                ,\
-                               )
-            processes.start()
-        else:
-            driverBlobTimeTraces(*args)
+        for ccb, plotSuperKwargs in self._probes:
+            args  = (ccb, plotSuperKwargs, self._plotAll)
+            self._runTask(driverBlobTimeTraces, args)
     #}}}
 
     #{{{driverPlot2DData
@@ -857,21 +964,16 @@ class DriverBlobs(DriverSuperClass):
         """
         #}}}
 
-        args  = (self._ccb            ,\
-                 self._varName        ,\
-                 self._mode           ,\
-                 self._fluct          ,\
-                 self._plotSuperKwargs,\
-                 self._plotAll        ,\
-                 self._phiCont        ,\
-                )
-        if self._useMultiProcess:
-            processes = Process(target = driverPlot2DData,\
-                                args   = args            ,\
-                               )
-            processes.start()
-        else:
-            driverPlot2DData(*args)
+        for ccb, plotSuperKwargs in self._probes:
+            args  = (ccb                  ,\
+                     self._varName        ,\
+                     self._mode           ,\
+                     self._fluct          ,\
+                     plotSuperKwargs      ,\
+                     self._plotAll        ,\
+                     self._phiCont        ,\
+                    )
+            self._runTask(driverPlot2DData, args)
     #}}}
 
     #{{{setMode
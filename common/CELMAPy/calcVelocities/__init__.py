@@ -6,4 +6,5 @@ from .calcVelocities import (\
                              calcPoloidalExBConstZ,\
                              calcRadialExBPoloidal,\
                              calcRadialExBConstRho,\
+                             calcRadialExBFromPhi,\
                              )
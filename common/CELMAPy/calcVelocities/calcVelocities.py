@@ -69,7 +69,8 @@ def calcRadialExBPoloidal(collectPaths, slices,\
     # Calculate the derivative
     DDZPhi = DDZ(phi)
     if mode == "fluct":
-        DDZPhi = (DDZPhi - polAvg(DDZPhi))
+        # NOTE: The derivative is a new array, so it can be updated in-place
+        DDZPhi -= polAvg(DDZPhi, compact=True)
 
     # Obtain B
     omCI = ccf1D.uc.getNormalizationParameter("omCI")
@@ -78,7 +79,8 @@ def calcRadialExBPoloidal(collectPaths, slices,\
 
     # Divide by the Jacobian (rho) as we are in a cylindrical coordinate system
     dh = ccf1D.getDh()
-    radialExB = DDZPhi/(dh.rho[xInd]*B)
+    radialExB  = DDZPhi
+    radialExB /= (dh.rho[xInd]*B)
 
     return radialExB, phiDict.pop("time")
 #}}}
@@ -115,17 +117,12 @@ def calcRadialExBConstRho(collectPaths           ,\
     """
     #}}}
 
+    # NOTE: The step of the slice is dealt with in the collect
     tInd = slicesToIndices(collectPaths[0], tSlice, "t")
 
     # Collect phi
     phi = collectConstRho(collectPaths, "phi", xInd, tInd = tInd)
 
-    # Slice
-    if tSlice is not None:
-        if type(tSlice) == slice:
-            if tSlice.step is not None:
-                phi = phi [::tSlice.step]
-
     # Convert to physical units
     uc = UnitsConverter(collectPaths[0], convertToPhysical)
     convertToPhysical = uc.convertToPhysical
@@ -133,13 +130,45 @@ def calcRadialExBConstRho(collectPaths           ,\
     if convertToPhysical:
         phi = uc.physicalConversion(phi, "phi")
 
+    return calcRadialExBFromPhi(phi, dh.rho[xInd], uc, mode)
+#}}}
+
+#{{{calcRadialExBFromPhi
+def calcRadialExBFromPhi(phi, rho, uc, mode = "fluct"):
+    #{{{docstring
+    """
+    Calculates the radial ExB velocity from an already collected phi
+
+    As the velocity is calculated time point by time point, phi can be a
+    chunk of the full time series.
+
+    Parameters
+    ----------
+    phi : array-4d
+        The potential with the full poloidal extent.
+        Must be in the units given by uc.
+    rho : [float|array]
+        The rho value(s) of phi.
+    uc : UnitsConverter
+        The units converter.
+    mode : ["normal"|"fluct"]
+        Whether to look at fluctuations or normal data
+
+    Returns
+    -------
+    radialExB : array-4d
+        The radial ExB velocity
+    """
+    #}}}
+
     # Calculate the derivative
     DDZPhi = DDZ(phi)
     if mode == "fluct":
-        DDZPhi = (DDZPhi - polAvg(DDZPhi))
+        # NOTE: The derivative is a new array, so it can be updated in-place
+        DDZPhi -= polAvg(DDZPhi, compact=True)
 
     # Obtain B
-    if convertToPhysical:
+    if uc.convertToPhysical:
         omCI = uc.getNormalizationParameter("omCI")
         mi   = uc.getNormalizationParameter("mi")
         B    = omCI*(mi/cst.e)
@@ -147,7 +176,8 @@ def calcRadialExBConstRho(collectPaths           ,\
         B = 1.0
 
     # Divide by the Jacobian (rho) as we are in a cylindrical coordinate system
-    radialExB = DDZPhi/(dh.rho[xInd]*B)
+    radialExB  = DDZPhi
+    radialExB /= (rho*B)
 
     return radialExB
 #}}}
@@ -200,7 +230,8 @@ def calcPoloidalExBConstZ(collectPaths, slices,\
     dh = ccf1D.getDh()
     DDXPhi = DDX(phi, dh.dx)
     if mode == "fluct":
-        DDXPhi = (DDXPhi - polAvg(DDXPhi))
+        # NOTE: The derivative is a new array, so it can be updated in-place
+        DDXPhi -= polAvg(DDXPhi, compact=True)
 
     # Obtain B
     omCI = ccf1D.uc.getNormalizationParameter("omCI")
@@ -208,7 +239,8 @@ def calcPoloidalExBConstZ(collectPaths, slices,\
     B    = omCI*(mi/cst.e)
 
     # Divide by the Jacobian (rho) as we are in a cylindrical coordinate system
-    poloidalExB = -DDXPhi/B
+    poloidalExB  = DDXPhi
+    poloidalExB /= -B
 
     return poloidalExB, phiDict.pop("time")
 #}}}
@@ -3,6 +3,7 @@
 """ Init for the collect and calc helpers package """
 
 from .averages import polAvg, timeAvg
+from .collectCache import CollectCache, setCollectCache, getCollectCache
 from .derivatives import (DDX, DDY, DDZ,\
                           collectSteadyN,\
                           findLargestRadialGrad,\
@@ -10,6 +11,8 @@ from .derivatives import (DDX, DDY, DDZ,\
                           findLargestPoloidalGrad,\
                           findLargestRadialGradN)
 from .dimensionHelper import DimensionsHelper
+from .dumpIndex import getDumpIndex
+from .dumpReader import multiCollect, setCollectWorkers, getCollectWorkers
 from .gridSizes import (getGridSizes,\
                         getUniformSpacing,\
                         getEvenlySpacedIndices,\
@@ -19,6 +22,7 @@ from .integrators import (parallelIntegration,\
                           poloidalIntegration,\
                           radialIntegration)
 from .improvedCollect import (safeCollect, collectiveCollect,\
+                              collectiveCollectChunks, getChunkTIndices,\
                               collectTime, collectPoint,\
                               collectParallelProfile, collectPoloidalProfile,\
                               collectRadialProfile,\
@@ -26,7 +30,14 @@ from .improvedCollect import (safeCollect, collectiveCollect,\
                               )
 from .linRegOfExp import linRegOfExp
 from .meshHelper import addLastThetaSlice, get2DMesh
+from .memoryUsage import resetPeakRSS, getRSS
 from .nonSolvedVariables import calcN, calcUIPar, calcUEPar
-from .scanHelpers import getScanValue
+from .runningHistogram import RunningHistogram
+from .runningMoments import RunningMoments
+from .runningPSD import RunningPSD
+from .scanHelpers import (getScanValue,\
+                          mapScan,\
+                          setScanWorkers,\
+                          getScanWorkers)
 from .slicesToIndices import slicesToIndices
 from .tSize import getTSize
@@ -7,7 +7,7 @@ Contains functions for taking poloidal averages
 import numpy as np
 
 #{{{polAvg
-def polAvg(f):
+def polAvg(f, compact = False):
     #{{{docstring
     """
     Returns the poloidal average of a field.
@@ -18,6 +18,11 @@ def polAvg(f):
         The field to find the poloidal average of.
         The field must be a 4D field, and should not include the last
         poloidal slice (i.e. the domain should go from [0,2pi[)
+    compact : bool
+        If True, the average is returned with a poloidal dimension of
+        length 1, which broadcasts against f.
+        This saves memory when the average is only used to calculate the
+        fluctuations.
 
     Returns
     -------
@@ -26,13 +31,10 @@ def polAvg(f):
     """
     #}}}
 
-    tLen, xLen, yLen, zLen = f.shape
-    out = np.zeros(f.shape)
+    out = f.mean(axis=3, keepdims=True)
 
-    for t in range(tLen):
-        for x in range(xLen):
-            for y in range(yLen):
-                out[t,x,y,:] = f[t,x,y,:].mean()
+    if not(compact):
+        out = np.broadcast_to(out, f.shape).copy()
 
     return out
 #}}}
@@ -90,9 +92,6 @@ def timeAvg(f, t = None, startInd = 0, endInd = -1):
         raise ValueError("Must have endInd>startInd")
 
     tLenOut = int(np.floor((tLen-1)/(endInd - startInd)))
-    outDim  = (tLenOut, xLen, yLen, zLen)
-
-    outF = np.zeros(outDim)
 
     if t is not None:
         outT = np.zeros(tLenOut)
@@ -103,14 +102,18 @@ def timeAvg(f, t = None, startInd = 0, endInd = -1):
 
         outT = np.array(range(startTAvgInd, endTAvgInd))
 
-    for avgTInd in range(tLenOut):
-        tStart = startInd + avgTInd
-        tEnd   = endInd   + avgTInd
-        for x in range(xLen):
-            for y in range(yLen):
-                for z in range(zLen):
-                    # +1 as slicing does not include last point
-                    outF[avgTInd,x,y,z] = f[tStart:tEnd+1,x,y,z].mean()
+    # The sliding windows are found from the cumulative sum
+    # NOTE: The windows are truncated at the end of the time series
+    tStarts = np.minimum(startInd + np.arange(tLenOut), tLen)
+    # +1 as slicing does not include last point
+    tEnds   = np.minimum(endInd + 1 + np.arange(tLenOut), tLen)
+
+    cumSum = np.zeros((tLen+1, xLen, yLen, zLen))
+    np.cumsum(f, axis=0, out=cumSum[1:])
+
+    counts = (tEnds - tStarts)[:, np.newaxis, np.newaxis, np.newaxis]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        outF = (cumSum[tEnds] - cumSum[tStarts])/counts
 
     if t is not None:
         return outF, outT
@@ -0,0 +1,273 @@
+#!/usr/bin/env python
+
+"""
+Contains a persistent on-disk cache for the collected variables
+"""
+
+from glob import glob
+import hashlib
+import numpy as np
+import os
+
+# Environment variables used to configure the cache. These are
+# inherited by sub processes (and forwarded by the PBSSubmitter), so
+# that separate jobs can share the same cache
+cacheDirEnv     = "CELMAPY_CACHE_DIR"
+cacheMaxSizeEnv = "CELMAPY_CACHE_MAX_SIZE"
+
+#{{{CollectCache
+class CollectCache(object):
+    """
+    Class which stores collected slabs on disk.
+
+    The slabs are content-addressed, i.e. the key is made from the size
+    and modification time of the dump files, the variable name and the
+    collect arguments. A rerun of the simulation therefore invalidates
+    the cached slabs automatically.
+
+    The least recently used slabs are evicted when the total size of the
+    cache exceeds maxSize.
+    """
+
+    #{{{constructor
+    def __init__(self, cacheDir, maxSize = 10*1024**3):
+        #{{{docstring
+        """
+        Constructor for the CollectCache.
+
+        Parameters
+        ----------
+        cacheDir : str
+            Directory to store the slabs in. Created if not present.
+        maxSize : int
+            Maximum size of the cache in bytes.
+        """
+        #}}}
+
+        self._cacheDir = cacheDir
+        self._maxSize  = int(maxSize)
+
+        # Make dir if not exists
+        if not os.path.exists(cacheDir):
+            os.makedirs(cacheDir, exist_ok=True)
+    #}}}
+
+    #{{{makeKey
+    def makeKey(self, path, varName, **collectKwargs):
+        #{{{docstring
+        """
+        Makes the content-addressed key of a slab.
+
+        Parameters
+        ----------
+        path : str
+            The path to collect from.
+        varName : str
+            The variable to collect.
+        **collectKwargs : keyword arguments
+            The index ranges and the ghost flags given to collect.
+
+        Returns
+        -------
+        key : str
+            The hex digest of the key.
+        """
+        #}}}
+
+        # The dump files identifies the content of the path
+        dmpFiles = sorted(glob(os.path.join(path, "BOUT.dmp.*.nc")))
+        fileStamps = []
+        for dmpFile in dmpFiles:
+            stat = os.stat(dmpFile)
+            fileStamps.append((os.path.basename(dmpFile),\
+                               stat.st_size,\
+                               stat.st_mtime_ns))
+
+        # Info does not alter the collected data
+        collectKwargs.pop("info", None)
+        # Sort in order to make the key independent of the kwarg order
+        collectArgs = tuple(sorted((key, repr(val)) for key, val in\
+                                   collectKwargs.items()))
+
+        keyString = repr((os.path.abspath(path),\
+                          tuple(fileStamps),\
+                          varName,\
+                          collectArgs))
+
+        return hashlib.sha1(keyString.encode("utf-8")).hexdigest()
+    #}}}
+
+    #{{{load
+    def load(self, key):
+        #{{{docstring
+        """
+        Loads a slab from the cache.
+
+        Parameters
+        ----------
+        key : str
+            The key obtained from makeKey.
+
+        Returns
+        -------
+        data : [None|array]
+            None if the key is not present in the cache.
+            Else the cached array (which is not writeable).
+        """
+        #}}}
+
+        fileName = self._getFileName(key)
+
+        try:
+            data = np.load(fileName)
+        except (OSError, ValueError):
+            # Not present, or removed by another process in the mean time
+            return None
+
+        # Mark as recently used
+        try:
+            os.utime(fileName)
+        except OSError:
+            pass
+
+        # write = False prevents writing
+        data.setflags(write=False)
+
+        return data
+    #}}}
+
+    #{{{store
+    def store(self, key, data):
+        #{{{docstring
+        """
+        Stores a slab in the cache, and evicts old slabs if needed.
+
+        Parameters
+        ----------
+        key : str
+            The key obtained from makeKey.
+        data : array
+            The array to store.
+        """
+        #}}}
+
+        data = np.asarray(data)
+
+        if data.nbytes > self._maxSize:
+            # The slab would evict the whole cache
+            return
+
+        fileName = self._getFileName(key)
+        # Write to a temporary file first, so that other processes never
+        # read a half written slab
+        tmpName  = "{}.{}.tmp".format(fileName, os.getpid())
+        with open(tmpName, "wb") as f:
+            np.save(f, data)
+        os.replace(tmpName, fileName)
+
+        self._evict()
+    #}}}
+
+    #{{{clear
+    def clear(self):
+        """
+        Removes all the slabs in the cache
+        """
+
+        for fileName in glob(os.path.join(self._cacheDir, "*.npy")):
+            try:
+                os.remove(fileName)
+            except FileNotFoundError:
+                pass
+    #}}}
+
+    #{{{_getFileName
+    def _getFileName(self, key):
+        """
+        Returns the file name of the slab with the given key
+        """
+
+        return os.path.join(self._cacheDir, "{}.npy".format(key))
+    #}}}
+
+    #{{{_evict
+    def _evict(self):
+        #{{{docstring
+        """
+        Removes the least recently used slabs until the size of the cache
+        is within maxSize.
+        """
+        #}}}
+
+        entries = []
+        for fileName in glob(os.path.join(self._cacheDir, "*.npy")):
+            try:
+                stat = os.stat(fileName)
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, fileName))
+
+        totalSize = sum(entry[1] for entry in entries)
+
+        # Oldest first
+        for _, size, fileName in sorted(entries):
+            if totalSize <= self._maxSize:
+                break
+            try:
+                os.remove(fileName)
+            except FileNotFoundError:
+                pass
+            totalSize -= size
+    #}}}
+#}}}
+
+#{{{setCollectCache
+def setCollectCache(cacheDir, maxSize = 10*1024**3):
+    #{{{docstring
+    """
+    Enables (or disables) the collect cache.
+
+    The settings are stored as environment variables, so that they are
+    inherited by sub processes.
+
+    Parameters
+    ----------
+    cacheDir : [None|str]
+        Directory to store the slabs in.
+        If None, the cache is disabled.
+    maxSize : int
+        Maximum size of the cache in bytes.
+    """
+    #}}}
+
+    if cacheDir is None:
+        os.environ.pop(cacheDirEnv, None)
+        os.environ.pop(cacheMaxSizeEnv, None)
+    else:
+        os.environ[cacheDirEnv]     = os.path.abspath(cacheDir)
+        os.environ[cacheMaxSizeEnv] = str(int(maxSize))
+#}}}
+
+#{{{getCollectCache
+def getCollectCache():
+    #{{{docstring
+    """
+    Returns the collect cache if it is enabled.
+
+    Returns
+    -------
+    cache : [None|CollectCache]
+        None if the cache is disabled.
+    """
+    #}}}
+
+    cacheDir = os.environ.get(cacheDirEnv)
+    if cacheDir is None:
+        return None
+
+    maxSize = os.environ.get(cacheMaxSizeEnv)
+    if maxSize is None:
+        return CollectCache(cacheDir)
+    else:
+        return CollectCache(cacheDir, int(maxSize))
+#}}}
@@ -4,16 +4,14 @@
 Contains derivative functions
 """
 
+from .dumpIndex import getDumpIndex
 from .gridSizes import getUniformSpacing
 from .nonSolvedVariables import calcN
-from boututils.datafile import DataFile
 from boutdata import collect
 import numpy as np
-from scipy.fftpack import diff
-import os
 
 #{{{DDX
-def DDX(var, dx):
+def DDX(var, dx, out = None):
     #{{{docstring
     """
     Calculates the first rho-derivative of a profile using a second order
@@ -25,6 +23,10 @@ def DDX(var, dx):
         Variable to take the first derivative of
     dx : [array-1d, float]
         The grid spacing in x for the different evaluation points
+    out : [None|array-4d]
+        Preallocated array to store the result in.
+        Must have the same shape as var, and must not be var.
+        If dx is a float, the stencil is written directly into out.
 
     Returns
     -------
@@ -35,22 +37,12 @@ def DDX(var, dx):
     if len(var.shape) != 4:
        raise ValueError("Input variable must be 4-dimensional")
 
-    tLen, _, yLen, zLen = var.shape
-
-    out = np.zeros(var.shape)
-
-    for tInd in range(tLen):
-        for yInd in range(yLen):
-            for zInd in range(zLen):
-                # 2nd order scheme
-                out[tInd, :, yInd, zInd] =\
-                    np.gradient(var[tInd, :, yInd, zInd], dx, edge_order=2)
-
-    return out
+    # 2nd order scheme
+    return _secondOrderGrad(var, dx, 1, out)
 #}}}
 
 #{{{DDY
-def DDY(var, dy):
+def DDY(var, dy, out = None):
     """
     Calculates the first parallel-derivative of a profile using a second order
     stencil (assuming that we are using cylinder geometry).
@@ -62,6 +54,10 @@ def DDY(var, dy):
         points)
     dy : array
         The grid spacing in x for the different evaluation points
+    out : [None|array]
+        Preallocated array to store the result in.
+        Must have the same shape as var, and must not be var.
+        If dy is a float, the stencil is written directly into out.
 
     Returns
     -------
@@ -71,22 +67,12 @@ def DDY(var, dy):
     if len(var.shape) != 4:
        raise ValueError("Input variable must be 4-dimensional")
 
-    tLen, xLen, _, zLen = var.shape
-
-    out = np.zeros(var.shape)
-
-    for tInd in range(tLen):
-        for xInd in range(xLen):
-            for zInd in range(zLen):
-                # 2nd order scheme
-                out[tInd, xInd, :, zInd] =\
-                    np.gradient(var[tInd, xInd, :, zInd], dy, edge_order=2)
-
-    return out
+    # 2nd order scheme
+    return _secondOrderGrad(var, dy, 2, out)
 #}}}
 
 #{{{DDZ
-def DDZ(var):
+def DDZ(var, out = None):
     #{{{docstring
     """
     Calculates the first theta-derivative of a profile using spectral
@@ -99,8 +85,11 @@ def DDZ(var):
     ----------
     var : array
         The variable to take the z-derivative of
-    J : array
-        The Jacobian
+    out : [None|array]
+        Preallocated array to store the result in.
+        Must have the same shape as var.
+        NOTE: The spectrum is still a temporary array, only the
+              inverse transform is written directly into out.
 
     Returns
     -------
@@ -111,15 +100,96 @@ def DDZ(var):
     if len(var.shape) != 4:
        raise ValueError("Input variable must be 4-dimensional")
 
-    tLen, xLen, yLen, _ = var.shape
+    zLen = var.shape[-1]
+
+    # The wavenumbers are the same for all the poloidal pencils
+    ik = 1j*np.arange(zLen//2 + 1)
+    if zLen % 2 == 0:
+        # The Nyquist mode has no well defined odd derivative
+        ik[-1] = 0
+
+    # Float32 input is kept as float32
+    if not(np.issubdtype(var.dtype, np.floating)):
+        var = var.astype(float)
+    ik = ik.astype(np.result_type(var.dtype, 1j))
+
+    spectrum  = np.fft.rfft(var, axis=-1)
+    spectrum *= ik
 
-    out = np.zeros(var.shape)
+    if out is None:
+        return np.fft.irfft(spectrum, n=zLen, axis=-1)
+
+    if np.lib.NumpyVersion(np.__version__) >= "2.0.0":
+        np.fft.irfft(spectrum, n=zLen, axis=-1, out=out)
+    else:
+        # NOTE: irfft only accepts out from numpy 2.0
+        out[...] = np.fft.irfft(spectrum, n=zLen, axis=-1)
+
+    return out
+#}}}
+
+#{{{_secondOrderGrad
+def _secondOrderGrad(var, h, axis, out):
+    #{{{docstring
+    """
+    Second order central differences with second order one sided
+    differences at the edges (as numpy.gradient with edge_order=2).
+
+    Parameters
+    ----------
+    var : array
+        The variable to differentiate.
+    h : [float|array-1d]
+        The grid spacing, or the coordinates along the axis.
+    axis : int
+        The axis to differentiate along.
+    out : [None|array]
+        Preallocated array to store the result in.
+        If h is a float, the differences are written directly into out,
+        otherwise the result of numpy.gradient is copied into out.
+
+    Returns
+    -------
+    out : array
+        The derivative of var along axis.
+    """
+    #}}}
 
-    for tInd in range(tLen):
-        for xInd in range(xLen):
-            for yInd in range(yLen):
-                out[tInd, xInd, yInd, :] =\
-                    diff(var[tInd, xInd, yInd, :])
+    if np.ndim(h) != 0:
+        # Non-uniform coordinates are left to numpy
+        grad = np.gradient(var, h, axis=axis, edge_order=2)
+        if out is None:
+            return grad
+        out[...] = grad
+        return out
+
+    if var.shape[axis] < 3:
+        message = ("Shape of the array along axis {} is too small to "
+                   "calculate the gradient, at least 3 elements are "
+                   "required").format(axis)
+        raise ValueError(message)
+
+    if out is None:
+        # Float32 input is kept as float32 (as in numpy.gradient)
+        dtype = var.dtype if np.issubdtype(var.dtype, np.floating)\
+                else np.float64
+        out = np.empty(var.shape, dtype=dtype)
+
+    def sl(start, stop = None):
+        """Slices var and out along axis"""
+        slices = [slice(None)]*var.ndim
+        slices[axis] = slice(start, stop)
+        return tuple(slices)
+
+    # Central differences in the interior
+    np.subtract(var[sl(2, None)], var[sl(None, -2)], out=out[sl(1, -1)])
+    # One sided differences at the edges
+    out[sl(0, 1)] =\
+        -3*var[sl(0, 1)]   + 4*var[sl(1, 2)]   - var[sl(2, 3)]
+    out[sl(-1, None)] =\
+         3*var[sl(-1, None)] - 4*var[sl(-2, -1)] + var[sl(-3, -2)]
+
+    out /= 2*h
 
     return out
 #}}}
@@ -279,8 +349,7 @@ def collectSteadyN(steadyStatePath, yInd):
     #}}}
 
     # Check last t index
-    with DataFile(os.path.join(steadyStatePath, "BOUT.dmp.0.nc")) as f:
-        tLast = len(f.read("t_array")) - 1
+    tLast = len(getDumpIndex(steadyStatePath)["t_array"]) - 1
 
     # In the steady state, the max gradient in "n" is the same
     # throughout in the domain, so we use yInd=0, zInd=0 in the
@@ -0,0 +1,219 @@
+#!/usr/bin/env python
+
+"""
+Contains an index of the metadata of the dump files in a folder
+"""
+
+from boututils.datafile import DataFile
+from glob import glob
+import numpy as np
+import os
+import pickle
+import re
+
+# Name of the sidecar file which stores the index in the dump folder
+indexFileName = ".CELMAPyDumpIndex.pickle"
+
+# Indices already read by this process
+_indices = {}
+
+#{{{getDumpIndex
+def getDumpIndex(path):
+    #{{{docstring
+    """
+    Returns the metadata index of a dump folder.
+
+    The index is built from BOUT.dmp.0.nc the first time it is needed,
+    and is stored in a sidecar file in the folder, so that later calls
+    (also from other processes) do not need to open the dump files.
+    The index is rebuilt if the size or the modification time of any of
+    the dump files changes.
+
+    Parameters
+    ----------
+    path : str
+        The dump folder.
+
+    Returns
+    -------
+    index : dict
+        Dictionary with the keys
+            * "dmpFiles" - The dump file names sorted by processor number
+            * "stamps"   - The name, size and modification time of the
+                           dump files
+            * "t_array"  - The time array of the folder
+            * "MXG", "MYG", "MXSUB", "MYSUB", "NXPE", "NYPE", "MZ" -
+                           The processor layout
+            * "nz"       - The number of z points
+            * "dx", "dy" - The grid spacings of the first processor
+                           (None if not present)
+            * "dz"       - The grid spacing in z (None if not present)
+            * "dims"     - Dictionary of the dimensions of the variables
+            * "sizes"    - Dictionary of the shape of the variables in
+                           the first processor file
+            * "scalars"  - Dictionary of the values of the variables
+                           without dimensions
+        The index must not be altered.
+    """
+    #}}}
+
+    absPath  = os.path.abspath(path)
+    dmpFiles = getDmpFiles(absPath)
+    stamps   = _getStamps(dmpFiles)
+
+    # Look up the index of this process
+    index = _indices.get(absPath)
+    if index is not None and index["stamps"] == stamps:
+        return index
+
+    # Look up the sidecar file
+    index = _loadIndex(absPath)
+    if index is None or index["stamps"] != stamps:
+        index = _buildIndex(dmpFiles, stamps)
+        _storeIndex(absPath, index)
+
+    # The arrays are shared between the callers
+    for key in ("t_array", "dx", "dy"):
+        if index[key] is not None:
+            # write = False prevents writing
+            index[key].setflags(write=False)
+    for scalar in index["scalars"].values():
+        scalar.setflags(write=False)
+
+    _indices[absPath] = index
+
+    return index
+#}}}
+
+#{{{getDmpFiles
+def getDmpFiles(path):
+    #{{{docstring
+    """
+    Returns the dump files of a path sorted by the processor number.
+
+    Parameters
+    ----------
+    path : str
+        The path to search in.
+
+    Returns
+    -------
+    fileList : list
+        The sorted dump files.
+    """
+    #}}}
+
+    fileList = glob(os.path.join(path, "BOUT.dmp.*.nc"))
+
+    if len(fileList) == 0:
+        raise OSError("No BOUT.dmp.*.nc files found in {}".format(path))
+
+    # Sort numerically, so that BOUT.dmp.10.nc comes after BOUT.dmp.9.nc
+    procNr = lambda fileName:\
+            int(re.search(r"BOUT\.dmp\.(\d+)\.nc$", fileName).group(1))
+
+    return sorted(fileList, key=procNr)
+#}}}
+
+#{{{_getStamps
+def _getStamps(dmpFiles):
+    """
+    Returns the name, size and modification time of the dump files
+    """
+
+    stamps = []
+    for dmpFile in dmpFiles:
+        stat = os.stat(dmpFile)
+        stamps.append((os.path.basename(dmpFile),\
+                       stat.st_size,\
+                       stat.st_mtime_ns))
+
+    return tuple(stamps)
+#}}}
+
+#{{{_buildIndex
+def _buildIndex(dmpFiles, stamps):
+    #{{{docstring
+    """
+    Builds the index from the first dump file.
+
+    Parameters
+    ----------
+    dmpFiles : list
+        The sorted dump files.
+    stamps : tuple
+        The stamps obtained from _getStamps.
+
+    Returns
+    -------
+    index : dict
+        The index. See getDumpIndex for details.
+    """
+    #}}}
+
+    index = {"dmpFiles" : tuple(os.path.basename(dmpFile)\
+                                for dmpFile in dmpFiles),\
+             "stamps"   : stamps,\
+             "dims"     : {},\
+             "sizes"    : {},\
+             "scalars"  : {},\
+            }
+
+    with DataFile(dmpFiles[0]) as f:
+        for varName in f.list():
+            dims = f.dimensions(varName)
+            dims = tuple(dims) if dims is not None else ()
+            index["dims"] [varName] = dims
+            index["sizes"][varName] = tuple(f.size(varName) or ())
+            if len(dims) == 0:
+                index["scalars"][varName] = np.array(f.read(varName))
+
+        index["t_array"] = np.atleast_1d(f.read("t_array"))
+        for key in ("dx", "dy"):
+            index[key] = f.read(key) if key in index["dims"] else None
+
+    scalars = index["scalars"]
+    for key in ("MXG", "MYG", "MXSUB", "MYSUB", "NXPE", "NYPE", "MZ"):
+        index[key] = int(scalars[key])
+    index["dz"] = scalars["dz"] if "dz" in scalars else None
+
+    # Older versions of BOUT++ stores an extra z point
+    version = scalars.get("BOUT_VERSION")
+    index["nz"] =\
+        index["MZ"] - 1 if (version is None or version < 3.5) else index["MZ"]
+
+    return index
+#}}}
+
+#{{{_loadIndex
+def _loadIndex(path):
+    """
+    Loads the index from the sidecar file (None if not present)
+    """
+
+    try:
+        with open(os.path.join(path, indexFileName), "rb") as f:
+            return pickle.load(f)
+    except Exception:
+        # Not present, or written by an incompatible version
+        return None
+#}}}
+
+#{{{_storeIndex
+def _storeIndex(path, index):
+    """
+    Stores the index in the sidecar file (if the folder is writeable)
+    """
+
+    fileName = os.path.join(path, indexFileName)
+    # Write to a temporary file first, so that other processes never
+    # read a half written index
+    tmpName  = "{}.{}.tmp".format(fileName, os.getpid())
+    try:
+        with open(tmpName, "wb") as f:
+            pickle.dump(index, f)
+        os.replace(tmpName, fileName)
+    except OSError:
+        # The folder is read only, the index is only kept in memory
+        pass
+#}}}
@@ -0,0 +1,478 @@
+#!/usr/bin/env python
+
+"""
+Contains a reader which collects several variables from the BOUT++ dump
+files in one pass
+"""
+
+from .dumpIndex import getDumpIndex
+from boututils.datafile import DataFile
+from multiprocessing import Pool, current_process
+import numpy as np
+import os
+
+# Environment variable used to configure the number of processes used
+# when reading the dump files. This is inherited by sub processes (and
+# forwarded by the PBSSubmitter)
+collectWorkersEnv = "CELMAPY_COLLECT_WORKERS"
+
+#{{{multiCollect
+def multiCollect(varNames                ,\
+                 path                    ,\
+                 tind            = None  ,\
+                 xind            = None  ,\
+                 yind            = None  ,\
+                 zind            = None  ,\
+                 xguards         = False ,\
+                 yguards         = False ,\
+                 nWorkers        = None  ,\
+                 ):
+    #{{{docstring
+    """
+    Collects several variables from the dump files in a path.
+
+    Unlike collect, each BOUT.dmp.<proc>.nc file is opened only once,
+    and all the requested variables are read while the file is open.
+    The processor files can be read in parallel by a pool of processes.
+
+    Parameters
+    ----------
+    varNames : iterable of strings
+        The variables to collect.
+    path : str
+        The path to collect from.
+    tind : [None|sequence|slice]
+        Time indices to collect.
+        If a sequence: The start and the end (inclusive).
+        If a slice: Python slicing (this can be used for strides).
+    xind : [None|sequence]
+        Start and end (inclusive) of the x indices to collect.
+    yind : [None|sequence]
+        Start and end (inclusive) of the y indices to collect.
+    zind : [None|sequence]
+        Start and end (inclusive) of the z indices to collect.
+    xguards : bool
+        If the ghost points in x should be collected.
+    yguards : bool
+        If the ghost points in y should be collected.
+    nWorkers : [None|int]
+        Number of processes reading the processor files.
+        If None, the number set by setCollectWorkers is used.
+
+    Returns
+    -------
+    data : dict
+        Dictionary of the collected variables.
+        The arrays are not writeable.
+    """
+    #}}}
+
+    index    = getDumpIndex(path)
+    fileList = tuple(os.path.join(path, fileName)\
+                     for fileName in index["dmpFiles"])
+
+    layout = getLayout(path, varNames)
+
+    # Convert to slices
+    tind = toSlice(tind, layout["nt"], "tind")
+    xind = toSlice(xind, layout["nx"] + (2*layout["mxg"] if xguards else 0),\
+                   "xind")
+    yind = toSlice(yind, layout["ny"] + (2*layout["myg"] if yguards else 0),\
+                   "yind")
+    zind = toSlice(zind, layout["nz"], "zind")
+
+    sizes = {"t" : len(range(tind.start, tind.stop, tind.step)),\
+             "x" : xind.stop - xind.start                      ,\
+             "y" : yind.stop - yind.start                      ,\
+             "z" : zind.stop - zind.start                      ,\
+            }
+
+    # Initialize the data
+    data = {}
+    for varName in varNames:
+        dims = layout["dims"][varName]
+        data[varName] = np.empty(tuple(sizes[dim] for dim in dims))
+
+    # Variables without dimensions are found in the index
+    for varName in varNames:
+        if len(layout["dims"][varName]) == 0:
+            data[varName] = np.array(index["scalars"][varName])
+
+    # Variables only depending on time are only read from the first file
+    timeVars = tuple(varName for varName in varNames\
+                     if layout["dims"][varName] == ("t",))
+    if len(timeVars) > 0:
+        with DataFile(fileList[0]) as f:
+            for varName in timeVars:
+                data[varName] = f.read(varName, ranges=[tind])
+
+    spatialVars = tuple(varName for varName in varNames\
+                        if ("x" in layout["dims"][varName]))
+
+    if len(spatialVars) > 0:
+        # Find the files which are needed
+        jobs = []
+        for procNr in range(len(fileList)):
+            procRanges =\
+                getProcRanges(procNr, layout, xind, yind, xguards, yguards)
+            if procRanges is None:
+                # The file is not needed
+                continue
+            jobs.append((fileList[procNr], spatialVars, layout,\
+                         procRanges, tind, zind))
+
+        if nWorkers is None:
+            nWorkers = getCollectWorkers()
+        # NOTE: Daemonic processes (like the workers of a Pool) are not
+        #       allowed to have children
+        if nWorkers > 1 and len(jobs) > 1 and not(current_process().daemon):
+            with Pool(min(nWorkers, len(jobs))) as pool:
+                # NOTE: imap returns the parts as they are read, so that
+                #       they can be assembled while the rest are read
+                parts = pool.imap(_readProcFileJob, jobs)
+                assembleParts(jobs, parts, layout, xind, yind, data)
+        else:
+            parts = map(_readProcFileJob, jobs)
+            assembleParts(jobs, parts, layout, xind, yind, data)
+
+    for varName in varNames:
+        # write = False prevents writing
+        data[varName].setflags(write=False)
+
+    return data
+#}}}
+
+#{{{readProcFile
+def readProcFile(fileName, varNames, layout, procRanges, tind, zind):
+    #{{{docstring
+    """
+    Reads the variables from one processor file.
+
+    Parameters
+    ----------
+    fileName : str
+        The processor file.
+    varNames : tuple
+        The variables to read. Must have spatial dimensions.
+    layout : dict
+        The layout obtained from getLayout.
+    procRanges : tuple
+        The local and global ranges obtained from getProcRanges.
+    tind : slice
+        The time slice.
+    zind : slice
+        The z slice.
+
+    Returns
+    -------
+    part : dict
+        Dictionary of the local part of the variables.
+    """
+    #}}}
+
+    xLocal, yLocal, _, _ = procRanges
+
+    rangesMap = {"t":tind, "x":xLocal, "y":yLocal, "z":zind}
+
+    part = {}
+    with DataFile(fileName) as f:
+        for varName in varNames:
+            dims = layout["dims"][varName]
+            part[varName] =\
+                f.read(varName, ranges=[rangesMap[dim] for dim in dims])
+
+    return part
+#}}}
+
+#{{{assembleParts
+def assembleParts(jobs, parts, layout, xind, yind, data):
+    #{{{docstring
+    """
+    Copies the parts read from the processor files into the global arrays.
+
+    Parameters
+    ----------
+    jobs : list
+        The arguments given to readProcFile.
+    parts : iterable
+        The parts returned from readProcFile (in the same order as jobs).
+    layout : dict
+        The layout obtained from getLayout.
+    xind : slice
+        The global x slice.
+    yind : slice
+        The global y slice.
+    data : dict
+        Dictionary of the global arrays which will be written to.
+    """
+    #}}}
+
+    for job, part in zip(jobs, parts):
+        _, varNames, _, procRanges, _, _ = job
+        _, _, xGlobal, yGlobal = procRanges
+
+        # Position in the output arrays
+        xOut = slice(xGlobal.start - xind.start, xGlobal.stop - xind.start)
+        yOut = slice(yGlobal.start - yind.start, yGlobal.stop - yind.start)
+        outMap = {"t":slice(None), "x":xOut, "y":yOut, "z":slice(None)}
+
+        for varName in varNames:
+            dims = layout["dims"][varName]
+            data[varName][tuple(outMap[dim] for dim in dims)] = part[varName]
+#}}}
+
+#{{{_readProcFileJob
+def _readProcFileJob(job):
+    """
+    Unpacks the job arguments to readProcFile (used by the pool)
+    """
+
+    return readProcFile(*job)
+#}}}
+
+#{{{getLayout
+def getLayout(path, varNames):
+    #{{{docstring
+    """
+    Returns the processor layout and the dimensions of the variables.
+
+    Parameters
+    ----------
+    path : str
+        The dump folder.
+    varNames : iterable of strings
+        The variables to get the dimensions of.
+
+    Returns
+    -------
+    layout : dict
+        Dictionary with the keys
+            * "mxsub", "mysub" - The number of inner points per processor
+            * "mxg", "myg"     - The number of ghost points
+            * "nxpe", "nype"   - The number of processors in x and y
+            * "nx", "ny", "nz" - The global number of inner points
+            * "nt"             - The number of time points
+            * "dims"           - Dictionary of the dimensions of the
+                                 variables
+    """
+    #}}}
+
+    index = getDumpIndex(path)
+
+    layout = {}
+    for key in ("MXSUB", "MYSUB", "MXG", "MYG", "NXPE", "NYPE"):
+        layout[key.lower()] = index[key]
+    layout["nz"] = index["nz"]
+    layout["nt"] = len(index["t_array"])
+
+    layout["dims"] = {}
+    for varName in varNames:
+        # NOTE: The message is the same as the one raised by collect
+        if not(varName in index["dims"]):
+            raise ValueError("Variable '{}' not found in {}".\
+                             format(varName, path))
+        layout["dims"][varName] = index["dims"][varName]
+
+    layout["nx"] = layout["mxsub"]*layout["nxpe"]
+    layout["ny"] = layout["mysub"]*layout["nype"]
+
+    return layout
+#}}}
+
+#{{{getProcRanges
+def getProcRanges(procNr, layout, xind, yind, xguards, yguards):
+    #{{{docstring
+    """
+    Finds the local and global ranges of a processor file.
+
+    Parameters
+    ----------
+    procNr : int
+        The processor number.
+    layout : dict
+        The layout obtained from getLayout.
+    xind : slice
+        The global x slice.
+    yind : slice
+        The global y slice.
+    xguards : bool
+        If the ghost points in x are collected.
+    yguards : bool
+        If the ghost points in y are collected.
+
+    Returns
+    -------
+    procRanges : [None|tuple]
+        None if the processor does not contain any of the requested
+        points.
+        Else a tuple of the slices (xLocal, yLocal, xGlobal, yGlobal).
+    """
+    #}}}
+
+    peX = procNr % layout["nxpe"]
+    peY = procNr // layout["nxpe"]
+
+    xRanges = getLocalRange(peX, layout["nxpe"], layout["mxsub"],\
+                            layout["mxg"], xind, xguards)
+    yRanges = getLocalRange(peY, layout["nype"], layout["mysub"],\
+                            layout["myg"], yind, yguards)
+
+    if xRanges is None or yRanges is None:
+        return None
+
+    xLocal, xGlobal = xRanges
+    yLocal, yGlobal = yRanges
+
+    return xLocal, yLocal, xGlobal, yGlobal
+#}}}
+
+#{{{getLocalRange
+def getLocalRange(pe, nPe, nSub, nGuard, ind, guards):
+    #{{{docstring
+    """
+    Finds the local and the global range of one processor in one
+    direction.
+
+    Parameters
+    ----------
+    pe : int
+        The processor index in this direction.
+    nPe : int
+        Number of processors in this direction.
+    nSub : int
+        Number of inner points per processor.
+    nGuard : int
+        Number of ghost points.
+    ind : slice
+        The requested global slice.
+    guards : bool
+        If the global slice includes the ghost points.
+
+    Returns
+    -------
+    ranges : [None|tuple]
+        None if the processor is out of range.
+        Else the local and the global slice.
+    """
+    #}}}
+
+    # Offset between the global indices and the local indices
+    offset = pe*nSub - (0 if guards else nGuard)
+
+    # Local points owned by the processor
+    # The boundary processors own the boundary ghost points if collected
+    ownStart = nGuard
+    ownStop  = nSub + nGuard
+    if guards:
+        if pe == 0:
+            ownStart = 0
+        if pe == nPe - 1:
+            ownStop = nSub + 2*nGuard
+
+    start = max(ind.start - offset, ownStart)
+    stop  = min(ind.stop  - offset, ownStop)
+
+    if start >= stop:
+        return None
+
+    return slice(start, stop), slice(start + offset, stop + offset)
+#}}}
+
+#{{{toSlice
+def toSlice(ind, n, name):
+    #{{{docstring
+    """
+    Converts a collect-like index range to a slice.
+
+    Parameters
+    ----------
+    ind : [None|int|sequence|slice]
+        The index range.
+        A sequence is the start and the end (inclusive).
+    n : int
+        The size of the dimension.
+    name : str
+        The name of the index (used in the error messages).
+
+    Returns
+    -------
+    theSlice : slice
+        Slice without None values.
+    """
+    #}}}
+
+    if ind is None:
+        theSlice = slice(0, n)
+    elif type(ind) == slice:
+        theSlice = ind
+    elif type(ind) == int:
+        theSlice = slice(ind, ind + 1)
+    elif len(ind) == 1:
+        theSlice = slice(ind[0], ind[0] + 1)
+    elif len(ind) == 2:
+        start, end = ind
+        if start is None:
+            start = 0
+        if end is None:
+            end = n - 1
+        if start < 0:
+            start += n
+        if end < 0:
+            end += n
+        if start > end:
+            message = "{} start ({}) is larger than end ({})".\
+                    format(name, start, end)
+            raise ValueError(message)
+        # NOTE: +1 as the collect indices are inclusive
+        theSlice = slice(start, end + 1)
+    else:
+        raise ValueError("Could not convert {}={} to slice".format(name, ind))
+
+    theSlice = slice(*theSlice.indices(n))
+
+    if len(range(theSlice.start, theSlice.stop, theSlice.step)) == 0:
+        raise IndexError("{}={} is out of range".format(name, ind))
+
+    return theSlice
+#}}}
+
+#{{{setCollectWorkers
+def setCollectWorkers(nWorkers):
+    #{{{docstring
+    """
+    Sets the number of processes used when reading the dump files.
+
+    The setting is stored as an environment variable, so that it is
+    inherited by sub processes.
+
+    Parameters
+    ----------
+    nWorkers : [None|int]
+        Number of processes.
+        If None, the dump files are read serially.
+    """
+    #}}}
+
+    if nWorkers is None:
+        os.environ.pop(collectWorkersEnv, None)
+    else:
+        if int(nWorkers) < 1:
+            raise ValueError("nWorkers must be a positive integer")
+        os.environ[collectWorkersEnv] = str(int(nWorkers))
+#}}}
+
+#{{{getCollectWorkers
+def getCollectWorkers():
+    #{{{docstring
+    """
+    Returns the number of processes used when reading the dump files.
+
+    Returns
+    -------
+    nWorkers : int
+        The number of processes (1 if unset).
+    """
+    #}}}
+
+    return int(os.environ.get(collectWorkersEnv, 1))
+#}}}
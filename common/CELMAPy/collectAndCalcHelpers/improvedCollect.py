@@ -4,23 +4,56 @@
 Contains function which collects a variable over several output timesteps
 """
 
-from boutdata import collect
-from boututils.datafile import DataFile
+from .collectCache import getCollectCache
+from .dumpIndex import getDumpIndex
+from .dumpReader import multiCollect
 import numpy as np
+import tempfile
 import os
 
 #{{{safeCollect
-def safeCollect(*args, **kwargs):
+def safeCollect(varName           ,\
+                xind     = None   ,\
+                yind     = None   ,\
+                zind     = None   ,\
+                tind     = None   ,\
+                path     = "."    ,\
+                yguards  = False  ,\
+                xguards  = True   ,\
+                info     = True   ,\
+                nWorkers = None   ,\
+                ):
     #{{{docstring
     """
-    Wrapper around collect which sets the data immutable
+    Collects a variable and sets it immutable
+
+    The arguments and the defaults are the same as for collect, but the
+    processor files are read in parallel if more than one worker is set
+    through setCollectWorkers (or nWorkers).
 
     Parameters
     ----------
-    *args : positional arguments
-        Positional arguments to collect
-    *kwargs : keyword arguments
-        Keyword arguments to collect
+    varName : str
+        The variable to collect
+    xind : [None|sequence]
+        Start and end (inclusive) of the x indices to collect
+    yind : [None|sequence]
+        Start and end (inclusive) of the y indices to collect
+    zind : [None|sequence]
+        Start and end (inclusive) of the z indices to collect
+    tind : [None|sequence]
+        Start and end (inclusive) of the t indices to collect
+    path : str
+        The path to collect from
+    yguards : bool
+        If the ghost points in y should be collected
+    xguards : bool
+        If the ghost points in x should be collected
+    info : bool
+        Not used, kept for compatibility with collect
+    nWorkers : [None|int]
+        Number of processes reading the processor files.
+        If None, the number set by setCollectWorkers is used.
 
     Return
     ------
@@ -30,13 +63,69 @@ def safeCollect(*args, **kwargs):
     #}}}
 
     try:
-        data = collect(*args, **kwargs)
+        data = multiCollect((varName,)        ,\
+                            path              ,\
+                            tind     = tind   ,\
+                            xind     = xind   ,\
+                            yind     = yind   ,\
+                            zind     = zind   ,\
+                            xguards  = xguards,\
+                            yguards  = yguards,\
+                            nWorkers = nWorkers)
     except Exception as e:
-        print("\nFailed to collect {}\n".format(kwargs["path"]))
+        print("\nFailed to collect {}\n".format(path))
         raise e
 
-    # write = False prevents writing
-    data.setflags(write=False)
+    # NOTE: The array is set immutable in multiCollect
+    return data[varName]
+#}}}
+
+#{{{cachedMultiCollect
+def cachedMultiCollect(varNames, path, **kwargs):
+    #{{{docstring
+    """
+    Collects several variables from a path in one pass, but looks up
+    the collect cache first
+
+    The cache is enabled through setCollectCache.
+
+    Parameters
+    ----------
+    varNames : iterable of strings
+        The variables to collect
+    path : str
+        The path to collect from
+    **kwargs : keyword arguments
+        Keyword arguments to multiCollect
+
+    Return
+    ------
+    data : dict
+        Dictionary of the collected variables.
+        The arrays are not writeable
+    """
+    #}}}
+
+    cache = getCollectCache()
+
+    if cache is None:
+        return multiCollect(varNames, path, **kwargs)
+
+    data = {}
+    keys = {}
+    for varName in varNames:
+        keys[varName] = cache.makeKey(path, varName, **kwargs)
+        cached = cache.load(keys[varName])
+        if cached is not None:
+            data[varName] = cached
+
+    # Collect the remaining variables in one pass
+    missing = tuple(varName for varName in varNames if varName not in data)
+    if len(missing) > 0:
+        collected = multiCollect(missing, path, **kwargs)
+        for varName in missing:
+            cache.store(keys[varName], collected[varName])
+        data.update(collected)
 
     return data
 #}}}
@@ -48,11 +137,20 @@ def collectiveCollect(paths               ,\
                       tInd         = None ,\
                       yInd         = None ,\
                       xInd         = None ,\
-                      zInd         = None ):
+                      zInd         = None ,\
+                      scratchDir   = None ):
     #{{{docstring
     """
     Collects variables from several paths
 
+    All the variables are read in one pass through the dump files of
+    each path.
+
+    The size of the output is found from the length of the time arrays
+    of the paths. The output is preallocated once, and each path is
+    written in place, so that no copies are made during the
+    concatenation.
+
     Parameters
     ----------
     paths : iterable of strings
@@ -63,7 +161,9 @@ def collectiveCollect(paths               ,\
     collectGhost : bool
         If the ghost is to be collected
     tInd : [None|tuple]
-        Start and end of the time if not None
+        Start and end of the time if not None.
+        An optional third element gives the step, in which case only
+        every step'th time point is read from the dump files.
     xInd : [None|2d array]
         x index range to collect. The first index is the start, and the
         second is the end of the range (inclusive)
@@ -73,6 +173,10 @@ def collectiveCollect(paths               ,\
     zInd : [None|2d array]
         z index range to collect. The first index is the start, and the
         second is the end of the range (inclusive)
+    scratchDir : [None|str]
+        If not None, the output arrays will be preallocated as
+        np.memmap in an (anonymous) scratch file in this directory,
+        rather than in memory.
 
     Return
     ------
@@ -81,166 +185,309 @@ def collectiveCollect(paths               ,\
     """
     #}}}
 
+    # Find which time indices to collect from which path
+    segments, nt = getSegmentTIndices(paths, tInd)
+
     # Initialize the data
     data = {var: None for var in varStrings}
 
-    # Initialize postCollectTInd for later checks
-    postCollectTInd = None
-    if len(paths) > 1:
-        if tInd is not None:
-            # Check if it necessary to use all paths
-            paths, tInd = removePathsOutsideRange(paths, tInd)
-            # If more than one path, we will slice in time after
-            # collection
-            postCollectTInd = tInd
-            tInd = None
-        else:
-            postCollectTInd = None
-
-    # Must cast to list due to corner cases in collect
-    if tInd is not None:
-        tInd = list(tInd)
-
-    for var in varStrings:
-        for path in paths:
-            try:
-                # Make a local var which is reused for every interation,
-                # then concatenate the dictionary
-                # NOTE: The collect indices are INCLUSIVE i.e not
-                #       working like pyhton slices
-                curVar =\
-                    safeCollect(var,\
-                                path     = path        ,\
-                                tind     = tInd        ,\
-                                xind     = xInd        ,\
-                                yind     = yInd        ,\
-                                zind     = zInd        ,\
-                                xguards  = collectGhost,\
-                                yguards  = collectGhost,\
-                                info     = False        )
-            except OSError:
-                # An OSError is thrown if the file is not found
-                raise ValueError("No collectable files found in {}".\
-                                 format(path))
+    for path, localTInd, outSlice in segments:
+        if localTInd is not None:
+            if len(localTInd) == 3:
+                # A slice makes the reader read only the strided points
+                # NOTE: +1 as the slice excludes the end point
+                localTInd = slice(localTInd[0],\
+                                  localTInd[1] + 1,\
+                                  localTInd[2])
+            else:
+                localTInd = list(localTInd)
+        try:
+            # All the variables are read while the dump files are open
+            # NOTE: The collect indices are INCLUSIVE i.e not
+            #       working like pyhton slices
+            curVars =\
+                cachedMultiCollect(varStrings,\
+                                   path     = path        ,\
+                                   tind     = localTInd   ,\
+                                   xind     = xInd        ,\
+                                   yind     = yInd        ,\
+                                   zind     = zInd        ,\
+                                   xguards  = collectGhost,\
+                                   yguards  = collectGhost,\
+                                   )
+        except OSError:
+            # An OSError is thrown if the file is not found
+            raise ValueError("No collectable files found in {}".\
+                             format(path))
+
+        for var in varStrings:
+            curVar = curVars[var]
 
             # Ensure 4D
             if len(curVar.shape) == 3:
-                # Make it a 4d variable
-                time = collectTime(paths, tInd)
-                tmp = np.zeros((len(time), *curVar.shape))
-                # Copy the field in to each time
-                tmp[:] = curVar
-                curVar = tmp
+                # The field is constant in time
+                spatialShape = curVar.shape
             elif len(curVar.shape) == 1:
-                # Make it a 4d variable
-                tmp = np.zeros((len(curVar), 1, 1, 1))
-                # Copy the field in to each time
-                tmp[:,0,0,0] = curVar
-                curVar = tmp
-
-            # Set data[var] to curVar the first time in order to get the
-            # correct dimensions
-            if data[var] is None:
-                data[var] = curVar
+                # The variable is only a function of time
+                spatialShape = (1, 1, 1)
+                curVar = curVar.reshape(len(curVar), *spatialShape)
             else:
-                # Remove first point in time in the current time as this
-                # is the same as the last of the previous
-                data[var]=np.concatenate((data[var], curVar[1:,:,:,:]), axis=0)
-
-        # Do slicing post collection if necessary
-        if postCollectTInd is not None:
-            # +1 to include the last point
-            lastPost = postCollectTInd[1]+1 if postCollectTInd[1] is not None\
-                       else None
+                spatialShape = curVar.shape[1:]
 
-            data[var] = data[var][postCollectTInd[0]:lastPost]
+            # Allocate the full output the first time in order to get
+            # the correct dimensions
+            if data[var] is None:
+                data[var] = preallocate((nt, *spatialShape),\
+                                        curVar.dtype,\
+                                        scratchDir)
 
-    # Recast to tuple
-    if tInd is not None:
-        tInd = tuple(tInd)
+            # Copy the segment in place (broadcasted if constant in time)
+            data[var][outSlice] = curVar
 
     return data
 #}}}
 
-#{{{removePathsOutsideRange
-def removePathsOutsideRange(paths, tInd):
+#{{{collectiveCollectChunks
+def collectiveCollectChunks(paths               ,\
+                            varStrings          ,\
+                            chunkSize    = 100  ,\
+                            collectGhost = False,\
+                            tInd         = None ,\
+                            yInd         = None ,\
+                            xInd         = None ,\
+                            zInd         = None ):
     #{{{docstring
     """
-    Removes paths which are outside of the time range.
+    Generator which collects variables from several paths, chunk by
+    chunk in time
+
+    Only one chunk is held in memory at a time, so that reductions over
+    long runs can be done incrementally.
+
+    Parameters
+    ----------
+    paths : iterable of strings
+        The paths to collect from. Must be in ascending order of the
+        simulation time.
+    varStrings : iterable of strings
+        The variables to be collected
+    chunkSize : int
+        The maximum number of time points in each chunk
+    collectGhost : bool
+        If the ghost is to be collected
+    tInd : [None|tuple]
+        Start and end of the time if not None.
+        An optional third element gives the step.
+    xInd : [None|2d array]
+        x index range to collect (inclusive)
+    yInd : [None|2d array]
+        y index range to collect (inclusive)
+    zInd : [None|2d array]
+        z index range to collect (inclusive)
+
+    Yields
+    ------
+    outSlice : slice
+        The slice of the chunk in the full (concatenated) output.
+    data : dict
+        A dictionary of the variables in the chunk
+    """
+    #}}}
+
+    outStart = 0
+    for chunkTInd in getChunkTIndices(paths, tInd, chunkSize):
+        # NOTE: The chunks are in the concatenated time, so the
+        #       duplicated points of the paths are dealt with in
+        #       collectiveCollect
+        data = collectiveCollect(paths, varStrings,\
+                                 collectGhost = collectGhost,\
+                                 tInd         = chunkTInd   ,\
+                                 yInd         = yInd        ,\
+                                 xInd         = xInd        ,\
+                                 zInd         = zInd        ,\
+                                )
+        outLen   = tuple(data.values())[0].shape[0]
+        outSlice = slice(outStart, outStart + outLen)
+        outStart += outLen
+
+        yield outSlice, data
+#}}}
+
+#{{{getSegmentTIndices
+def getSegmentTIndices(paths, tInd = None):
+    #{{{docstring
+    """
+    Maps the time indices of the concatenated time to the paths.
+
+    The first time point of a path equals the last time point of the
+    previous path. The duplicate is only taken from the first of the two
+    paths.
 
     Parameters
     ----------
     paths : tuple
-        The paths to collect from
-    tInd : tuple
-        The time indices
+        The paths to collect from. Must be in ascending temporal order.
+    tInd : [None|tuple]
+        Start and end of the time in the concatenated time if not None.
+        The end is inclusive.
+        An optional third element gives the step.
 
     Returns
     -------
+    segments : tuple
+        Tuple of the paths which are needed, where each element is on the
+        form (path, localTInd, outSlice).
+        localTInd is the (inclusive) time indices to collect from the
+        path (or None if the full path is needed), and outSlice is the
+        slice in the concatenated output which the data belongs to.
+        If a step is given, localTInd has the step as the third element.
+    nt : int
+        The total number of collected time points.
+    """
+    #}}}
+
+    tLens = tuple(len(getDumpIndex(path)["t_array"]) for path in paths)
+
+    # The total length without duplicates
+    totLen = tLens[0] + sum(tLen - 1 for tLen in tLens[1:])
+
+    # Find the requested range
+    start = 0
+    end   = totLen - 1
+    step  = 1
+    if tInd is not None:
+        if tInd[0] is not None:
+            start = tInd[0]
+        if tInd[1] is not None:
+            # NOTE: The end may be larger than the concatenated time,
+            #       for example when found from getTSize
+            end = min(tInd[1], totLen - 1)
+        if len(tInd) > 2 and tInd[2] is not None:
+            step = tInd[2]
+
+    if start > end:
+        raise IndexError("tInd={} is out of range".format(tInd))
+
+    segments = []
+    nt       = 0
+    segStart = 0
+    for nr, (path, tLen) in enumerate(zip(paths, tLens)):
+        # The local index of the first point which is not a duplicate
+        firstLocal = 0 if nr == 0 else 1
+        # Global range covered by this path
+        segEnd = segStart + (tLen - firstLocal) - 1
+
+        # The first point in the segment which is on the stride
+        curStart = max(start, segStart)
+        curStart = start + int(np.ceil((curStart - start)/step))*step
+        curEnd   = min(end, segEnd)
+        if curStart <= curEnd:
+            outLen     = (curEnd - curStart)//step + 1
+            localStart = curStart - segStart + firstLocal
+            localEnd   = localStart + (outLen - 1)*step
+            if step != 1:
+                localTInd = (localStart, localEnd, step)
+            elif localStart == 0 and localEnd == tLen - 1:
+                # Use the full path
+                localTInd = None
+            else:
+                localTInd = (localStart, localEnd)
+            segments.append((path, localTInd, slice(nt, nt + outLen)))
+            nt += outLen
+
+        segStart = segEnd + 1
+
+    return tuple(segments), nt
+#}}}
+
+#{{{getChunkTIndices
+def getChunkTIndices(paths, tInd = None, chunkSize = 100):
+    #{{{docstring
+    """
+    Splits the requested time range of the concatenated time into chunks.
+
+    Parameters
+    ----------
     paths : tuple
-        The filtered paths
-    tInd : tuple
-        Updated time indices
+        The paths to collect from. Must be in ascending temporal order.
+    tInd : [None|tuple]
+        Start and end of the time in the concatenated time if not None.
+        The end is inclusive.
+        An optional third element gives the step.
+    chunkSize : int
+        The maximum number of time points in each chunk.
+
+    Returns
+    -------
+    chunks : tuple
+        Tuple of the time indices of the chunks in the concatenated time.
+        The elements are on the same form as tInd.
     """
     #}}}
 
-    # Cast to list
-    paths = list(paths)
-
-    # Check if the paths are needed from the rigth
-    if tInd[1] is not None:
-        # Start at 1, as one duplicate point will be removed each
-        # iteration
-        lenT = 1
-        lastInd = None
-        for ind in range(len(paths)):
-            with DataFile(os.path.join(paths[ind],"BOUT.dmp.0.nc")) as f:
-                t = f.read("t_array")
-                # -1 removes duplicate point
-                lenT += len(t)-1
-                if tInd[1] < lenT:
-                    lastInd = ind+1
-                    break
-
-        # Remove from the right
-        paths = paths[:lastInd]
-
-    # Check if the paths are needed from the left
-    if tInd[0] is not None:
-        # Start at 1, as one duplicate point will be removed each
-        # iteration
-        lenT  = 1
-        # If folders are removed, subtract tInd with number of removed indices
-        # lenTs is a placeholder for this
-        removePaths = []
-        lenTs       = []
-        for path in paths:
-            with DataFile(os.path.join(path,"BOUT.dmp.0.nc")) as f:
-                t = f.read("t_array")
-                curLenT = len(t)
-                lenTs.append(curLenT)
-                # -1 removes duplicate point
-                lenT += curLenT - 1
-                if tInd[0] >= lenT:
-                    removePaths.append(path)
-                else:
-                    break
-
-        tInd = list(tInd)
-        for remove, lenT in zip(removePaths, lenTs):
-            tInd[0] = (tInd[0] - lenT)
-            # +1 in order to make tInd[1] inclusive
-            tInd[1] =  tInd[1] - lenT + 1 if tInd[1] is not None else None
-            paths.remove(remove)
-        # Remove the duplicates present in more files by shifting
-        # the first time index by one per duplicate
-        tInd[0] += len(removePaths)
+    if chunkSize < 1:
+        raise ValueError("chunkSize must be a positive integer")
 
-    # Cast to tuple
-    tInd = tuple(tInd)
-    paths = tuple(paths)
+    # Obtain the total number of points in the range
+    _, nt = getSegmentTIndices(paths, tInd)
+
+    start = 0
+    step  = 1
+    if tInd is not None:
+        if tInd[0] is not None:
+            start = tInd[0]
+        if len(tInd) > 2 and tInd[2] is not None:
+            step = tInd[2]
+
+    chunks = []
+    for chunkStart in range(0, nt, chunkSize):
+        chunkLen = min(chunkSize, nt - chunkStart)
+        curStart = start + chunkStart*step
+        curEnd   = curStart + (chunkLen - 1)*step
+        if step != 1:
+            chunks.append((curStart, curEnd, step))
+        else:
+            chunks.append((curStart, curEnd))
+
+    return tuple(chunks)
+#}}}
+
+#{{{preallocate
+def preallocate(shape, dtype, scratchDir = None):
+    #{{{docstring
+    """
+    Preallocates an array, either in memory or as a memory map.
+
+    Parameters
+    ----------
+    shape : tuple
+        Shape of the array.
+    dtype : dtype
+        Data type of the array.
+    scratchDir : [None|str]
+        If not None, the array is memory mapped to an anonymous
+        temporary file in this directory.
+        The file is removed by the operating system when the array is
+        deleted.
 
-    return paths, tInd
+    Returns
+    -------
+    out : [array|memmap]
+        The uninitialized array.
+    """
+    #}}}
+
+    if scratchDir is None:
+        return np.empty(shape, dtype=dtype)
+
+    if not os.path.exists(scratchDir):
+        os.makedirs(scratchDir, exist_ok=True)
+
+    # TemporaryFile is unlinked on creation, the memmap keeps it alive
+    with tempfile.TemporaryFile(dir=scratchDir) as f:
+        out = np.memmap(f, dtype=dtype, mode="w+", shape=shape)
+
+    return out
 #}}}
 
 #{{{collectTime
@@ -256,7 +503,8 @@ def collectTime(paths, tInd = None):
         ascending temporal order as the variable will be
         concatenated.
     tInd : [None|tuple]
-        Start and end of the time if not None
+        Start and end of the time if not None.
+        An optional third element gives the step.
 
     Returns
     -------
@@ -265,23 +513,18 @@ def collectTime(paths, tInd = None):
     """
     #}}}
 
-    # Initialize
-    time = None
+    segments, nt = getSegmentTIndices(paths, tInd)
 
-    for path in paths:
-        with DataFile(os.path.join(path,"BOUT.dmp.0.nc")) as f:
-            if time is None:
-                time = f.read("t_array")
-            else:
-                # Remove first point in time in the current time as this
-                # is the same as the last of the previous
-                time = np.concatenate((time, f.read("t_array")[1:]), axis=0)
+    time = np.empty(nt)
 
-    if tInd is not None:
-        # NOTE: +1 since the collect ranges is INCLUSIVE, i.e. not working
-        #       like a python slice
-        lastT = tInd[1]+1 if tInd[1] is not None else None
-        time  = time[tInd[0]:lastT]
+    for path, localTInd, outSlice in segments:
+        t = getDumpIndex(path)["t_array"]
+        if localTInd is not None:
+            # NOTE: +1 since the collect ranges is INCLUSIVE, i.e. not
+            #       working like a python slice
+            step = localTInd[2] if len(localTInd) == 3 else None
+            t = t[localTInd[0]:localTInd[1]+1:step]
+        time[outSlice] = t
 
     return time
 #}}}
@@ -298,8 +541,10 @@ def collectPoint(paths, varName, xInd, yInd, zInd, tInd = None):
         What path to use when collecting the variable. Must be in
         ascending temporal order as the variable will be
         concatenated.
-    varName : str
+    varName : [str|tuple]
         Name of the variable to collect.
+        If a tuple of names is given, the variables are collected in one
+        pass, and a dict of the variables is returned.
     xInd : int
         xInd to collect from
     yInd : int
@@ -318,7 +563,7 @@ def collectPoint(paths, varName, xInd, yInd, zInd, tInd = None):
     #}}}
 
     # Cast to tuple
-    varDict = collectiveCollect(paths, (varName,)   ,\
+    varDict = collectiveCollect(paths, _toVarNames(varName),\
                                 collectGhost = False,\
                                 xInd = (xInd, xInd) ,\
                                 yInd = (yInd, yInd) ,\
@@ -326,9 +571,7 @@ def collectPoint(paths, varName, xInd, yInd, zInd, tInd = None):
                                 tInd = tInd
                                )
 
-    var  = varDict[varName]
-
-    return var
+    return _getVarOrDict(varDict, varName)
 #}}}
 
 #{{{collectRadialProfile
@@ -344,8 +587,10 @@ def collectRadialProfile(paths, varName, yInd, zInd,\
         What path to use when collecting the variable. Must be in
         ascending temporal order as the variable will be
         concatenated.
-    varName : str
+    varName : [str|tuple]
         Name of the variable to collect.
+        If a tuple of names is given, the variables are collected in one
+        pass, and a dict of the variables is returned.
     yInd : tuple
         yInd start and yInd end to collect from
     zInd : tuple
@@ -363,16 +608,14 @@ def collectRadialProfile(paths, varName, yInd, zInd,\
     #}}}
 
     # Collect the variable
-    varDict = collectiveCollect(paths, (varName,)           ,\
+    varDict = collectiveCollect(paths, _toVarNames(varName),\
                                  collectGhost = collectGhost,\
                                  yInd = yInd                ,\
                                  zInd = zInd                ,\
                                  tInd = tInd                ,\
                                 )
 
-    var  = varDict[varName]
-
-    return var
+    return _getVarOrDict(varDict, varName)
 #}}}
 
 #{{{collectParallelProfile
@@ -388,8 +631,10 @@ def collectParallelProfile(paths, varName, xInd, zInd,\
         What path to use when collecting the variable. Must be in
         ascending temporal order as the variable will be
         concatenated.
-    varName : str
+    varName : [str|tuple]
         Name of the variable to collect.
+        If a tuple of names is given, the variables are collected in one
+        pass, and a dict of the variables is returned.
     xInd : tuple
         xInd start and xInd end to collect from
     zInd : tuple
@@ -407,16 +652,14 @@ def collectParallelProfile(paths, varName, xInd, zInd,\
     #}}}
 
     # Collect the variable
-    varDict = collectiveCollect(paths, (varName,)          ,\
+    varDict = collectiveCollect(paths, _toVarNames(varName),\
                                 collectGhost = collectGhost,\
                                 xInd = xInd                ,\
                                 zInd = zInd                ,\
                                 tInd = tInd                ,\
                                )
 
-    var  = varDict[varName]
-
-    return var
+    return _getVarOrDict(varDict, varName)
 #}}}
 
 #{{{collectPoloidalProfile
@@ -432,8 +675,10 @@ def collectPoloidalProfile(paths, varName, xInd, yInd,\
         What path to use when collecting the variable. Must be in
         ascending temporal order as the variable will be
         concatenated.
-    varName : str
+    varName : [str|tuple]
         Name of the variable to collect.
+        If a tuple of names is given, the variables are collected in one
+        pass, and a dict of the variables is returned.
     xInd : tuple
         xInd start and xInd end to collect from
     yInd : tuple
@@ -451,16 +696,14 @@ def collectPoloidalProfile(paths, varName, xInd, yInd,\
     #}}}
 
     # Collect the variable
-    varDict = collectiveCollect(paths, (varName,)          ,\
+    varDict = collectiveCollect(paths, _toVarNames(varName),\
                                 collectGhost = collectGhost,\
                                 xInd = xInd                ,\
                                 yInd = yInd                ,\
                                 tInd = tInd                ,\
                                )
 
-    var  = varDict[varName]
-
-    return var
+    return _getVarOrDict(varDict, varName)
 #}}}
 
 #{{{collectConstRho
@@ -476,8 +719,10 @@ def collectConstRho(paths, varName, xInd,\
         What path to use when collecting the variable. Must be in
         ascending temporal order as the variable will be
         concatenated.
-    varName : str
+    varName : [str|tuple]
         Name of the variable to collect.
+        If a tuple of names is given, the variables are collected in one
+        pass, and a dict of the variables is returned.
     xInd : tuple
         xInd start and xInd end to collect from
     tInd : [None|tuple]
@@ -493,15 +738,13 @@ def collectConstRho(paths, varName, xInd,\
     #}}}
 
     # Collect the variable
-    varDict = collectiveCollect(paths, (varName,)          ,\
+    varDict = collectiveCollect(paths, _toVarNames(varName),\
                                 collectGhost = collectGhost,\
                                 xInd = xInd                ,\
                                 tInd = tInd                ,\
                                )
 
-    var  = varDict[varName]
-
-    return var
+    return _getVarOrDict(varDict, varName)
 #}}}
 
 #{{{collectConstZ
@@ -517,8 +760,10 @@ def collectConstZ(paths, varName, yInd,\
         What path to use when collecting the variable. Must be in
         ascending temporal order as the variable will be
         concatenated.
-    varName : str
+    varName : [str|tuple]
         Name of the variable to collect.
+        If a tuple of names is given, the variables are collected in one
+        pass, and a dict of the variables is returned.
     yInd : tuple
         yInd start and yInd end to collect from
     tInd : [None|tuple]
@@ -534,15 +779,13 @@ def collectConstZ(paths, varName, yInd,\
     #}}}
 
     # Collect the variable
-    varDict = collectiveCollect(paths, (varName,)          ,\
+    varDict = collectiveCollect(paths, _toVarNames(varName),\
                                 collectGhost = collectGhost,\
                                 yInd = yInd                ,\
                                 tInd = tInd                ,\
                                )
 
-    var  = varDict[varName]
-
-    return var
+    return _getVarOrDict(varDict, varName)
 #}}}
 
 #{{{collectConstTheta
@@ -558,8 +801,10 @@ def collectConstTheta(paths, varName, zInd,\
         What path to use when collecting the variable. Must be in
         ascending temporal order as the variable will be
         concatenated.
-    varName : str
+    varName : [str|tuple]
         Name of the variable to collect.
+        If a tuple of names is given, the variables are collected in one
+        pass, and a dict of the variables is returned.
     zInd : tuple
         zInd start and zInd end to collect from
     tInd : [None|tuple]
@@ -575,13 +820,27 @@ def collectConstTheta(paths, varName, zInd,\
     #}}}
 
     # Collect the variable
-    varDict = collectiveCollect(paths, (varName,)          ,\
+    varDict = collectiveCollect(paths, _toVarNames(varName),\
                                 collectGhost = collectGhost,\
                                 zInd = zInd                ,\
                                 tInd = tInd                ,\
                                )
 
-    var  = varDict[varName]
+    return _getVarOrDict(varDict, varName)
+#}}}
 
-    return var
+#{{{_toVarNames
+def _toVarNames(varName):
+    """
+    Returns varName as a tuple of variable names
+    """
+    return (varName,) if type(varName) == str else tuple(varName)
+#}}}
+
+#{{{_getVarOrDict
+def _getVarOrDict(varDict, varName):
+    """
+    Returns the variable if varName is a string, else the dict
+    """
+    return varDict[varName] if type(varName) == str else varDict
 #}}}
@@ -51,24 +51,34 @@ def linRegOfExp(x,y):
         The y data. It will be assumed that the uncertainties in y is
         equally uncertain. This means that the uncertainties in ln(y)
         will scale as sigmaLnY/y
+        If y is 2d on the form (x, series), all the series are fitted
+        at once.
 
     Returns
     -------
-    B : float
-        The exponential growth rate
-    sigmaB : float
-        The uncertainties in BExp (see notes above)
+    B : [float|array]
+        The exponential growth rate.
+        An array with one element per series if y is 2d.
+    sigmaB : [float|array]
+        The uncertainties in BExp (see notes above).
+        An array with one element per series if y is 2d.
     """
     #}}}
 
     # Take the logarithm
     lnY = np.log(y)
+    # Make x broadcastable to lnY
+    x = np.asarray(x).reshape((-1,) + (1,)*(lnY.ndim - 1))
     # Calculation of sigmaLnY
-    N        = len(x)
-    Delta    = N*sum(x**2) - (sum(x))**2
-    A        = (sum(x**2)*sum(lnY) - sum(x)*sum(x*lnY))/Delta
-    B        = (N*sum(lnY*x) - sum(x)*sum(lnY))/Delta
-    sigmaLnY = np.sqrt((1/(N-2))*sum((lnY - A - B*x)**2))
+    N        = x.shape[0]
+    sumX     = x.sum()
+    sumX2    = (x**2).sum()
+    sumLnY   = lnY.sum(axis=0)
+    sumXLnY  = (x*lnY).sum(axis=0)
+    Delta    = N*sumX2 - sumX**2
+    A        = (sumX2*sumLnY - sumX*sumXLnY)/Delta
+    B        = (N*sumXLnY - sumX*sumLnY)/Delta
+    sigmaLnY = np.sqrt((1/(N-2))*((lnY - A - B*x)**2).sum(axis=0))
     sigmaB   = sigmaLnY*np.sqrt(N/Delta)
 
     return B, sigmaB
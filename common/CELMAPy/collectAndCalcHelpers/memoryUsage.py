@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+
+"""
+Contains functions for measuring the memory usage of a process
+"""
+
+import resource
+
+#{{{resetPeakRSS
+def resetPeakRSS():
+    #{{{docstring
+    """
+    Resets the peak resident set size of this process.
+
+    NOTE: A forked process inherits the resident set size of its parent,
+          so the peak must be reset (and the starting resident set size
+          subtracted) in order to measure the memory used by the
+          process itself.
+
+    Returns
+    -------
+    peakReset : bool
+        True if the peak was reset (Linux >= 4.0), False otherwise.
+    """
+    #}}}
+
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+#}}}
+
+#{{{getRSS
+def getRSS(fromProc, peak = False):
+    #{{{docstring
+    """
+    Returns the (peak) resident set size of this process.
+
+    Parameters
+    ----------
+    fromProc : bool
+        Whether or not to read the sizes from /proc/self/status.
+        Use the output of resetPeakRSS.
+        If False, ru_maxrss is returned, which can not be reset, so a
+        peak reached before the reset hides the later peaks.
+    peak : bool
+        Whether to return the peak or the current resident set size.
+
+    Returns
+    -------
+    rss : int
+        The (peak) resident set size in bytes.
+    """
+    #}}}
+
+    if fromProc:
+        key = "VmHWM" if peak else "VmRSS"
+        with open("/proc/self/status") as f:
+            for line in f:
+                name, value = line.split(":")
+                if name == key:
+                    # NOTE: The value is given in kB
+                    return int(value.split()[0])*1024
+
+    # NOTE: ru_maxrss is given in kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss*1024
+#}}}
@@ -0,0 +1,240 @@
+#!/usr/bin/env python
+
+"""
+Contains class for accumulating histograms chunk by chunk
+"""
+
+import numpy as np
+
+#{{{RunningHistogram
+class RunningHistogram(object):
+    """
+    Class which accumulates a histogram with fixed bins.
+
+    The bin edges are either given, or found from a first pass through
+    the data (see addRange and setEdges) where only the minimum, the
+    maximum and the number of samples are accumulated.
+    The counts are accumulated in a second pass (see add).
+
+    With the adaptive edges the result equals
+    np.histogram(data, bins="sqrt", density=True) of the concatenated
+    data without holding it in memory.
+    """
+
+    #{{{constructor
+    def __init__(self, edges = None):
+        #{{{docstring
+        """
+        Constructor for the RunningHistogram.
+
+        Parameters
+        ----------
+        edges : [None|array]
+            The bin edges.
+            If None, the edges must be set with setEdges before the
+            counts are added.
+        """
+        #}}}
+
+        self._min    = None
+        self._max    = None
+        self.nRange  = 0
+
+        self.edges   = None
+        self._counts = None
+        if edges is not None:
+            self._setEdges(np.asarray(edges))
+    #}}}
+
+    #{{{addRange
+    def addRange(self, chunk):
+        #{{{docstring
+        """
+        Adds a chunk to the range of the data (the first pass).
+
+        Parameters
+        ----------
+        chunk : array
+            The chunk to add.
+        """
+        #}}}
+
+        chunk = np.asarray(chunk)
+        if chunk.size == 0:
+            return
+
+        chunkMin = chunk.min()
+        chunkMax = chunk.max()
+        if not(np.isfinite(chunkMin) and np.isfinite(chunkMax)):
+            message = "autodetected range of [{}, {}] is not finite".\
+                        format(chunkMin, chunkMax)
+            raise ValueError(message)
+
+        if self.nRange == 0:
+            self._min = chunkMin
+            self._max = chunkMax
+        else:
+            self._min = min(self._min, chunkMin)
+            self._max = max(self._max, chunkMax)
+        self.nRange += chunk.size
+    #}}}
+
+    #{{{setEdges
+    def setEdges(self, nBins = None, binRange = None):
+        #{{{docstring
+        """
+        Sets equidistant bin edges from the range found by addRange.
+
+        NOTE: The number of bins is found in the same way as
+              np.histogram does with bins="sqrt", so that the edges are
+              identical.
+
+        Parameters
+        ----------
+        nBins : [None|int]
+            The number of bins.
+            If None, the square root estimator is used.
+        binRange : [None|tuple]
+            The lower and upper edge.
+            If None, the range found by addRange is used.
+        """
+        #}}}
+
+        if binRange is None:
+            if self.nRange == 0:
+                # NOTE: As np.histogram for empty arrays
+                firstEdge, lastEdge = 0, 1
+            else:
+                firstEdge, lastEdge = self._min, self._max
+        else:
+            firstEdge, lastEdge = binRange
+            if firstEdge > lastEdge:
+                message = "max must be larger than min in binRange"
+                raise ValueError(message)
+
+        # Expand empty range to avoid divide by zero
+        if firstEdge == lastEdge:
+            firstEdge = firstEdge - 0.5
+            lastEdge  = lastEdge  + 0.5
+
+        if nBins is None:
+            if self.nRange == 0:
+                nBins = 1
+            else:
+                # NOTE: The estimator uses the range of the data, also
+                #       when binRange is given
+                width = (self._max - self._min)/np.sqrt(self.nRange)
+                if width:
+                    nBins = int(np.ceil((lastEdge - firstEdge)/width))
+                else:
+                    nBins = 1
+
+        binType = np.result_type(firstEdge, lastEdge, float)
+        self._setEdges(np.linspace(firstEdge, lastEdge, nBins + 1,\
+                                   endpoint=True, dtype=binType))
+    #}}}
+
+    #{{{add
+    def add(self, chunk):
+        #{{{docstring
+        """
+        Adds a chunk to the counts (the second pass).
+
+        Parameters
+        ----------
+        chunk : array
+            The chunk to add.
+        """
+        #}}}
+
+        if self.edges is None:
+            message = "The edges must be set before the counts are added"
+            raise RuntimeError(message)
+
+        self._counts += np.histogram(np.asarray(chunk), bins=self.edges)[0]
+    #}}}
+
+    #{{{merge
+    def merge(self, other):
+        #{{{docstring
+        """
+        Merges the range and the counts of another RunningHistogram
+        into this.
+
+        Parameters
+        ----------
+        other : RunningHistogram
+            The histogram to merge with.
+            If counts has been added to any of them, the edges must be
+            equal.
+        """
+        #}}}
+
+        if other.nRange > 0:
+            if self.nRange == 0:
+                self._min = other._min
+                self._max = other._max
+            else:
+                self._min = min(self._min, other._min)
+                self._max = max(self._max, other._max)
+            self.nRange += other.nRange
+
+        if other.edges is not None:
+            if self.edges is None:
+                self._setEdges(other.edges)
+            elif not(np.array_equal(self.edges, other.edges)):
+                message = "Cannot merge histograms with different edges"
+                raise ValueError(message)
+            self._counts += other._counts
+    #}}}
+
+    #{{{getCounts
+    def getCounts(self):
+        """
+        Returns the counts
+        """
+
+        return self._counts
+    #}}}
+
+    #{{{getPDF
+    def getPDF(self):
+        #{{{docstring
+        """
+        Returns the probability density function.
+
+        Returns
+        -------
+        pdfX : array
+            The bin centers.
+        pdfY : array
+            The density normalized so that the integral over the bins
+            equals one.
+        """
+        #}}}
+
+        if self.edges is None:
+            message = "The edges must be set before the PDF is obtained"
+            raise RuntimeError(message)
+
+        pdfX = 0.5*(self.edges[:-1] + self.edges[1:])
+        # NOTE: Same order of operations as np.histogram
+        pdfY = self._counts/np.diff(self.edges)/self._counts.sum()
+
+        return pdfX, pdfY
+    #}}}
+
+    #{{{_setEdges
+    def _setEdges(self, edges):
+        """
+        Sets the edges and resets the counts
+        """
+
+        if edges.ndim != 1 or np.any(edges[:-1] > edges[1:]):
+            message = "The edges must be 1d and increase monotonically"
+            raise ValueError(message)
+
+        self.edges   = edges
+        self._counts = np.zeros(edges.size - 1, dtype=np.intp)
+    #}}}
+#}}}
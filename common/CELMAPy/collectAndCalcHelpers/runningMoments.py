@@ -0,0 +1,211 @@
+#!/usr/bin/env python
+
+"""
+Contains class for accumulating statistical moments chunk by chunk
+"""
+
+import numpy as np
+
+#{{{RunningMoments
+class RunningMoments(object):
+    """
+    Class which accumulates the central moments up to fourth order.
+
+    The moments of each added chunk are merged with the moments of the
+    previous chunks using the pairwise update formulas of Chan et al.
+    and Pebay, so that the result equals the moments of the
+    concatenated data without holding it in memory.
+    """
+
+    #{{{constructor
+    def __init__(self, axis = 0):
+        #{{{docstring
+        """
+        Constructor for the RunningMoments.
+
+        Parameters
+        ----------
+        axis : [int|tuple]
+            The axis (or axes) which the moments are taken over.
+            The chunks are assumed to be concatenated along the first
+            of these axes.
+        """
+        #}}}
+
+        self._axis = axis
+
+        self.n     = 0
+        self._mean = None
+        self._m2   = None
+        self._m3   = None
+        self._m4   = None
+    #}}}
+
+    #{{{add
+    def add(self, chunk):
+        #{{{docstring
+        """
+        Adds a chunk of data.
+
+        Parameters
+        ----------
+        chunk : array
+            The data to add.
+            All dimensions not in axis must match the previous chunks.
+        """
+        #}}}
+
+        chunk = np.asarray(chunk, dtype=float)
+
+        axes = self._axis if hasattr(self._axis, "__iter__") else (self._axis,)
+        n = int(np.prod([chunk.shape[ax] for ax in axes]))
+        if n == 0:
+            return
+
+        mean = chunk.mean(axis=self._axis, keepdims=True)
+        dev  = chunk - mean
+        dev2 = dev**2.0
+        m2   = dev2.sum(axis=self._axis, keepdims=True)
+        m3   = (dev2*dev).sum(axis=self._axis, keepdims=True)
+        m4   = (dev2*dev2).sum(axis=self._axis, keepdims=True)
+
+        self._mergeMoments(n, mean, m2, m3, m4)
+    #}}}
+
+    #{{{merge
+    def merge(self, other):
+        #{{{docstring
+        """
+        Merges the moments of another RunningMoments into this.
+
+        Parameters
+        ----------
+        other : RunningMoments
+            The moments to merge with.
+            Must be taken over the same axis and shape.
+        """
+        #}}}
+
+        if other.n == 0:
+            return
+
+        self._mergeMoments(other.n, other._mean, other._m2,\
+                           other._m3, other._m4)
+    #}}}
+
+    #{{{getMean
+    def getMean(self):
+        """
+        Returns the mean (with the moment axes kept as length 1)
+        """
+
+        return self._mean
+    #}}}
+
+    #{{{getVariance
+    def getVariance(self):
+        """
+        Returns the (biased) variance
+        """
+
+        return self._m2/self.n
+    #}}}
+
+    #{{{getStd
+    def getStd(self):
+        """
+        Returns the (biased) standard deviation
+        """
+
+        return np.sqrt(self.getVariance())
+    #}}}
+
+    #{{{getSkewness
+    def getSkewness(self):
+        #{{{docstring
+        """
+        Returns the skewness.
+
+        This equals scipy.stats.skew with bias=True (the default).
+
+        Returns
+        -------
+        skewness : array
+            The skewness.
+            NaN where the variance vanishes.
+        """
+        #}}}
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            m2 = self._m2/self.n
+            m3 = self._m3/self.n
+            return np.where(m2 > 0, m3/m2**1.5, np.nan)
+    #}}}
+
+    #{{{getKurtosis
+    def getKurtosis(self):
+        #{{{docstring
+        """
+        Returns Fisher's kurtosis (excess).
+
+        This equals scipy.stats.kurtosis with fisher=True and bias=True
+        (the defaults).
+
+        Returns
+        -------
+        kurtosis : array
+            The kurtosis.
+            NaN where the variance vanishes.
+        """
+        #}}}
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            m2 = self._m2/self.n
+            m4 = self._m4/self.n
+            return np.where(m2 > 0, m4/m2**2.0 - 3.0, np.nan)
+    #}}}
+
+    #{{{_mergeMoments
+    def _mergeMoments(self, nB, meanB, m2B, m3B, m4B):
+        #{{{docstring
+        """
+        Merges the moments of a chunk with the accumulated moments.
+
+        Parameters
+        ----------
+        nB : int
+            Number of samples in the chunk.
+        meanB : array
+            The mean of the chunk.
+        m2B, m3B, m4B : array
+            The sum of the second, third and fourth power of the
+            deviation from the mean of the chunk.
+        """
+        #}}}
+
+        if self.n == 0:
+            self.n     = nB
+            self._mean = meanB
+            self._m2   = m2B
+            self._m3   = m3B
+            self._m4   = m4B
+            return
+
+        nA    = self.n
+        n     = nA + nB
+        delta = meanB - self._mean
+        m2A   = self._m2
+        m3A   = self._m3
+
+        self._m4 = self._m4 + m4B +\
+            delta**4.0*nA*nB*(nA**2.0 - nA*nB + nB**2.0)/n**3.0 +\
+            6.0*delta**2.0*(nA**2.0*m2B + nB**2.0*m2A)/n**2.0 +\
+            4.0*delta*(nA*m3B - nB*m3A)/n
+        self._m3 = m3A + m3B +\
+            delta**3.0*nA*nB*(nA - nB)/n**2.0 +\
+            3.0*delta*(nA*m2B - nB*m2A)/n
+        self._m2 = m2A + m2B + delta**2.0*nA*nB/n
+        self._mean = self._mean + delta*nB/n
+        self.n = n
+    #}}}
+#}}}
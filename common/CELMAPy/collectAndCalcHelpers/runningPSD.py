@@ -0,0 +1,211 @@
+#!/usr/bin/env python
+
+"""
+Contains class for accumulating power spectral densities chunk by chunk
+"""
+
+from scipy.signal import get_window
+from scipy.signal.windows import dpss
+import numpy as np
+
+#{{{RunningPSD
+class RunningPSD(object):
+    """
+    Class which accumulates the power spectral density of time traces.
+
+    The time traces are split into (possibly overlapping) segments, and
+    the spectra of the segments are averaged.
+    The segments are processed as soon as they are complete, so that
+    the time traces can be added chunk by chunk without holding them in
+    memory.
+
+    Two estimates are available:
+        * "welch"      - Each segment is multiplied by a window before
+                         the fourier transform.
+                         This equals scipy.signal.welch with
+                         detrend="constant" and scaling="density".
+        * "multitaper" - The spectrum of each segment is the average
+                         of the spectra obtained with the discrete
+                         prolate spheroidal sequences as tapers.
+                         With one segment spanning the whole trace this
+                         is the multitaper estimate of Thomson.
+    """
+
+    #{{{constructor
+    def __init__(self                 ,\
+                 fs                   ,\
+                 nperseg              ,\
+                 noverlap = None      ,\
+                 method   = "welch"   ,\
+                 window   = "hann"    ,\
+                 NW       = 4         ,\
+                 Kmax     = None      ,\
+                ):
+        #{{{docstring
+        """
+        Constructor for the RunningPSD.
+
+        Parameters
+        ----------
+        fs : float
+            The sampling frequency.
+        nperseg : int
+            Number of samples in each segment.
+        noverlap : [None|int]
+            Number of samples the segments overlap.
+            If None, nperseg//2 is used for "welch" and 0 for
+            "multitaper".
+        method : ["welch"|"multitaper"]
+            The estimate to use.
+        window : [str|tuple|array]
+            The window used by "welch".
+            If not an array, see scipy.signal.get_window for details.
+        NW : float
+            The time half-bandwidth product used by "multitaper".
+        Kmax : [None|int]
+            The number of tapers used by "multitaper".
+            If None, 2*NW - 1 tapers are used.
+        """
+        #}}}
+
+        # Guard
+        implemented = ("welch", "multitaper")
+        if not(method in implemented):
+            message = "method '{}' not implemented. Use one of {}".\
+                        format(method, implemented)
+            raise NotImplementedError(message)
+
+        nperseg = int(nperseg)
+        if noverlap is None:
+            noverlap = nperseg//2 if method == "welch" else 0
+        if nperseg < 1 or not(0 <= noverlap < nperseg):
+            message = ("nperseg must be positive and noverlap must be in "
+                       "[0, nperseg), got nperseg={} and noverlap={}").\
+                        format(nperseg, noverlap)
+            raise ValueError(message)
+
+        self._fs      = fs
+        self._nperseg = nperseg
+        self._step    = nperseg - int(noverlap)
+        self._method  = method
+
+        if method == "welch":
+            # The tapers are on the form (taper, nperseg)
+            if isinstance(window, np.ndarray):
+                self._tapers = window.astype(float)[np.newaxis,:]
+            else:
+                self._tapers = get_window(window, nperseg)[np.newaxis,:]
+        else:
+            if Kmax is None:
+                Kmax = max(1, int(2*NW) - 1)
+            self._tapers = np.atleast_2d(dpss(nperseg, NW, Kmax))
+
+        # Scale to a density
+        # NOTE: The spectra are summed over the tapers, so this also
+        #       takes the average over the tapers
+        self._scale = 1.0/(fs*(self._tapers**2.0).sum())
+
+        # The chunks with the samples not yet used in a complete segment
+        # NOTE: The chunks are only concatenated when a segment is
+        #       complete, so that each sample is copied a bounded number
+        #       of times (rather than once per added chunk)
+        self._chunks   = []
+        self._nSamples = 0
+        # The sum of the spectra of the segments
+        self._sum    = None
+        self.nSegments = 0
+    #}}}
+
+    #{{{add
+    def add(self, chunk):
+        #{{{docstring
+        """
+        Adds a chunk of the time traces.
+
+        Parameters
+        ----------
+        chunk : array
+            The chunk on the form (..., t), for example (probe, t).
+            The chunks are concatenated along the last axis, and all
+            other dimensions must match the previous chunks.
+        """
+        #}}}
+
+        chunk = np.asarray(chunk, dtype=float)
+
+        self._chunks.append(chunk)
+        self._nSamples += chunk.shape[-1]
+        if self._nSamples < self._nperseg:
+            return
+
+        if len(self._chunks) == 1:
+            buffer = self._chunks[0]
+        else:
+            buffer = np.concatenate(self._chunks, axis=-1)
+
+        nt = buffer.shape[-1]
+
+        # Split the buffer into the complete segments
+        # NOTE: The segments are views of the buffer
+        nSeg = (nt - self._nperseg)//self._step + 1
+        segments = np.lib.stride_tricks.sliding_window_view(\
+                    buffer, self._nperseg, axis=-1)\
+                   [..., :nSeg*self._step:self._step, :]
+
+        # Remove the mean of each segment
+        segments = segments - segments.mean(axis=-1, keepdims=True)
+
+        # Take the spectra of the segments on the form
+        # (..., segment, taper, frequency)
+        spectra = np.abs(np.fft.rfft(\
+                    segments[..., np.newaxis, :]*self._tapers, axis=-1))**2.0
+        spectra = spectra.sum(axis=(-3, -2))
+
+        if self._sum is None:
+            self._sum = spectra
+        else:
+            self._sum += spectra
+        self.nSegments += nSeg
+
+        # Keep the samples which are needed by the next segment
+        # NOTE: The copy releases the processed samples
+        rest = buffer[..., nSeg*self._step:].copy()
+        self._chunks   = [rest]
+        self._nSamples = rest.shape[-1]
+    #}}}
+
+    #{{{getPSD
+    def getPSD(self):
+        #{{{docstring
+        """
+        Returns the power spectral density.
+
+        Returns
+        -------
+        freq : array
+            The frequencies.
+        PSD : array
+            The one-sided power spectral density on the form
+            (..., frequency).
+        """
+        #}}}
+
+        if self.nSegments == 0:
+            message = ("No complete segments has been added "
+                       "(nperseg={})".format(self._nperseg))
+            raise RuntimeError(message)
+
+        freq = np.fft.rfftfreq(self._nperseg, d=1.0/self._fs)
+
+        PSD = self._sum*(self._scale/self.nSegments)
+        # Make it one-sided
+        # NOTE: The zero frequency and the Nyquist frequency (only
+        #       present for even nperseg) have no negative counterpart
+        if self._nperseg % 2 == 0:
+            PSD[..., 1:-1] *= 2.0
+        else:
+            PSD[..., 1:] *= 2.0
+
+        return freq, PSD
+    #}}}
+#}}}
@@ -4,6 +4,14 @@
 Contains helper functions used when dealing with scans
 """
 
+from multiprocessing import Pool, current_process
+import os
+
+# Environment variable used to configure the number of processes used
+# when looping over the scan values. This is inherited by sub processes
+# (and forwarded by the PBSSubmitter)
+scanWorkersEnv = "CELMAPY_SCAN_WORKERS"
+
 #{{{getScanValue
 def getScanValue(path, scanParameter):
     #{{{docstring
@@ -37,3 +45,88 @@ def getScanValue(path, scanParameter):
 
     return float(scanValue)
 #}}}
+
+#{{{mapScan
+def mapScan(func, argsList, nWorkers = None):
+    #{{{docstring
+    """
+    Calls func for each of the scan values.
+
+    The scan values are processed in a pool of processes if more than
+    one worker is set through setScanWorkers (or nWorkers).
+
+    Parameters
+    ----------
+    func : callable
+        Function to call for each scan value.
+        Must be pickable (i.e. defined at module level) if more than
+        one worker is used.
+    argsList : sequence of tuples
+        The arguments of func for each scan value.
+    nWorkers : [None|int]
+        Number of processes.
+        If None, the number set by setScanWorkers is used.
+
+    Returns
+    -------
+    results : list
+        The output of func for each scan value in the same order as
+        argsList.
+    """
+    #}}}
+
+    argsList = tuple(argsList)
+
+    if nWorkers is None:
+        nWorkers = getScanWorkers()
+    # NOTE: Daemonic processes (like the workers of a Pool) are not
+    #       allowed to have children
+    if nWorkers > 1 and len(argsList) > 1 and not(current_process().daemon):
+        with Pool(min(nWorkers, len(argsList))) as pool:
+            # NOTE: starmap preserves the order of the input
+            return pool.starmap(func, argsList)
+    else:
+        return [func(*args) for args in argsList]
+#}}}
+
+#{{{setScanWorkers
+def setScanWorkers(nWorkers):
+    #{{{docstring
+    """
+    Sets the number of processes used when looping over the scan values.
+
+    The setting is stored as an environment variable, so that it is
+    inherited by sub processes.
+
+    Parameters
+    ----------
+    nWorkers : [None|int]
+        Number of processes.
+        If None, the scan values are processed serially.
+    """
+    #}}}
+
+    if nWorkers is None:
+        os.environ.pop(scanWorkersEnv, None)
+    else:
+        if int(nWorkers) < 1:
+            raise ValueError("nWorkers must be a positive integer")
+        os.environ[scanWorkersEnv] = str(int(nWorkers))
+#}}}
+
+#{{{getScanWorkers
+def getScanWorkers():
+    #{{{docstring
+    """
+    Returns the number of processes used when looping over the scan
+    values.
+
+    Returns
+    -------
+    nWorkers : int
+        The number of processes (1 if unset).
+    """
+    #}}}
+
+    return int(os.environ.get(scanWorkersEnv, 1))
+#}}}
@@ -25,7 +25,10 @@ def slicesToIndices(paths, theSlice, dimension, xguards=False, yguards=False):
     Returns
     -------
     indices : tuple
-        Tuple containing the start and the stop values from the slice
+        Tuple containing the start and the stop values from the slice.
+        If the dimension is "t" and the slice has a step, the step is
+        given as the third element, so that only every step'th time
+        point is read in the collection.
     """
     #}}}
 
@@ -65,7 +68,8 @@ def slicesToIndices(paths, theSlice, dimension, xguards=False, yguards=False):
 
     # Check for negative indices
     if indices is not None:
-        for ind in range(len(indices)):
+        # NOTE: Only the start and the stop can be negative
+        for ind in range(2):
             if indices[ind] < 0:
                 # Find the last index
                 if dimension == "x":
@@ -100,5 +104,14 @@ def slicesToIndices(paths, theSlice, dimension, xguards=False, yguards=False):
         # Cast to tuple
         indices = (start, end)
 
+        # The stride is pushed down to the time collection
+        if dimension == "t" and type(theSlice) == slice:
+            if theSlice.step is not None and theSlice.step != 1:
+                if theSlice.step < 1:
+                    message = "Only positive steps are allowed in {}".\
+                            format(dimension)
+                    raise ValueError(message)
+                indices = (start, end, theSlice.step)
+
     return indices
 #}}}
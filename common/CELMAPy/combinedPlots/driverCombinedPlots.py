@@ -10,7 +10,6 @@ from ..PDF import getPDF
 from ..PSD import get1DPSD
 from ..superClasses import DriverPointsSuperClass
 from .plotCombinedPlots import PlotCombinedPlots
-from multiprocessing import Process
 
 #{{{driverCombinedPlots
 def driverCombinedPlots(collectPaths     ,\
@@ -173,10 +172,6 @@ class DriverCombinedPlots(DriverPointsSuperClass):
                 self._tSlice           ,\
                 self._plotSuperKwargs  ,\
                )
-        if self._useMultiProcess:
-            processes = Process(target = driverCombinedPlots, args = args)
-            processes.start()
-        else:
-            driverCombinedPlots(*args)
+        self._runTask(driverCombinedPlots, args)
     #}}}
 #}}}
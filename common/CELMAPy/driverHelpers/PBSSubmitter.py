@@ -5,6 +5,11 @@ Class for submitting functions using PBS
 """
 
 from ..driverHelpers import getTime
+from ..collectAndCalcHelpers.collectCache import cacheDirEnv, cacheMaxSizeEnv
+from ..collectAndCalcHelpers.dumpReader import collectWorkersEnv
+from ..collectAndCalcHelpers.scanHelpers import scanWorkersEnv
+from ..plotHelpers.parallelAnimation import renderWorkersEnv
+from ..superClasses.driverSuperClass import driverWorkersEnv, driverMemoryEnv
 from subprocess import run, PIPE
 import inspect
 import os
@@ -272,6 +277,12 @@ class PBSSubmitter(object):
             jobString += "#PBS -m e\n"
         # cd to the folder you are sending the qsub from
         jobString += "cd $PBS_O_WORKDIR\n"
+        # Forward the collect, render and driver settings (if any) to the job
+        for env in (cacheDirEnv, cacheMaxSizeEnv,\
+                    collectWorkersEnv, scanWorkersEnv, renderWorkersEnv,\
+                    driverWorkersEnv, driverMemoryEnv):
+            if env in os.environ:
+                jobString += "export {}={}\n".format(env, os.environ[env])
 
         return jobString
     #}}}
@@ -65,44 +65,33 @@ class CollectAndCalcEnergy(CollectAndCalcSuperClass):
         energies = {}
 
         # Set the slice
+        # NOTE: The step of the slice is dealt with in the collect
         tInd = slicesToIndices(self._collectPaths, self._tSlice, "t")
 
-        if self._tSlice is not None:
-            # Slice the variables with the step
-            # Make a new slice as the collect dealt with the start and
-            # the stop of the slice
-            newSlice = slice(None, None, self._tSlice.step)
-
         # Collect the energies
+        # NOTE: The energies are only functions of time, so all of them
+        #       are collected in one pass rather than in chunks
+        pKey = "particleNumber"
+        varDict = collectiveCollect(self._collectPaths,\
+                                    (*eKeys, *iKeys, pKey),\
+                                    tInd = tInd)
+
         for key in eKeys:
-            var =\
-                collectiveCollect(self._collectPaths, (key,), tInd = tInd)
-            var = var[key][:,0,0,0]
-            if self._tSlice is not None:
-                var = var[newSlice]
+            var = varDict[key][:,0,0,0]
             if self.uc.convertToPhysical:
                 energies[key] = self.uc.physicalConversion(var, "eEnergy")
             else:
                 energies[key] = self.uc.normalizedConversion(var, "eEnergy")
 
         for key in iKeys:
-            var =\
-                collectiveCollect(self._collectPaths, (key,), tInd = tInd)
-            var = var[key][:,0,0,0]
-            if self._tSlice is not None:
-                var = var[newSlice]
+            var = varDict[key][:,0,0,0]
             if self.uc.convertToPhysical:
                 energies[key] = self.uc.physicalConversion(var, "iEnergy")
             else:
                 energies[key] = var
 
         # Special treatment of the potential
-        key = "particleNumber"
-        var =\
-            collectiveCollect(self._collectPaths, (key,), tInd = tInd)
-        var = var[key][:,0,0,0]
-        if self._tSlice is not None:
-            var = var[newSlice]
+        var = varDict[pKey][:,0,0,0]
         # NOTE: Te is a free variable, when normalized, it equals 1
         #       Hence the normalized potential energy equals the
         #       normalized particle number
@@ -117,8 +106,6 @@ class CollectAndCalcEnergy(CollectAndCalcSuperClass):
 
         # Collect the time
         time = collectTime(self._collectPaths, tInd=tInd)
-        if self._tSlice is not None:
-            time = time[newSlice]
         if self.uc.convertToPhysical:
             energies["time"] = self.uc.physicalConversion(time, "t")
         else:
@@ -7,7 +7,6 @@ Contains single driver and driver class for the energies
 from ..superClasses import DriverSuperClass
 from .collectAndCalcEnergy import CollectAndCalcEnergy
 from .plotEnergy import PlotEnergy
-from multiprocessing import Process
 
 #{{{driverEnergy
 def driverEnergy(collectPaths     ,\
@@ -114,10 +113,6 @@ class DriverEnergy(DriverSuperClass):
                  self._tSlice          ,\
                  self._plotSuperKwargs ,\
                 )
-        if self._useMultiProcess:
-            processes = Process(target = driverEnergy, args = args)
-            processes.start()
-        else:
-            driverEnergy(*args)
+        self._runTask(driverEnergy, args)
     #}}}
 #}}}
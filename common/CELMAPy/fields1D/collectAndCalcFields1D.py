@@ -231,6 +231,16 @@ class CollectAndCalcFields1D(CollectAndCalcFieldsSuperClass):
         elif self._mode == "poloidal":
             collecter = collectPoloidalProfile
 
+        # The time average must be taken over all the time points, so in
+        # that case the step is applied after the processing
+        tStep = None
+        if (self._processing is not None) and\
+           ("time" in self._processing.lower()):
+            tInd = collectKwargs["tInd"]
+            if tInd is not None and len(tInd) == 3:
+                tStep = tInd[2]
+                collectKwargs["tInd"] = tInd[:2]
+
         # Collect
         var = collecter(self._collectPaths, self._varName, **collectKwargs)
         time = collectTime(self._collectPaths, collectKwargs["tInd"])
@@ -242,7 +252,7 @@ class CollectAndCalcFields1D(CollectAndCalcFieldsSuperClass):
                 if "time" in self._processing.lower():
                     polAvgTimeAvgVar, timeAvgTime = timeAvg(polAvgVar, t=time)
             if self._processing == "polAvg":
-                var = polAvg
+                var = polAvgVar
             elif self._processing == "polAndTimeAvg":
                 var  = polAvgTimeAvgVar
                 time = timeAvgTime
@@ -253,11 +263,9 @@ class CollectAndCalcFields1D(CollectAndCalcFieldsSuperClass):
                 time = timeAvgTime
 
         # Slice
-        if self._tSlice is not None:
-            if type(self._tSlice) == slice:
-                if self._tSlice.step is not None:
-                    var  = var [::self._tSlice.step]
-                    time = time[::self._tSlice.step]
+        if tStep is not None:
+            var  = var [::tStep]
+            time = time[::tStep]
 
         return var, time
     #}}}
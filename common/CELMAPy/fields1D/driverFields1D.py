@@ -7,9 +7,9 @@ Contains single driver and driver class for 1D fields
 from .collectAndCalcFields1D import CollectAndCalcFields1D
 from .plotFields1D import PlotAnim1DRadial, PlotAnim1DParallel
 from ..collectAndCalcHelpers import calcN, calcUIPar, calcUEPar
+from ..plotHelpers import getDecimation, decimateTSlice
 from ..superClasses import DriverPlotFieldsSuperClass
 from ..modelSpecific import getCollectFieldsAndPlotOrder
-from multiprocessing import Process
 
 #{{{driver1DFieldSingle
 def driver1DFieldSingle(collectPaths     ,\
@@ -74,6 +74,10 @@ def driver1DFieldSingle(collectPaths     ,\
         print("fieldPlotType is not 'mainFields', "\
               "setting 'convertToPhysical' to False")
 
+    # Decimate the frames already in the collection
+    maxFrames, _ = getDecimation(plotSuperKwargs)
+    tSlice = decimateTSlice(collectPaths, tSlice, maxFrames)
+
     ccf1D = CollectAndCalcFields1D(collectPaths,\
                                    mode = mode,\
                                    processing = processing,\
@@ -197,25 +201,11 @@ class Driver1DFields(DriverPlotFieldsSuperClass):
         member data.
         """
         #}}}
-        if self._useMultiProcess:
-            parallelProcess = Process(\
-                                 target = self.driver1DFieldsParallel,\
-                                 args   = ()                         ,\
-                                 kwargs = {}                         ,\
-                                )
-
-            radialProcess = Process(\
-                                 target = self.driver1DFieldsRadial,\
-                                 args   = ()                       ,\
-                                 kwargs = {}                       ,\
-                                )
-            parallelProcess.start()
-            radialProcess  .start()
-            parallelProcess.join()
-            radialProcess  .join()
-        else:
-            self.driver1DFieldsParallel()
-            self.driver1DFieldsRadial()
+        # NOTE: The jobs of both modes are given to the scheduler at
+        #       once, so that they share the workers
+        tasks = self._submitFieldPlotTypes("parallel") +\
+                self._submitFieldPlotTypes("radial")
+        self._waitForTasks(tasks)
     #}}}
 
     #{{{driver1DFieldsParallel
@@ -228,34 +218,8 @@ class Driver1DFields(DriverPlotFieldsSuperClass):
         "parallel" mode using the member data.
         """
         #}}}
-        argTemplate =  [\
-                        self._collectPaths    ,\
-                        self.convertToPhysical,\
-                        self._xInd            ,\
-                        self._ySlice          ,\
-                        self._zInd            ,\
-                        self._tSlice          ,\
-                        "parallel"            ,\
-                        self._hyperIncluded   ,\
-                        self._plotSuperKwargs ,\
-                       ]
-        if self._useMultiProcess:
-            processes = {}
-            for fieldPlotType in Driver1DFields._fieldPlotTypes:
-                args = argTemplate.copy()
-                args.insert(1, fieldPlotType)
-                processes[fieldPlotType] =\
-                    Process(target = driver1DFieldSingle,\
-                            args = args                 ,\
-                            )
-                processes[fieldPlotType].start()
-            for fieldPlotType in Driver1DFields._fieldPlotTypes:
-                processes[fieldPlotType].join()
-        else:
-            for fieldPlotType in Driver1DFields._fieldPlotTypes:
-                args = argTemplate.copy()
-                args.insert(1, fieldPlotType)
-                driver1DFieldSingle(*args)
+        tasks = self._submitFieldPlotTypes("parallel")
+        self._waitForTasks(tasks)
     #}}}
 
     #{{{driver1DFieldsRadial
@@ -268,33 +232,48 @@ class Driver1DFields(DriverPlotFieldsSuperClass):
         "radial" mode using the member data.
         """
         #}}}
-        argTemplate =  [
-                        self._collectPaths    ,\
-                        self.convertToPhysical,\
-                        self._xSlice          ,\
-                        self._yInd            ,\
-                        self._zInd            ,\
-                        self._tSlice          ,\
-                        "radial"              ,\
-                        self._hyperIncluded   ,\
-                        self._plotSuperKwargs ,\
-                       ]
-        if self._useMultiProcess:
-            processes = {}
-            for fieldPlotType in Driver1DFields._fieldPlotTypes:
-                args = argTemplate.copy()
-                args.insert(1, fieldPlotType)
-                processes[fieldPlotType] =\
-                    Process(target = driver1DFieldSingle,\
-                            args = args                 ,\
-                            )
-                processes[fieldPlotType].start()
-            for fieldPlotType in Driver1DFields._fieldPlotTypes:
-                processes[fieldPlotType].join()
-        else:
-            for fieldPlotType in Driver1DFields._fieldPlotTypes:
-                args = argTemplate.copy()
-                args.insert(1, fieldPlotType)
-                driver1DFieldSingle(*args)
+        tasks = self._submitFieldPlotTypes("radial")
+        self._waitForTasks(tasks)
+    #}}}
+
+    #{{{_submitFieldPlotTypes
+    def _submitFieldPlotTypes(self, mode):
+        #{{{docstring
+        """
+        Runs driver1DFieldSingle for all the field plot types.
+
+        Parameters
+        ----------
+        mode : ["parallel"|"radial"]
+            The mode to run.
+
+        Returns
+        -------
+        tasks : tuple
+            The output of _runTask for each field plot type.
+        """
+        #}}}
+
+        if mode == "parallel":
+            xSlice, ySlice = self._xInd, self._ySlice
+        elif mode == "radial":
+            xSlice, ySlice = self._xSlice, self._yInd
+
+        tasks = []
+        for fieldPlotType in Driver1DFields._fieldPlotTypes:
+            args = (self._collectPaths    ,\
+                    fieldPlotType         ,\
+                    self.convertToPhysical,\
+                    xSlice                ,\
+                    ySlice                ,\
+                    self._zInd            ,\
+                    self._tSlice          ,\
+                    mode                  ,\
+                    self._hyperIncluded   ,\
+                    self._plotSuperKwargs ,\
+                   )
+            tasks.append(self._runTask(driver1DFieldSingle, args))
+
+        return tuple(tasks)
     #}}}
 #}}}
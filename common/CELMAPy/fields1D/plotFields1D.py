@@ -88,6 +88,9 @@ class PlotAnim1DRadial(PlotAnim1DSuperClass):
         self._createFiguresAndAxes()
         self._setColors()
 
+        # Decimate the frames and the resolution
+        self._decimateVars()
+
         # Set the plot order
         if plotOrder:
             self._plotOrder = tuple(plotOrder)
@@ -275,6 +278,9 @@ class PlotAnim1DParallel(PlotAnim1DSuperClass):
         self._createFiguresAndAxes()
         self._setColors()
 
+        # Decimate the frames and the resolution
+        self._decimateVars()
+
         # Set the plot order
         if plotOrder:
             self._plotOrder = tuple(plotOrder)
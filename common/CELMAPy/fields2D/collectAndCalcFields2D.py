@@ -231,14 +231,8 @@ class CollectAndCalcFields2D(CollectAndCalcFieldsSuperClass):
             # Remove the inner ghost points from the variable
             var = np.delete(var, (0), axis=1)
 
-        # Slice in t
-        if self._tSlice is not None:
-            if self._tSlice.step is not None:
-                var  = var [::self._tSlice.step]
-                time = time[::self._tSlice.step]
-
         if self._fluct:
-            avg = polAvg(var)
+            avg = polAvg(var, compact=True)
             if self._mode == "par":
                 # The negative must have the same average, but not the same
                 # fluctuations
@@ -280,25 +274,27 @@ class CollectAndCalcFields2D(CollectAndCalcFieldsSuperClass):
 
         normalized = True
 
+        # Collect all the needed variables in one pass
+        if self._varName == "n":
+            varNames = ("lnN",)
+        elif self._varName == "uIPar":
+            varNames = ("lnN", "momDensPar")
+        else:
+            varNames = ("lnN", "momDensPar", "jPar")
         var = collectiveCollect(self._collectPaths,\
-                                ("lnN", )         ,\
+                                varNames          ,\
                                 **collectKwargs)
+
         lnN = var["lnN"]
         n = calcN(lnN, normalized, uc = self.uc)
         if self._varName == "n":
             return {"n":n}
         else:
-            var = collectiveCollect(self._collectPaths,\
-                                    ("momDensPar", )  ,\
-                                    **collectKwargs)
             momDensPar = var["momDensPar"]
             uIPar = calcUIPar(momDensPar, n)
             if self._varName == "uIPar":
                 return {"uIPar":uIPar}
             else:
-                var = collectiveCollect(self._collectPaths,\
-                                        ("jPar", )        ,\
-                                        **collectKwargs)
                 jPar = var["jPar"]
                 uEPar = calcUEPar(uIPar     ,\
                                   jPar      ,\
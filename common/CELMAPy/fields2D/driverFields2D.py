@@ -4,7 +4,7 @@
 Contains single driver and driver class for 2D fields
 """
 
-from ..plotHelpers import getVmaxVminLevels
+from ..plotHelpers import getVmaxVminLevels, getDecimation, decimateTSlice
 from ..superClasses import DriverPlotFieldsSuperClass
 from ..collectAndCalcHelpers import findLargestRadialGradN
 from .collectAndCalcFields2D import CollectAndCalcFields2D
@@ -14,7 +14,6 @@ from .plotFields2D import (PlotAnim2DPerp,\
                            PlotAnim2DPerpPar,\
                            PlotAnim2DPerpPol,\
                            )
-from multiprocessing import Process
 
 #{{{driver2DFieldPerpSingle
 def driver2DFieldPerpSingle(collectPaths     ,\
@@ -63,6 +62,11 @@ def driver2DFieldPerpSingle(collectPaths     ,\
     # Declare mode
     mode = "perp"
 
+    # Decimate the frames already in the collection
+    maxFrames, _ = getDecimation(plotSuperKwargs)
+    # NOTE: The slice is resolved from the first path as in the collect
+    tSlice = decimateTSlice(collectPaths[0], tSlice, maxFrames)
+
     # Create collect object
     ccf2D = CollectAndCalcFields2D(collectPaths             ,\
                                    fluct             = fluct,\
@@ -143,6 +147,11 @@ def driver2DFieldParSingle(collectPaths     ,\
 
     mode = "par"
 
+    # Decimate the frames already in the collection
+    maxFrames, _ = getDecimation(plotSuperKwargs)
+    # NOTE: The slice is resolved from the first path as in the collect
+    tSlice = decimateTSlice(collectPaths[0], tSlice, maxFrames)
+
     # Create collect object
     ccf2D = CollectAndCalcFields2D(collectPaths             ,\
                                    fluct             = fluct,\
@@ -224,6 +233,11 @@ def driver2DFieldPolSingle(collectPaths     ,\
 
     mode = "pol"
 
+    # Decimate the frames already in the collection
+    maxFrames, _ = getDecimation(plotSuperKwargs)
+    # NOTE: The slice is resolved from the first path as in the collect
+    tSlice = decimateTSlice(collectPaths[0], tSlice, maxFrames)
+
     # Create collect object
     ccf2D = CollectAndCalcFields2D(collectPaths             ,\
                                    fluct             = fluct,\
@@ -309,6 +323,11 @@ def driver2DFieldPerpParSingle(collectPaths     ,\
     """
     #}}}
 
+    # Decimate the frames already in the collection
+    maxFrames, _ = getDecimation(plotSuperKwargs)
+    # NOTE: The slice is resolved from the first path as in the collect
+    tSlice = decimateTSlice(collectPaths[0], tSlice, maxFrames)
+
     # Pependicular collection
     ccf2D = CollectAndCalcFields2D(collectPaths              ,\
                                    fluct             = fluct ,\
@@ -407,6 +426,11 @@ def driver2DFieldPerpPolSingle(collectPaths     ,\
     """
     #}}}
 
+    # Decimate the frames already in the collection
+    maxFrames, _ = getDecimation(plotSuperKwargs)
+    # NOTE: The slice is resolved from the first path as in the collect
+    tSlice = decimateTSlice(collectPaths[0], tSlice, maxFrames)
+
     # Pependicular collection
     ccf2D = CollectAndCalcFields2D(collectPaths              ,\
                                    fluct             = fluct ,\
@@ -545,11 +569,7 @@ class Driver2DFields(DriverPlotFieldsSuperClass):
                  self._varyMaxMin      ,\
                  self._plotSuperKwargs ,\
                 )
-        if self._useMultiProcess:
-            processes = Process(target = driver2DFieldPerpSingle, args = args)
-            processes.start()
-        else:
-            driver2DFieldPerpSingle(*args)
+        self._runTask(driver2DFieldPerpSingle, args)
     #}}}
 
     #{{{driver2DFieldsPar
@@ -572,11 +592,7 @@ class Driver2DFields(DriverPlotFieldsSuperClass):
                  self._varyMaxMin      ,\
                  self._plotSuperKwargs ,\
                 )
-        if self._useMultiProcess:
-            processes = Process(target = driver2DFieldParSingle, args = args)
-            processes.start()
-        else:
-            driver2DFieldParSingle(*args)
+        self._runTask(driver2DFieldParSingle, args)
     #}}}
 
     #{{{driver2DFieldsPol
@@ -598,11 +614,7 @@ class Driver2DFields(DriverPlotFieldsSuperClass):
                  self._varyMaxMin      ,\
                  self._plotSuperKwargs ,\
                 )
-        if self._useMultiProcess:
-            processes = Process(target = driver2DFieldPolSingle, args = args)
-            processes.start()
-        else:
-            driver2DFieldPolSingle(*args)
+        self._runTask(driver2DFieldPolSingle, args)
     #}}}
 
     #{{{driver2DFieldsPerpPar
@@ -626,12 +638,7 @@ class Driver2DFields(DriverPlotFieldsSuperClass):
                  self._varyMaxMin      ,\
                  self._plotSuperKwargs ,\
                 )
-        if self._useMultiProcess:
-            processes =\
-                Process(target = driver2DFieldPerpParSingle, args = args)
-            processes.start()
-        else:
-            driver2DFieldPerpParSingle(*args)
+        self._runTask(driver2DFieldPerpParSingle, args)
     #}}}
 
     #{{{driver2DFieldsPerpPol
@@ -655,11 +662,6 @@ class Driver2DFields(DriverPlotFieldsSuperClass):
                  self._varyMaxMin      ,\
                  self._plotSuperKwargs ,\
                 )
-        if self._useMultiProcess:
-            processes =\
-                Process(target = driver2DFieldPerpPolSingle, args = args)
-            processes.start()
-        else:
-            driver2DFieldPerpPolSingle(*args)
+        self._runTask(driver2DFieldPerpPolSingle, args)
     #}}}
 #}}}
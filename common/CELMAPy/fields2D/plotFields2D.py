@@ -80,6 +80,10 @@ class PlotAnim2DPerp(PlotAnim2DSuperClass):
         """
         #}}}
 
+        # Decimate the frames and the resolution
+        time, (Z_RT,), (X_RT, Y_RT) =\
+            self._decimate(time, (Z_RT,), (X_RT, Y_RT))
+
         self._X_RT     = X_RT
         self._Y_RT     = Y_RT
         self._Z_RT     = Z_RT
@@ -133,6 +137,10 @@ class PlotAnim2DPerp(PlotAnim2DSuperClass):
         """
         #}}}
 
+        if self._renderMode == "pcolormesh":
+            self._updatePerpMeshInTime(tInd)
+            return
+
         # Clear previous axis
         self._perpAx.cla()
 
@@ -174,8 +182,66 @@ class PlotAnim2DPerp(PlotAnim2DSuperClass):
         self._perpAx.axis("equal")
     #}}}
 
+    #{{{_updatePerpMeshInTime
+    def _updatePerpMeshInTime(self, tInd):
+        #{{{docstring
+        """
+        Updates the perpendicular axis by reusing the artists.
+
+        * Updates the quad mesh
+        * Replaces the phi contours
+        * Updates the text
+        * Updates the colorbar
+
+        The labels and the formatting are only set in the first frame.
+
+        Parameters
+        ----------
+        tInd : int
+            The current time index.
+        """
+        #}}}
+
+        firstFrame = not("perp" in self._meshes)
+
+        # Plot the perpendicular plane
+        perpPlane = self._updateMesh(self._perpAx             ,\
+                                     "perp"                   ,\
+                                     self._X_RT               ,\
+                                     self._Y_RT               ,\
+                                     self._Z_RT[tInd, :, :]   ,\
+                                     tInd)
+
+        if self._overplotPhi:
+            self._updatePhiContours(\
+                self._perpAx,\
+                "perp",\
+                ((self._X_RT, self._Y_RT, self._phi[tInd, :, :]),),\
+                colors = "k", alpha=0.3)
+
+        if firstFrame:
+            # Set rasterization order
+            self._perpAx.set_rasterization_zorder(self._axRasterization)
+            # Draw the grids
+            self._perpAx.grid(True)
+            # Set x and y labels
+            self._perpAx.set_xlabel(self._ph.rhoTxtDict["rhoTxtLabel"])
+            self._perpAx.set_ylabel(self._ph.rhoTxtDict["rhoTxtLabel"])
+            self._perpAx.locator_params(axis='x',nbins=7)
+
+        # Update the text
+        self._updatePerpPlotTxt(tInd, formatAxes = firstFrame)
+
+        # Update the colorbar
+        self._updateMeshColorbar(self._fig, perpPlane, self._cBarAx, tInd)
+
+        if firstFrame:
+            # Set equal axis
+            self._perpAx.axis("equal")
+    #}}}
+
     #{{{_updatePerpPlotTxt
-    def _updatePerpPlotTxt(self, tInd):
+    def _updatePerpPlotTxt(self, tInd, formatAxes = True):
         #{{{docstring
         """
         Updates the perpPlane plot by updating the axis, the title and
@@ -185,8 +251,8 @@ class PlotAnim2DPerp(PlotAnim2DSuperClass):
         ----------
         tInd : int
             The index to plot for
-        perpAx : Axis
-            The axis to update
+        formatAxes : bool
+            Whether or not to format the axes.
 
         See the docstring of plotPerpPlane for details.
         """
@@ -201,12 +267,13 @@ class PlotAnim2DPerp(PlotAnim2DSuperClass):
         self._perpAx.set_title(self._axTitle.format(perpTitle, timeTitle))
 
         # Format axes
-        self._ph.makePlotPretty(self._perpAx,\
-                                xprune   = "both",\
-                                yprune   = "both",\
-                                legend   = False,\
-                                rotation = 60,\
-                                )
+        if formatAxes:
+            self._ph.makePlotPretty(self._perpAx,\
+                                    xprune   = "both",\
+                                    yprune   = "both",\
+                                    legend   = False,\
+                                    rotation = 60,\
+                                    )
     #}}}
 #}}}
 
@@ -280,6 +347,10 @@ class PlotAnim2DPar(PlotAnim2DSuperClass):
         """
         #}}}
 
+        # Decimate the frames and the resolution
+        time, (Z_RZ, Z_RZ_PPi), (X_RZ, Y_RZ) =\
+            self._decimate(time, (Z_RZ, Z_RZ_PPi), (X_RZ, Y_RZ))
+
         self._X_RZ       = X_RZ
         self._Y_RZ       = Y_RZ
         self._Z_RZ       = Z_RZ
@@ -334,6 +405,10 @@ class PlotAnim2DPar(PlotAnim2DSuperClass):
         """
         #}}}
 
+        if self._renderMode == "pcolormesh":
+            self._updateParMeshInTime(tInd)
+            return
+
         # Clear previous axis
         self._parAx.cla()
 
@@ -378,8 +453,66 @@ class PlotAnim2DPar(PlotAnim2DSuperClass):
         self._cBar.set_label(self._varLabel)
     #}}}
 
+    #{{{_updateParMeshInTime
+    def _updateParMeshInTime(self, tInd):
+        #{{{docstring
+        """
+        Updates the parallel axis by reusing the artists.
+
+        * Updates the quad meshes
+        * Replaces the phi contours
+        * Updates the text
+        * Updates the colorbar
+
+        The labels and the formatting are only set in the first frame.
+
+        Parameters
+        ----------
+        tInd : int
+            The current time index.
+        """
+        #}}}
+
+        firstFrame = not("par" in self._meshes)
+
+        # The two halves share the color limits
+        Z     = self._Z_RZ    [tInd, :, :]
+        Z_PPi = self._Z_RZ_PPi[tInd, :, :]
+        clim  = (min(np.min(Z), np.min(Z_PPi)), max(np.max(Z), np.max(Z_PPi)))
+
+        # Plot the parallel plane
+        self._updateMesh(self._parAx, "par",\
+                         self._X_RZ, self._Y_RZ, Z, tInd, clim)
+        # Plot the negative parallel plane
+        parPlane = self._updateMesh(self._parAx, "parPPi",\
+                                    -self._X_RZ, self._Y_RZ, Z_PPi, tInd, clim)
+
+        if self._overplotPhi:
+            self._updatePhiContours(\
+                self._parAx,\
+                "par",\
+                (( self._X_RZ, self._Y_RZ, self._phi   [tInd, :, :]),\
+                 (-self._X_RZ, self._Y_RZ, self._phiPPi[tInd, :, :])),\
+                colors = "k")
+
+        if firstFrame:
+            # Set rasterization order
+            self._parAx.set_rasterization_zorder(self._axRasterization)
+            # Draw the grids
+            self._parAx.grid(True)
+            # Set x and y labels
+            self._parAx.set_xlabel(self._ph.rhoTxtDict["rhoTxtLabel"])
+            self._parAx.set_ylabel(self._ph.zTxtDict["zTxtLabel"])
+
+        # Update the text
+        self._updateParPlotTxt(tInd, formatAxes = firstFrame)
+
+        # Update the colorbar
+        self._updateMeshColorbar(self._fig, parPlane, self._cBarAx, tInd)
+    #}}}
+
     #{{{_updateParPlotTxt
-    def _updateParPlotTxt(self, tInd):
+    def _updateParPlotTxt(self, tInd, formatAxes = True):
         #{{{docstring
         """
         Updates the parPlane plot by updating the axis, the title and
@@ -389,8 +522,8 @@ class PlotAnim2DPar(PlotAnim2DSuperClass):
         ----------
         tInd : int
             The index to plot for
-        parAx : Axis
-            The axis to update
+        formatAxes : bool
+            Whether or not to format the axes.
 
         See the docstring of plotParPlane for details.
         """
@@ -408,12 +541,13 @@ class PlotAnim2DPar(PlotAnim2DSuperClass):
         self._parAx.set_title(self._axTitle.format(parTitle, timeTitle))
 
         # Format axes
-        self._ph.makePlotPretty(self._parAx,\
-                                xprune   = "both",\
-                                yprune   = "both",\
-                                legend   = False,\
-                                rotation = 60,\
-                                )
+        if formatAxes:
+            self._ph.makePlotPretty(self._parAx,\
+                                    xprune   = "both",\
+                                    yprune   = "both",\
+                                    legend   = False,\
+                                    rotation = 60,\
+                                    )
     #}}}
 #}}}
 
@@ -484,6 +618,12 @@ class PlotAnim2DPol(PlotAnim2DSuperClass):
         """
         #}}}
 
+        # Decimate the frames and the resolution
+        # NOTE: The data is transposed with respect to the mesh
+        time, (Z_ZT,), (X_ZT, Y_ZT) =\
+            self._decimate(time, (Z_ZT,), (X_ZT, Y_ZT),\
+                           transposedMeshes = True)
+
         self._X_ZT     = X_ZT
         self._Y_ZT     = Y_ZT
         self._Z_ZT     = Z_ZT
@@ -537,6 +677,10 @@ class PlotAnim2DPol(PlotAnim2DSuperClass):
         """
         #}}}
 
+        if self._renderMode == "pcolormesh":
+            self._updatePolMeshInTime(tInd)
+            return
+
         # Clear previous axis
         self._polAx.cla()
 
@@ -582,8 +726,67 @@ class PlotAnim2DPol(PlotAnim2DSuperClass):
         self._cBar.set_label(self._varLabel)
     #}}}
 
+    #{{{_updatePolMeshInTime
+    def _updatePolMeshInTime(self, tInd):
+        #{{{docstring
+        """
+        Updates the poloidal axis by reusing the artists.
+
+        * Updates the quad mesh
+        * Replaces the phi contours
+        * Updates the text
+        * Updates the colorbar
+
+        The labels and the formatting are only set in the first frame.
+
+        Parameters
+        ----------
+        tInd : int
+            The current time index.
+        """
+        #}}}
+
+        firstFrame = not("pol" in self._meshes)
+
+        # Plot the poloidal plane
+        polPlane = self._updateMesh(self._polAx                       ,\
+                                    "pol"                             ,\
+                                    self._X_ZT                        ,\
+                                    self._Y_ZT                        ,\
+                                    self._Z_ZT[tInd, :, :].transpose(),\
+                                    tInd)
+
+        if self._overplotPhi:
+            self._updatePhiContours(\
+                self._polAx,\
+                "pol",\
+                ((self._X_ZT, self._Y_ZT, self._phi[tInd, :, :].transpose()),),\
+                colors = "k")
+
+        if firstFrame:
+            # Set rasterization order
+            self._polAx.set_rasterization_zorder(self._axRasterization)
+            # Draw the grids
+            self._polAx.grid(True)
+            # Set x and y labels
+            self._polAx.set_xlabel(r"$\theta$")
+            self._polAx.set_ylabel(self._ph.zTxtDict["zTxtLabel"])
+
+        # Update the text
+        self._updatePolPlotTxt(tInd, formatAxes = firstFrame)
+
+        if firstFrame:
+            # Tweak latex on x-axis
+            self._polAx.set_xticks([0, np.pi/2, np.pi, 3*np.pi/2, 2*np.pi])
+            self._polAx.set_xticklabels(\
+                    (r"$0$", r"$\pi/2$", r"$\pi$", r"$3\pi/2$", r"$2\pi$"))
+
+        # Update the colorbar
+        self._updateMeshColorbar(self._fig, polPlane, self._cBarAx, tInd)
+    #}}}
+
     #{{{_updatePolPlotTxt
-    def _updatePolPlotTxt(self, tInd):
+    def _updatePolPlotTxt(self, tInd, formatAxes = True):
         #{{{docstring
         """
         Updates the polPlane plot by updating the axis, the title and
@@ -593,8 +796,8 @@ class PlotAnim2DPol(PlotAnim2DSuperClass):
         ----------
         tInd : int
             The index to plot for
-        polAx : Axis
-            The axis to update
+        formatAxes : bool
+            Whether or not to format the axes.
 
         See the docstring of plotPolPlane for details.
         """
@@ -611,11 +814,12 @@ class PlotAnim2DPol(PlotAnim2DSuperClass):
         self._polAx.set_title(self._axTitle.format(polTitle, timeTitle))
 
         # Format axes
-        self._ph.makePlotPretty(self._polAx,\
-                                xprune   = "both",\
-                                yprune   = "both",\
-                                legend   = False,\
-                                )
+        if formatAxes:
+            self._ph.makePlotPretty(self._polAx,\
+                                    xprune   = "both",\
+                                    yprune   = "both",\
+                                    legend   = False,\
+                                    )
     #}}}
 #}}}
 
@@ -734,11 +938,16 @@ class PlotAnim2DPerpPar(PlotAnim2DPerp, PlotAnim2DPar):
         """
         #}}}
 
+        # NOTE: The axes are not cleared in the "pcolormesh" mode, so
+        #       the lines are only drawn in the first frame
+        drawLines = not("perp" in self._meshes)
+
         self._updatePerpAxInTime(tInd)
         self._updateParAxInTime(tInd)
 
         # Draw the lines
-        self._drawLines()
+        if drawLines:
+            self._drawLines()
 
         timeTitle = self._ph.tTxtDict["constTTxt"].format(self._ph.tTxtDict)
         self._fig.suptitle("{}\n\n\n".format(timeTitle), x = 0.445)
@@ -889,11 +1098,16 @@ class PlotAnim2DPerpPol(PlotAnim2DPerp, PlotAnim2DPol):
         """
         #}}}
 
+        # NOTE: The axes are not cleared in the "pcolormesh" mode, so
+        #       the lines are only drawn in the first frame
+        drawLines = not("perp" in self._meshes)
+
         self._updatePerpAxInTime(tInd)
         self._updatePolAxInTime(tInd)
 
         # Draw the lines
-        self._drawLines()
+        if drawLines:
+            self._drawLines()
 
         timeTitle = self._ph.tTxtDict["constTTxt"].format(self._ph.tTxtDict)
         self._fig.suptitle("{}\n\n\n".format(timeTitle), x = 0.445)
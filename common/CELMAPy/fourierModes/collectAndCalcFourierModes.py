@@ -6,6 +6,7 @@ Contains class for collecting and calculating the fourier modes
 
 from ..superClasses import CollectAndCalcPointsSuperClass
 from ..collectAndCalcHelpers import (collectTime,\
+                                     collectiveCollect,\
                                      collectPoloidalProfile,\
                                      calcN,\
                                      calcUIPar,\
@@ -74,15 +75,14 @@ class CollectAndCalcFourierModes(CollectAndCalcPointsSuperClass):
             key = "{},{}".format(rho,par)
             fourierModes[key] = {}
 
+            # NOTE: The step of the slice is dealt with in the collect
             if self._tSlice is not None:
                 t = slicesToIndices(self._collectPaths, self._tSlice[tCounter], "t")
-                tStep = self._tSlice[tCounter].step
             else:
                 t = None
-                tStep = None
             tCounter += 1
 
-            var, time = self._collectWrapper(fourierModes,key,x,y,t,tStep)
+            var, time = self._collectWrapper(fourierModes,key,x,y,t)
 
             if self.uc.convertToPhysical:
                 fourierModes[key][self._varName] =\
@@ -96,6 +96,109 @@ class CollectAndCalcFourierModes(CollectAndCalcPointsSuperClass):
         return fourierModes
     #}}}
 
+    #{{{executeCollectAndCalcBatched
+    def executeCollectAndCalcBatched(self, nModes = None):
+        #{{{docstring
+        """
+        Function which collects and calculates the fourier modes of all
+        the points at once.
+
+        The (t, x, y, z) block spanning all the points is collected in
+        one pass for each distinct time slice, and a real fourier
+        transform is taken along z for all the points at once.
+        As the signal is real, only the non-negative modes are kept.
+
+        The number of z points is stored in self.nz, and must be given
+        to calcMagnitude.
+
+        Parameters
+        ----------
+        nModes : [None|int]
+            If given, only the offset mode and the nModes first modes
+            are kept.
+
+        Returns
+        -------
+        fourierModes : dict
+            Dictionary where the keys are on the form "rho,z".
+            The value is a dict containing of
+            {varName:fourierModes, "time":time}.
+            The fourierModes is a 4d array of the non-negative modes.
+        """
+        #}}}
+
+        # Guard
+        if len(self._notCalled) > 0:
+            message = "The following functions were not called:\n{}".\
+                        format("\n".join(self._notCalled))
+            raise RuntimeError(message)
+
+        # Group the points by the time indices
+        groups = {}
+        for pointNr, (x, y) in enumerate(zip(self._xInd, self._yInd)):
+            # NOTE: The step of the slice is dealt with in the collect
+            if self._tSlice is not None:
+                t = slicesToIndices(self._collectPaths,\
+                                    self._tSlice[pointNr], "t")
+                t = tuple(t) if t is not None else None
+            else:
+                t = None
+            groups.setdefault(t, []).append((pointNr, x, y))
+
+        fourierModes = {}
+        for t, points in groups.items():
+            pointNrs, xs, ys = (np.array(ind) for ind in zip(*points))
+            xMin, xMax = xs.min(), xs.max()
+            yMin, yMax = ys.min(), ys.max()
+
+            time = collectTime(self._collectPaths, tInd=t)
+
+            # Collect the block spanning all the points of the group
+            if self._varName == "n":
+                varNames = ("lnN",)
+            elif self._varName == "uIPar":
+                varNames = ("lnN", "momDensPar")
+            elif self._varName == "uEPar":
+                varNames = ("lnN", "momDensPar", "jPar")
+            else:
+                varNames = (self._varName,)
+            block = collectiveCollect(self._collectPaths    ,\
+                                      varNames              ,\
+                                      xInd = (xMin, xMax)   ,\
+                                      yInd = (yMin, yMax)   ,\
+                                      tInd = t              ,\
+                                     )
+
+            # Pick out the poloidal profiles on the form (t, point, z)
+            profiles = {varName:block[varName][:, xs - xMin, ys - yMin, :]\
+                        for varName in varNames}
+            del block
+            var = self._calcBatchedVar(profiles)
+
+            # Fourier transform all the points at once
+            self.nz = var.shape[-1]
+            modes = np.fft.rfft(var, axis=-1)
+            if nModes is not None:
+                modes = modes[..., :nModes+1]
+
+            if self.uc.convertToPhysical:
+                modes = self.uc.physicalConversion(modes, self._varName)
+                time  = self.uc.physicalConversion(time , "t")
+
+            for ind, (x, y) in enumerate(zip(xs, ys)):
+                rho = self._dh.rho[x]
+                par = self._dh.z  [y]
+                key = "{},{}".format(rho,par)
+                # NOTE: The copy releases the modes which are not kept
+                fourierModes[key] =\
+                    {self._varName:\
+                        np.ascontiguousarray(\
+                            modes[:, ind, np.newaxis, np.newaxis, :]),\
+                     "time":time}
+
+        return fourierModes
+    #}}}
+
     #{{{convertTo2D
     def convertTo2D(self, fourierModes):
         #{{{docstring
@@ -122,7 +225,7 @@ class CollectAndCalcFourierModes(CollectAndCalcPointsSuperClass):
     #}}}
 
     #{{{_collectWrapper
-    def _collectWrapper(self,fourierModes,key,x,y,t,tStep):
+    def _collectWrapper(self,fourierModes,key,x,y,t):
         #{{{docstring
         """
         Collects the variable and the time.
@@ -144,8 +247,6 @@ class CollectAndCalcFourierModes(CollectAndCalcPointsSuperClass):
             The z index to collect from
         t : [None|tuple]
             The collect-like slice in t
-        tStep : [None|int]
-            The step to chop the time variable in
 
         Returns
         -------
@@ -171,15 +272,6 @@ class CollectAndCalcFourierModes(CollectAndCalcPointsSuperClass):
         # Fourier transform
         var = np.fft.fft(var)
 
-        if tStep is not None:
-            # Slice the variables with the step
-            # Make a new slice as the collect dealt with the start and
-            # the stop of the slice
-            newSlice = slice(None, None, tStep)
-
-            var  = var [newSlice]
-            time = time[newSlice]
-
         return var, time
     #}}}
 
@@ -211,23 +303,28 @@ class CollectAndCalcFourierModes(CollectAndCalcPointsSuperClass):
 
         normalized = True
 
-        lnN = collector(self._collectPaths,\
-                        "lnN"             ,\
+        # Collect all the needed variables in one pass
+        if self._varName == "n":
+            varNames = ("lnN",)
+        elif self._varName == "uIPar":
+            varNames = ("lnN", "momDensPar")
+        else:
+            varNames = ("lnN", "momDensPar", "jPar")
+        var = collector(self._collectPaths,\
+                        varNames          ,\
                         *indArgs, tInd=t)
+
+        lnN = var["lnN"]
         n = calcN(lnN, normalized, uc = self.uc)
         if self._varName == "n":
             return n
         else:
-            momDensPar = collector(self._collectPaths,\
-                                   "momDensPar"      ,\
-                                   *indArgs, tInd=t)
+            momDensPar = var["momDensPar"]
             uIPar = calcUIPar(momDensPar, n)
             if self._varName == "uIPar":
                 return uIPar
             else:
-                jPar = collector(self._collectPaths,\
-                                "jPar"            ,\
-                                *indArgs, tInd=t)
+                jPar = var["jPar"]
                 uEPar = calcUEPar(uIPar     ,\
                                   jPar      ,\
                                   n         ,\
@@ -235,6 +332,46 @@ class CollectAndCalcFourierModes(CollectAndCalcPointsSuperClass):
                 return uEPar
     #}}}
 
+    #{{{_calcBatchedVar
+    def _calcBatchedVar(self, profiles):
+        #{{{docstring
+        """
+        Calculates the variable from the collected poloidal profiles
+
+        NOTE: As in _calcNonSolvedVars the profiles are normalized, and
+              the conversion to physical happens later.
+
+        Parameters
+        ----------
+        profiles : dict
+            Dictionary of the collected variables on the form
+            (t, point, z).
+
+        Returns
+        -------
+        var : 3d-array
+            The variable on the form (t, point, z).
+        """
+        #}}}
+
+        normalized = True
+
+        if not(self._varName == "n" or\
+               self._varName == "uIPar" or\
+               self._varName == "uEPar"):
+            return profiles[self._varName]
+
+        n = calcN(profiles["lnN"], normalized, uc = self.uc)
+        if self._varName == "n":
+            return n
+
+        uIPar = calcUIPar(profiles["momDensPar"], n)
+        if self._varName == "uIPar":
+            return uIPar
+
+        return calcUEPar(uIPar, profiles["jPar"], n, normalized)
+    #}}}
+
     @staticmethod
     #{{{obtainVarName
     def obtainVarName(fourierModes2d):
@@ -269,7 +406,7 @@ class CollectAndCalcFourierModes(CollectAndCalcPointsSuperClass):
 
     @staticmethod
     #{{{calcMagnitude
-    def calcMagnitude(fourierModes2d):
+    def calcMagnitude(fourierModes2d, nz = None):
         #{{{docstring
         """
         Calculates the magnitude of the 2d fourier signal.
@@ -281,22 +418,27 @@ class CollectAndCalcFourierModes(CollectAndCalcPointsSuperClass):
             The value is a dict containing of at least
             {varName:fourierModes}.
             The fourierModes is a 2d array on the form (t,mode).
+        nz : [None|int]
+            If None, the fourierModes are the full spectra from
+            executeCollectAndCalc.
+            If given, the fourierModes are the non-negative modes from
+            executeCollectAndCalcBatched of a signal with nz points.
 
         Returns
         -------
         fourierModes2d : dict
             As the input, but contains the key varNameMagnitude with
             values on the form (t, (nz/2) + 1) for each position.
+            Only the kept modes are given if nz is given.
         """
         #}}}
 
         varName = CollectAndCalcFourierModes.obtainVarName(fourierModes2d)
 
         for key in fourierModes2d.keys():
-            modes = fourierModes2d[key][varName].copy()
-            tSize, N  = modes.shape
+            modes = fourierModes2d[key][varName]
+            N = modes.shape[1]
             nyquistMode = int(N/2) + 1
-            magnitude = np.zeros((tSize, nyquistMode))
             #{{{ NOTE: We are dealing with a real signal:
             #          As the fourier transform breaks the signal up in
             #          cisoids there will be one part of the signal in
@@ -309,17 +451,21 @@ class CollectAndCalcFourierModes(CollectAndCalcPointsSuperClass):
             #}}}
             # Magnitude of the signal
             # https://en.wikipedia.org/wiki/Discrete_Fourier_transform#Definition
-            # The offset mode and the Nyquist mode
-            magnitude[:,0]             = np.abs(modes[:,0])/N
-            # Minus 1 as indices count from 0
-            magnitude[:,nyquistMode-1] = np.abs(modes[:,nyquistMode])/N
-            # Loop over all the modes
-            # NOTE: Range exludes the last point
-            # Minus 1 as indices count from 0
-            for modeNr in range(1, nyquistMode-1):
-                posFreq              = np.abs(modes[:,  modeNr])
-                negFreq              = np.abs(modes[:, -modeNr])
-                magnitude[:, modeNr] = (posFreq + negFreq)/N
+            # NOTE: The offset mode and the Nyquist mode (only present
+            #       for even N) have no negative counterpart
+            if nz is None:
+                absModes  = np.abs(modes)
+                magnitude = absModes[:, :nyquistMode].copy()
+                # Add the negative frequencies
+                nNegative = int((N-1)/2)
+                magnitude[:, 1:nNegative+1] += absModes[:, :N-nNegative-1:-1]
+                magnitude /= N
+            else:
+                # The negative frequencies equals the positive
+                magnitude = np.abs(modes)
+                nNegative = int((nz-1)/2)
+                magnitude[:, 1:nNegative+1] *= 2
+                magnitude /= nz
 
             # Insert into the dict
             fourierModes2d[key][varName+"Magnitude"] = magnitude
@@ -328,7 +474,7 @@ class CollectAndCalcFourierModes(CollectAndCalcPointsSuperClass):
 
     @staticmethod
     #{{{calcAngularFrequency
-    def calcAngularFrequency(fourierModes2d):
+    def calcAngularFrequency(fourierModes2d, nz = None):
         #{{{docstring
         """
         Calculates the phaseShift of the 2d fourier signal.
@@ -340,12 +486,18 @@ class CollectAndCalcFourierModes(CollectAndCalcPointsSuperClass):
             The value is a dict containing of
             {varName:fourierModes, "time":time}.
             The fourierModes is a 2d array on the form (t,mode).
+        nz : [None|int]
+            If None, the fourierModes are the full spectra from
+            executeCollectAndCalc.
+            If given, the fourierModes are the non-negative modes from
+            executeCollectAndCalcBatched of a signal with nz points.
 
         Returns
         -------
         fourierModes2d : dict
             As the input, but contains the key varNameAngularFrequency
             with values on the form (t, (nz/2) + 1) for each position.
+            Only the kept modes are given if nz is given.
             NOTE: A negative angular frequency means that the
                   perturbations are moving in the negative theta
                   direction.
@@ -355,11 +507,11 @@ class CollectAndCalcFourierModes(CollectAndCalcPointsSuperClass):
         varName = CollectAndCalcFourierModes.obtainVarName(fourierModes2d)
 
         for key in fourierModes2d.keys():
-            modes    = fourierModes2d[key][varName].copy()
+            modes    = fourierModes2d[key][varName]
             time     = fourierModes2d[key]["time"]
-            tSize, N = modes.shape
-            nyquistMode = int(N/2) + 1
-            angularFreq = np.zeros((tSize-1, nyquistMode))
+            N = modes.shape[1]
+            # NOTE: Only the non-negative modes are present if nz is given
+            nyquistMode = int(N/2) + 1 if nz is None else N
             #{{{ NOTE: We are dealing with a real signal:
             #          As the signal is real only one of the phase sifts
             #          are needed. Notice that for a real signal the
@@ -370,40 +522,16 @@ class CollectAndCalcFourierModes(CollectAndCalcPointsSuperClass):
             # The phase shift is found from atan2
             # http://dsp.stackexchange.com/questions/23994/meaning-of-real-and-imaginary-part-of-fourier-transform-of-a-signal
             # atan2 in [-pi, pi]
-            for modeNr in range(0, nyquistMode):
-                for tInd in range(1, tSize):
-                    deltaT = time[tInd] - time[tInd-1]
-                    prevPhaseShift = np.arctan2(modes[tInd-1, modeNr].imag,\
-                                                modes[tInd-1, modeNr].real)
-                    curPhaseShift  = np.arctan2(modes[tInd  , modeNr].imag,\
-                                                modes[tInd  , modeNr].real)
-                    # phaseShiftDiff in [0, 2*pi]
-                    phaseShiftDiff = prevPhaseShift - curPhaseShift
-
-                    # Corrections
-                    if curPhaseShift*prevPhaseShift < 0\
-                       and abs(curPhaseShift) + abs(prevPhaseShift) > np.pi:
-                        if curPhaseShift < 0:
-                            # We are going from pi to -pi
-                            # In order to avoid the discontinuity, we turn
-                            # curPhaseShift and prevPhaseShift to the opposite
-                            # quadrants
-                            tempCurPhase   = np.pi + curPhaseShift
-                            tempPrevPhase  = np.pi - prevPhaseShift
-                            phaseShiftDiff = -(tempCurPhase + tempPrevPhase)
-                        else:
-                            # We are going from -pi to pi
-                            # In order to avoid the discontinuity, we
-                            # turn curPhaseShift and prevPhaseShift to
-                            # the opposite quadrants
-                            tempCurPhase   = np.pi - curPhaseShift
-                            tempPrevPhase  = np.pi + prevPhaseShift
-                            phaseShiftDiff = tempCurPhase + tempPrevPhase
-
-                    # The angular speed (angular frequency) has units rad/s.
-                    # Remember that if angularFreq*t = 2*pi the perturbation has
-                    # revolved one time
-                    angularFreq[tInd-1, modeNr] = phaseShiftDiff/deltaT
+            phaseShift = np.angle(modes[:, :nyquistMode])
+            # Unwrapping removes the discontinuity when going between pi
+            # and -pi, so that the difference is in [-pi, pi]
+            # NOTE: The difference is taken as previous minus current
+            phaseShiftDiff = -np.diff(np.unwrap(phaseShift, axis=0), axis=0)
+
+            # The angular speed (angular frequency) has units rad/s.
+            # Remember that if angularFreq*t = 2*pi the perturbation has
+            # revolved one time
+            angularFreq = phaseShiftDiff/np.diff(time)[:, np.newaxis]
 
             # Insert into the dict
             fourierModes2d[key][varName+"AngularFrequency"] = angularFreq
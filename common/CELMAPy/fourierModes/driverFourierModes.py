@@ -7,7 +7,6 @@ Contains single driver and driver class for the fourier modes
 from ..superClasses import DriverPointsSuperClass
 from .collectAndCalcFourierModes import CollectAndCalcFourierModes
 from .plotFourierModes import PlotFourierModes
-from multiprocessing import Process
 
 #{{{driverFourierModes
 def driverFourierModes(collectPaths     ,\
@@ -56,9 +55,10 @@ def driverFourierModes(collectPaths     ,\
     ccfm.setVarName(varName)
 
     # Execute the collection
-    fm = ccfm.executeCollectAndCalc()
+    # NOTE: Only the modes to be plotted are kept
+    fm = ccfm.executeCollectAndCalcBatched(nModes)
     fm = ccfm.convertTo2D(fm)
-    fm = ccfm.calcMagnitude(fm)
+    fm = ccfm.calcMagnitude(fm, nz = ccfm.nz)
 
     # Plot
     pfm = PlotFourierModes(ccfm.uc         ,\
@@ -143,10 +143,6 @@ class DriverFourierModes(DriverPointsSuperClass):
                  self._indicesKwargs   ,\
                  self._plotSuperKwargs ,\
                 )
-        if self._useMultiProcess:
-            processes = Process(target = driverFourierModes, args = args)
-            processes.start()
-        else:
-            driverFourierModes(*args)
+        self._runTask(driverFourierModes, args)
     #}}}
 #}}}
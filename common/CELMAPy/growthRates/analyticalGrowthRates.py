@@ -15,7 +15,6 @@ Analytical expression for growth rates in drift waves given by
    IOP Publishing 2016
 """
 
-from scipy.optimize import fsolve
 import scipy.constants as cst
 import numpy as np
 
@@ -32,25 +31,28 @@ def ellisAnalytical(omStar, bEllis, nuPar, om1, nuIN):
         * All input parameters must be in non-normalized units.
         * Underlying assumption kx >> (1/n)(dn/dx)
 
+        * The input parameters can be arrays, in which case they are
+          broadcasted against each other.
+
     Parameters
     ----------
-    omStar : float
+    omStar : [float|array]
         Parameter telling about electron diamagnetic frequency.
-    bEllis : float
+    bEllis : [float|array]
         The Ellis definition of b.
         Tells something about the size of the perturbation as compared
         to rhoS.
-    nuPar : float
+    nuPar : [float|array]
         Parameter which tells something about the conductivity.
-    om1 : float
+    om1 : [float|array]
         Parameter which tells something about the streaming of the
         electrons.
-    nuIN : float
+    nuIN : [float|array]
         The ion-neutral collision frequency
 
     Returns
     -------
-    om : complex
+    om : [complex|array]
         The omega in exp(-i[k*x-omega*t])
     """
     #}}}
@@ -61,7 +63,9 @@ def ellisAnalytical(omStar, bEllis, nuPar, om1, nuIN):
               ((omStar/((1+b)**2)) + om1)\
             - (b/(b+1))*nuIN
 
-    om = complex(real, imag)
+    om = real + 1j*imag
+    if np.ndim(om) == 0:
+        om = complex(om)
     return om
 #}}}
 
@@ -78,65 +82,63 @@ def pecseliAnalytical(omStar, bPecseli, sigmaPar):
           i.e. that the perturbations in x are very long.
         * All input parameters must be in non-normalized units.
 
+        * The input parameters can be arrays, in which case they are
+          broadcasted against each other.
+
+    Equation 5.25 in Pecseli's draft can be written as the quadratic
+
+        om**2 + i*sigmaPar*(b+1)*om - i*sigmaPar*omStar = 0
+
+    The sum of the imaginary parts of the roots is -sigmaPar*(b+1), so
+    at most one root is growing. The drift wave root, which is the
+    growing one, is returned as the root with the largest imaginary
+    part. For sigmaPar*(b+1) >> omStar the other root is strongly
+    damped (the imaginary part is close to -sigmaPar*(b+1)).
+
+    NOTE: This is a different root branch than the one obtained by the
+          earlier fsolve implementation (started in (-1e5, 1e5)) for
+          small sigmaPar. There, fsolve could converge to the damped
+          root (or not converge at all), so the analytic growth rates
+          changed for small sigmaPar.
+
     Parameters
     ----------
-    omStar : float
+    omStar : [float|array]
         Parameter telling about electron diamagnetic frequency.
-    bPecseli : float
+    bPecseli : [float|array]
         The Pecseli definition of b.
         Tells something about the size of the perturbation as compared
         to rhoS.
-    sigmaPar : float
+    sigmaPar : [float|array]
         Parameter which tells something about the conductivity.
 
     Returns
     -------
-    om : complex
+    om : [complex|array]
         The omega in exp(-i[k*x-omega*t])
     """
     #}}}
 
     b = bPecseli
 
-    def fullExpression(om, sigmaPar, b, omStar):
-        #{{{docstring
-        """
-        Returns equation 5.25 in Pecseli's draft
-
-        We have here used the substitution om = omR + i*omI in 5.25, and
-        splitted the equation in a real and an imaginary part.
-        The function can be solved analytical, but as this gives a long
-        expression, it is here solved iteratively.
-
-        Paramteres
-        ----------
-        om : tuple
-            Tuple containing the real part of om and the imaginary part
-            of om
-        sigmaPar : float
-            Parameter which tells something about the conductivity.
-        b : float
-            Tells something about the size of the perturbation as compared
-            to rhoS.
-        omStar : float
-            Parameter telling about electron diamagnetic frequency.
-        """
-        #}}}
-        omR  = om[0]
-        omI  = om[1]
-        real = -omI**2 - omI*sigmaPar*(b+1) + omR**2
-        imag = 2.0*omI*omR + sigmaPar*(omR*(b+1)-omStar)
-        return (real, imag)
-
-    # Get the real and the imaginary
-    # The angular frequency should be in the electron diamagnetic
-    # direction, which is here negative
-    # It is found that the largest roots in the simulations are around 1e4
-    # Therefore, starting around 1e5
-    realRoot, imagRoot =\
-        fsolve(fullExpression, (-1e5, 1e5), args=(sigmaPar, b, omStar))
-
-    return complex(realRoot, imagRoot)
+    # Coefficients of om**2 + B*om + C = 0
+    B = 1j*sigmaPar*(b+1)
+    C = -1j*sigmaPar*omStar
+
+    # NOTE: The roots are found from q = -(B + sign*sqrt(B**2 - 4*C))/2,
+    #       where the sign is chosen so that no cancellation occurs
+    #       (sigmaPar*(b+1) is often much larger than omStar)
+    sqrtDisc = np.sqrt(np.asarray(B**2 - 4*C, dtype=complex))
+    sign = np.where((np.conj(B)*sqrtDisc).real >= 0, 1.0, -1.0)
+    q = -0.5*(B + sign*sqrtDisc)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        root1 = q
+        root2 = np.where(q != 0, C/q, 0)
+
+    om = np.where(root1.imag >= root2.imag, root1, root2)
+    if np.ndim(om) == 0:
+        om = complex(om)
+    return om
 #}}}
 
 #{{{calcNuPar
@@ -6,6 +6,7 @@ from ..collectAndCalcHelpers import (DimensionsHelper      ,\
                                      DDX                   ,\
                                      getScanValue          ,\
                                      findLargestRadialGradN,\
+                                     mapScan               ,\
                                     )
 from ..unitsConverter import UnitsConverter
 from .analyticalGrowthRates import (calcOmCE         ,\
@@ -151,8 +152,103 @@ class CollectAndCalcAnalyticGrowthRates(object):
         return omCE, omCI, rhoS, rhoMax, n, dndx, uDE, uExBPol, nuEI
     #}}}
 
+    #{{{_calcScanValue
+    def _calcScanValue(self, steadyStatePath, nModes):
+        #{{{docstring
+        """
+        Calculates the analytical growth rates of one scan value.
+
+        Parameters
+        ----------
+        steadyStatePath : str
+            The steady state path of the scan value.
+        nModes : int
+            Number of modes.
+
+        Returns
+        -------
+        scanValue : float
+            The value of the scan.
+        paramDict : dict
+            The parameters of the scan value.
+            See paramDataFrame in getData for details.
+        fullDict : dict
+            The growth rates, angular frequencies and phase shifts of
+            the modes of the scan value.
+            See analyticalGRDataFrame in getData for details.
+        uc : UnitsConverter
+            The units converter of the scan value.
+        dh : DimensionsHelper
+            The dimensions helper of the scan value.
+        rhoMax : float
+            The position of the maximum gradient.
+        """
+        #}}}
+
+        fullDict = {}
+
+        # Find mid mode
+        midMode = int((nModes+1)/2)
+
+        # Set the units converter and the dimension helper
+        self._setUcAndDh(steadyStatePath)
+        # Obtain the scan value
+        scanValue = getScanValue(steadyStatePath, self._scanParameter)
+
+        # lambda approx 2*Lz => kz (observed in the fluctuations)
+        # This means that kz approx pi/Lz
+        Lz = self._dh.z[-1] + 0.5*(self._dh.z[-1] - self._dh.z[-2])
+        kz = np.pi/Lz
+
+        # Collect variables
+        omCE, omCI, rhoS, rhoMax, n, dndx, uDE, uExBPol, nuEI =\
+            self._collectForPecseliSemiAnalytical(steadyStatePath,\
+                                                  self._yInd)
+
+        # Insert into parameter dictionary
+        paramDict = {"omCE"    : omCE   ,\
+                     "omCI"    : omCI   ,\
+                     "rhoS"    : rhoS   ,\
+                     "rhoMax"  : rhoMax ,\
+                     "n"       : n      ,\
+                     "dndx"    : dndx   ,\
+                     "uDE"     : uDE    ,\
+                     "uExBPol" : uExBPol,\
+                     "nuEI"    : nuEI   ,\
+                     "kz"      : kz     ,\
+                    }
+
+        # Calculate the dispersion relation of all the modes at once
+        m = np.arange(1, nModes+1)
+        ky = m/rhoMax
+        omStar = calcOmStar(ky, uDE)
+        b = calcPecseliB(ky, rhoS)
+        sigmaPar = calcSigmaPar(ky, kz, omCE, omCI, nuEI)
+
+        # Add to dict
+        midInd = midMode - 1
+        paramDict["kyAtM{}"      .format(midMode)] = ky      [midInd]
+        paramDict["omStarAtM{}"  .format(midMode)] = omStar  [midInd]
+        paramDict["bAtM{}"       .format(midMode)] = b       [midInd]
+        paramDict["sigmaParAtM{}".format(midMode)] = sigmaPar[midInd]
+
+        om = pecseliAnalytical(omStar, b, sigmaPar)
+
+        fullDict["growthRate"] = list(om.imag)
+        # Correct for ExB angular frequency
+        # (not in Pecseli's derivation)
+        fullDict["angularFrequency"] = list(om.real + uExBPol/rhoMax)
+
+        # Calculate the phase shift (from section 5.6 in the
+        # draft)
+        fullDict["phaseShiftNPhi"] =\
+                list(np.angle((omStar+1j*b*sigmaPar)/(om+1j*b*sigmaPar)))
+
+        return scanValue, paramDict, fullDict, self.uc, self._dh, rhoMax
+    #}}}
+
     #{{{getData
-    def getData(self, nModes = 7):
+    def getData(self, nModes = 7, nWorkers = None):
         #{{{docstring
         """
         Makes a DataFrame of the growth rates and angular frequencies.
@@ -166,6 +262,9 @@ class CollectAndCalcAnalyticGrowthRates(object):
         ----------
         nModes : int
             Number of modes.
+        nWorkers : [None|int]
+            Number of processes used to loop over the scan values.
+            If None, the number set by setScanWorkers is used.
 
         Returns
         -------
@@ -218,63 +317,25 @@ class CollectAndCalcAnalyticGrowthRates(object):
         paramDict = {key:[] for key in (*keys, *midModeKeys)}
 
         # Loop over the folders
-        for steadyStatePath in self._steadyStatePaths:
-            # Set the units converter and the dimension helper
-            self._setUcAndDh(steadyStatePath)
-            # Obtain the scan value
-            scanValue = getScanValue(steadyStatePath, self._scanParameter)
-
-            # lambda approx 2*Lz => kz (observed in the fluctuations)
-            # This means that kz approx pi/Lz
-            Lz = self._dh.z[-1] + 0.5*(self._dh.z[-1] - self._dh.z[-2])
-            kz = np.pi/Lz
-
-            # Collect variables
-            omCE, omCI, rhoS, rhoMax, n, dndx, uDE, uExBPol, nuEI =\
-                self._collectForPecseliSemiAnalytical(steadyStatePath,\
-                                                      self._yInd)
+        argsList = ((steadyStatePath, nModes)\
+                    for steadyStatePath in self._steadyStatePaths)
+        results = mapScan(self._calcScanValue, argsList, nWorkers)
 
+        for scanValue, scanParamDict, scanFullDict, uc, dh, rhoMax in results:
             # Update the single index tuple, insert into parameter dictionary
             singleIndexTuple.append(scanValue)
-            paramDict["omCE"]   .append(omCE)
-            paramDict["omCI"]   .append(omCI)
-            paramDict["rhoS"]   .append(rhoS)
-            paramDict["rhoMax"] .append(rhoMax)
-            paramDict["n"]      .append(n)
-            paramDict["dndx"]   .append(dndx)
-            paramDict["uDE"]    .append(uDE)
-            paramDict["uExBPol"].append(uExBPol)
-            paramDict["nuEI"]   .append(nuEI)
-            paramDict["kz"]     .append(kz)
+            for key in paramDict.keys():
+                paramDict[key].append(scanParamDict[key])
 
+            # Fill the multiIndexTuple and the dict
             for m in range(1, nModes+1):
-                # Fill the multiIndexTuple and the dict
                 multiIndexTuple.append((scanValue, m))
+            for key in fullDict.keys():
+                fullDict[key].extend(scanFullDict[key])
 
-                # Calculate the dispersion relation
-                ky = m/rhoMax
-                omStar = calcOmStar(ky, uDE)
-                b = calcPecseliB(ky, rhoS)
-                sigmaPar = calcSigmaPar(ky, kz, omCE, omCI, nuEI)
-
-                # Add to dict
-                if m == midMode:
-                    paramDict["kyAtM{}"      .format(midMode)].append(ky)
-                    paramDict["omStarAtM{}"  .format(midMode)].append(omStar)
-                    paramDict["bAtM{}"       .format(midMode)].append(b)
-                    paramDict["sigmaParAtM{}".format(midMode)].append(sigmaPar)
-
-                om=pecseliAnalytical(omStar, b, sigmaPar)
-
-                fullDict["growthRate"].append(om.imag)
-                # Correct for ExB angular frequency
-                # (not in Pecseli's derivation)
-                fullDict["angularFrequency"].append(om.real + uExBPol/rhoMax)
-
-                # Calculate the phase shift (from section 5.6 in the
-                # draft)
-                fullDict["phaseShiftNPhi"].append(\
-                        np.angle((omStar+1j*b*sigmaPar)/(om+1j*b*sigmaPar)))
+        # NOTE: The last scan value is used in the plotting routine
+        self.uc  = uc
+        self._dh = dh
 
         # Make the data frames
         paramDataFrame = pd.DataFrame(paramDict, index=singleIndexTuple)
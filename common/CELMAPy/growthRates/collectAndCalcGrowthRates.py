@@ -5,7 +5,7 @@ Contains class to calculate the growth rate and angular frequency
 of a time trace of a spatial FFT.
 """
 
-from ..collectAndCalcHelpers import linRegOfExp, getScanValue
+from ..collectAndCalcHelpers import linRegOfExp, getScanValue, mapScan
 from ..fourierModes import CollectAndCalcFourierModes
 import pandas as pd
 
@@ -83,17 +83,8 @@ class CollectAndCalcGrowthRates(object):
         """
         #}}}
 
-        # Slice the magnitudes and the time
-        modeIndices = range(magnitudes.shape[1])
-
-        slopes  = []
-        spreads = []
-
-        for modeNr in modeIndices:
-            # Calculate the slope and the spread
-            curSlope, curSpread = linRegOfExp(time, magnitudes[:,modeNr])
-            slopes .append(curSlope)
-            spreads.append(curSpread)
+        # Calculate the slopes and the spreads of all the modes at once
+        slopes, spreads = linRegOfExp(time, magnitudes)
 
         return tuple(slopes), tuple(spreads)
     #}}}
@@ -125,16 +116,9 @@ class CollectAndCalcGrowthRates(object):
         """
         #}}}
 
-        # Slice the angularFrequency
-        modeIndices      = range(angularFrequency.shape[1])
-
-        avgAngFreqs = []
-        spreads    = []
-
-        for modeNr in modeIndices:
-            # Calculate the average and the spread
-            avgAngFreqs.append(angularFrequency[:,modeNr].mean())
-            spreads   .append(angularFrequency[:,modeNr].std() )
+        # Calculate the average and the spread of all the modes at once
+        avgAngFreqs = angularFrequency.mean(axis=0)
+        spreads     = angularFrequency.std (axis=0)
 
         return tuple(avgAngFreqs), tuple(spreads)
     #}}}
@@ -145,7 +129,8 @@ class CollectAndCalcGrowthRates(object):
                 convertToPhysical,\
                 indicesArgs      ,\
                 indicesKwargs    ,\
-                nModes = 7       ,\
+                nModes   = 7     ,\
+                nWorkers = None  ,\
                ):
         #{{{docstring
         """
@@ -166,6 +151,9 @@ class CollectAndCalcGrowthRates(object):
             NOTE: Only one spatial point should be used.
         nModes : int
             Number of modes.
+        nWorkers : [None|int]
+            Number of processes used to loop over the scan values.
+            If None, the number set by setScanWorkers is used.
 
         Returns
         -------
@@ -194,51 +182,28 @@ class CollectAndCalcGrowthRates(object):
             {"growthRate":[], "growthRateStd":[],\
              "averageAngularFrequency":[], "averageAngularFrequencyStd":[]}
 
-        loopOver = zip(self._scanCollectPaths,\
-                       self._steadyStatePaths,\
-                       self._tSlices         ,\
-                       )
+        # NOTE: indicesKwargs is copied as the tSlice is updated
+        argsList = tuple((scanPaths                 ,\
+                          steadyStatePath           ,\
+                          tSlice                    ,\
+                          self._scanParameter       ,\
+                          varName                   ,\
+                          convertToPhysical         ,\
+                          indicesArgs               ,\
+                          dict(indicesKwargs)       ,\
+                          nModes                    ,\
+                         )\
+                         for scanPaths, steadyStatePath, tSlice in\
+                         zip(self._scanCollectPaths,\
+                             self._steadyStatePaths,\
+                             self._tSlices         ,\
+                            ))
 
         # Loop over the folders
-        for scanPaths, steadyStatePath, tSlice in loopOver:
-            # Obtain the scan value
-            scanValue = getScanValue(scanPaths, self._scanParameter)
-
-            # Update with the correct tSlice
-            indicesKwargs.update({"tSlice" : tSlice})
-
-            fm, positionTuple, uc = \
-                self.collectAndCalcFourierModes(scanPaths        ,\
-                                                varName          ,\
-                                                convertToPhysical,\
-                                                steadyStatePath  ,\
-                                                indicesArgs      ,\
-                                                indicesKwargs    ,\
-                                               )
-
-            # NOTE: We skip the offset mode.
-            #       Thus, we add 1 in the range in order to look at
-            #       nModes modes
-            modeStart = 1
-            modeEnd   = nModes+1
-
-            # Get the keys
-            firstKey = tuple(fm.keys())[0]
-
-            # Obtain the time, magitude and the angular frequency
-            time            = fm[firstKey]["time"]
-            magnitudes      = fm[firstKey][varName+"Magnitude"]
-            angularFrequency = fm[firstKey][varName+"AngularFrequency"]
-
-            slopes, slopesStd =\
-                self.calcSlopeAndSpread(magnitudes[:, modeStart:modeEnd],\
-                                        time                            ,\
-                                       )
-
-            avgAngFreqs, avgAngFreqsStd =\
-                self.calcAvgAngularFrequencyAndSpread(\
-                                        angularFrequency[:, modeStart:modeEnd])
+        results = mapScan(self._calcScanValue, argsList, nWorkers)
 
+        for scanValue, slopes, slopesStd, avgAngFreqs, avgAngFreqsStd,\
+            positionTuple, uc in results:
             for modeInd in range(len(slopes)):
                 # Fill the multiIndexTuple and the dict
                 multiTuples.append((scanValue, modeInd + 1))
@@ -262,6 +227,111 @@ class CollectAndCalcGrowthRates(object):
         return growthRateDataFrame, positionTuple, uc
     #}}}
 
+    @staticmethod
+    #{{{_calcScanValue
+    def _calcScanValue(scanPaths        ,\
+                       steadyStatePath  ,\
+                       tSlice           ,\
+                       scanParameter    ,\
+                       varName          ,\
+                       convertToPhysical,\
+                       indicesArgs      ,\
+                       indicesKwargs    ,\
+                       nModes           ,\
+                      ):
+        #{{{docstring
+        """
+        Calculates the growth rates and angular frequencies of one scan
+        value.
+
+        NOTE: This is a static method so that it can be used in a pool
+              of processes.
+
+        Parameters
+        ----------
+        scanPaths : tuple
+            Tuple of the scan paths.
+        steadyStatePath : str
+            String containing the steady state path.
+        tSlice : slice
+            The time slice to use.
+        scanParameter : str
+            String segment representing the scan.
+        varName : str
+            Name of variable to find the growth rates of.
+        convertToPhysical : bool
+            Whether or not to convert to physical units.
+        indicesArgs : tuple
+            Tuple of indices to use when collecting.
+        indicesKwargs : dict
+            Keyword arguments to use when setting the indices for
+            collecting.
+        nModes : int
+            Number of modes.
+
+        Returns
+        -------
+        scanValue : float
+            The value of the scan.
+        slopes : tuple
+            The growth rates of the modes.
+        slopesStd : tuple
+            The spread of the growth rates.
+        avgAngFreqs : tuple
+            The average angular frequencies of the modes.
+        avgAngFreqsStd : tuple
+            The spread of the angular frequencies.
+        positionTuple : tuple
+            The tuple containing (rho, z).
+        uc : Units Converter
+            The units converter used when obtaining the fourier modes.
+        """
+        #}}}
+
+        # Obtain the scan value
+        scanValue = getScanValue(scanPaths, scanParameter)
+
+        # Update with the correct tSlice
+        indicesKwargs.update({"tSlice" : tSlice})
+
+        fm, positionTuple, uc = \
+            CollectAndCalcGrowthRates.\
+                collectAndCalcFourierModes(scanPaths        ,\
+                                           varName          ,\
+                                           convertToPhysical,\
+                                           steadyStatePath  ,\
+                                           indicesArgs      ,\
+                                           indicesKwargs    ,\
+                                          )
+
+        # NOTE: We skip the offset mode.
+        #       Thus, we add 1 in the range in order to look at
+        #       nModes modes
+        modeStart = 1
+        modeEnd   = nModes+1
+
+        # Get the keys
+        firstKey = tuple(fm.keys())[0]
+
+        # Obtain the time, magitude and the angular frequency
+        time            = fm[firstKey]["time"]
+        magnitudes      = fm[firstKey][varName+"Magnitude"]
+        angularFrequency = fm[firstKey][varName+"AngularFrequency"]
+
+        slopes, slopesStd =\
+            CollectAndCalcGrowthRates.\
+                calcSlopeAndSpread(magnitudes[:, modeStart:modeEnd],\
+                                   time                            ,\
+                                  )
+
+        avgAngFreqs, avgAngFreqsStd =\
+            CollectAndCalcGrowthRates.calcAvgAngularFrequencyAndSpread(\
+                                    angularFrequency[:, modeStart:modeEnd])
+
+        return scanValue, slopes, slopesStd, avgAngFreqs, avgAngFreqsStd,\
+               positionTuple, uc
+    #}}}
+
     @staticmethod
     #{{{collectAndCalcFourierModes
     def collectAndCalcFourierModes(scanPaths                 ,\
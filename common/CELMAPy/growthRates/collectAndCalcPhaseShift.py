@@ -4,7 +4,7 @@
 Contains class to calculate the phase shift between n and phi.
 """
 
-from ..collectAndCalcHelpers import getScanValue
+from ..collectAndCalcHelpers import getScanValue, mapScan
 from ..fourierModes import CollectAndCalcFourierModes
 from ..timeTrace import getTimeTrace
 from .collectAndCalcAnalyticGrowthRates import\
@@ -113,11 +113,17 @@ class CollectAndCalcPhaseShift(object):
     #}}}
 
     #{{{getData
-    def getData(self):
+    def getData(self, nWorkers = None):
         #{{{docstring
         """
         Makes a DataFrame of the phase shifts obtained from the simulations.
 
+        Parameters
+        ----------
+        nWorkers : [None|int]
+            Number of processes used to loop over the scan values.
+            If None, the number set by setScanWorkers is used.
+
         Returns
         -------
         phaseShiftDataFrame : DataFrame
@@ -150,7 +156,7 @@ class CollectAndCalcPhaseShift(object):
                                                   self._yInd)
         # Obtain the data
         analyticalGRDataFrame, _, _, uc =\
-            ccagr.getData()
+            ccagr.getData(nWorkers = nWorkers)
 
         # Recast the data frame
         analyticalGRDataFrame.drop("growthRate", axis=1, inplace=True)
@@ -169,37 +175,12 @@ class CollectAndCalcPhaseShift(object):
         scanValues    = []
 
         # Collect the phase shift from the simulations
-        loopOver = zip(self._scanCollectPaths,\
-                       self._steadyStatePaths,\
-                       self._tSlices         ,\
-                       )
+        argsList = zip(self._scanCollectPaths, self._tSlices)
 
         # Loop over the folders
-        for scanPaths, steadyStatePath, tSlice in loopOver:
-
-            # Obtain the scan value
-            scanValue = getScanValue(scanPaths, self._scanParameter)
-
-            # Update with the correct tSlice
-            self._indicesKwargs.update({"tSlice" : tSlice})
-
-            # Obtain teh time traces
-            n, phi, positionTuple = self._getTimeTraces(scanPaths)
-
-            # Obtain the cross spectral density
-            # NOTE: If this is below the number of samples, a smoothing
-            #       will occur
-            nperseg = len(n)
-            # NOTE: The triangular window corresponds to the periodogram
-            #       estimate of the spectral density
-            # NOTE: The first output (frequency) is not used
-            _, csd = signal.csd(n, phi, window="triang", nperseg=nperseg)
-
-            maxInd = self._getMaxIndOfMagnitude(csd)
-
-            # FIXME: Not sure why, but there seem to be a sign error
-            avgPhaseShiftNPhi = -np.angle(csd[maxInd])
+        results = mapScan(self._calcScanValue, argsList, nWorkers)
 
+        for scanValue, avgPhaseShiftNPhi, positionTuple in results:
             scanValues.append(scanValue)
             dataFrameDict["phaseShift"].append(avgPhaseShiftNPhi)
 
@@ -213,6 +194,56 @@ class CollectAndCalcPhaseShift(object):
                uc
     #}}}
 
+    #{{{_calcScanValue
+    def _calcScanValue(self, scanPaths, tSlice):
+        #{{{docstring
+        """
+        Calculates the phase shift of one scan value.
+
+        Parameters
+        ----------
+        scanPaths : tuple
+            Tuple of strings containing the paths to collect from.
+        tSlice : slice
+            The time slice to use.
+
+        Returns
+        -------
+        scanValue : float
+            The value of the scan.
+        avgPhaseShiftNPhi : float
+            The phase shift between n and phi.
+        positionTuple : tuple
+            Tuple with the rho, theta and z value.
+        """
+        #}}}
+
+        # Obtain the scan value
+        scanValue = getScanValue(scanPaths, self._scanParameter)
+
+        # Update with the correct tSlice
+        self._indicesKwargs.update({"tSlice" : tSlice})
+
+        # Obtain teh time traces
+        n, phi, positionTuple = self._getTimeTraces(scanPaths)
+
+        # Obtain the cross spectral density
+        # NOTE: If this is below the number of samples, a smoothing
+        #       will occur
+        nperseg = len(n)
+        # NOTE: The triangular window corresponds to the periodogram
+        #       estimate of the spectral density
+        # NOTE: The first output (frequency) is not used
+        _, csd = signal.csd(n, phi, window="triang", nperseg=nperseg)
+
+        maxInd = self._getMaxIndOfMagnitude(csd)
+
+        # FIXME: Not sure why, but there seem to be a sign error
+        avgPhaseShiftNPhi = -np.angle(csd[maxInd])
+
+        return scanValue, avgPhaseShiftNPhi, positionTuple
+    #}}}
+
     #{{{_getTimeTraces
     def _getTimeTraces(self, collectPaths):
         #{{{docstring
@@ -5,7 +5,6 @@ Contains single driver and driver class for the analytic growth rates
 from ..superClasses import DriverPointsSuperClass
 from .collectAndCalcAnalyticGrowthRates import CollectAndCalcAnalyticGrowthRates
 from .plotGrowthRates import PlotGrowthRates
-from multiprocessing import Process
 
 #{{{driverAnalyticGrowthRates
 def driverAnalyticGrowthRates(steadyStatePaths,\
@@ -114,10 +113,6 @@ class DriverAnalyticGrowthRates(DriverPointsSuperClass):
                 self._yInd            ,\
                 self._plotSuperKwargs ,\
                )
-        if self._useMultiProcess:
-            processes = Process(target = driverAnalyticGrowthRates, args = args)
-            processes.start()
-        else:
-            driverAnalyticGrowthRates(*args)
+        self._runTask(driverAnalyticGrowthRates, args)
     #}}}
 #}}}
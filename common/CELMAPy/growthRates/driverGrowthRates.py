@@ -7,7 +7,6 @@ Contains single driver and driver class for the growth rates
 from ..superClasses import DriverPointsSuperClass
 from .collectAndCalcGrowthRates import CollectAndCalcGrowthRates
 from .plotGrowthRates import PlotGrowthRates
-from multiprocessing import Process
 
 #{{{driverGrowthRates
 def driverGrowthRates(collectArgs    ,\
@@ -212,10 +211,6 @@ class DriverGrowthRates(DriverPointsSuperClass):
                  self._getDataArgs    ,\
                  self._plotSuperKwargs,\
                 )
-        if self._useMultiProcess:
-            processes = Process(target = driverGrowthRates, args = args)
-            processes.start()
-        else:
-            driverGrowthRates(*args)
+        self._runTask(driverGrowthRates, args)
     #}}}
 #}}}
@@ -6,7 +6,6 @@ from ..superClasses import DriverPointsSuperClass
 from .collectAndCalcPhaseShift import CollectAndCalcPhaseShift
 from .driverGrowthRates import DriverGrowthRates
 from .plotPhaseShift import PlotPhaseShift
-from multiprocessing import Process
 
 #{{{driverPhaseShift
 def driverPhaseShift(collectArgs    ,\
@@ -137,10 +136,6 @@ class DriverPhaseShift(DriverPointsSuperClass):
                 self._getDataArgs    ,\
                 self._plotSuperKwargs,\
                )
-        if self._useMultiProcess:
-            processes = Process(target = driverPhaseShift, args = args)
-            processes.start()
-        else:
-            driverPhaseShift(*args)
+        self._runTask(driverPhaseShift, args)
     #}}}
 #}}}
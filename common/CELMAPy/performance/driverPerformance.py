@@ -7,7 +7,6 @@ Contains single driver and driver class for the performance
 from ..superClasses import DriverSuperClass
 from .collectAndCalcPerformance import CollectAndCalcPerformance
 from .plotPerformance import PlotPerformance
-from multiprocessing import Process
 
 #{{{driverPerformance
 def driverPerformance(collectPaths     ,\
@@ -113,12 +112,6 @@ class DriverPerformance(DriverSuperClass):
                  self._plotSuperKwargs ,\
                 )
         kwargs = {"tSlice":self._tSlice}
-        if self._useMultiProcess:
-            processes =\
-                    Process(target = driverPerformance,\
-                            args = args, kwargs=kwargs)
-            processes.start()
-        else:
-            driverPerformance(*args, **kwargs)
+        self._runTask(driverPerformance, args, kwargs)
     #}}}
 #}}}
@@ -4,10 +4,19 @@
 
 from .plotHelper import PlotHelper
 from .plotNumberFormatter import plotNumberFormatter
-from .maxMinHelper import (getMaxMinAnimation,\
+from .maxMinHelper import (RunningMaxMin,\
+                           getMaxMinAnimation,\
                            getLevelsAnimation,\
                            getVmaxVminLevels)
 from .sizeMaker import SizeMaker
+from .decimation import (decimationPresets,\
+                         getDecimation,\
+                         decimateTSlice,\
+                         getKeptNodes,\
+                         segmentAverage)
+from .parallelAnimation import (saveAnimationParallel,\
+                                setRenderWorkers,\
+                                getRenderWorkers)
 import os
 import matplotlib.pyplot as plt
 
@@ -0,0 +1,180 @@
+#!/usr/bin/env python
+
+"""
+Contains functions for decimating the frames and the resolution of
+animations
+"""
+
+from ..collectAndCalcHelpers import slicesToIndices
+import numpy as np
+
+# The target frame count and the target number of points along each
+# spatial direction for the qualities
+# NOTE: "auto" uses the size of the figure in pixels
+decimationPresets = {\
+    "production" : {"maxFrames" : None, "maxPixels" : None  },\
+    "preview"    : {"maxFrames" : 100 , "maxPixels" : "auto"},\
+                    }
+
+#{{{getDecimation
+def getDecimation(plotSuperKwargs):
+    #{{{docstring
+    """
+    Returns the target frame count and pixel size.
+
+    NOTE: The keys are not popped, as they are also used by the
+          constructor of the animation plots.
+
+    Parameters
+    ----------
+    plotSuperKwargs : dict
+        Keyword arguments for the plot super class.
+        The following keys are used (if present)
+            * "quality"   - One of the keys of decimationPresets
+            * "maxFrames" - Overrides the maxFrames of the quality
+            * "maxPixels" - Overrides the maxPixels of the quality
+
+    Returns
+    -------
+    maxFrames : [None|int]
+        The maximum number of frames.
+        If None, all the frames are kept.
+    maxPixels : [None|int|"auto"]
+        The maximum number of points along each spatial direction.
+        If None, the full resolution is kept.
+    """
+    #}}}
+
+    quality = plotSuperKwargs.get("quality", "production")
+
+    # Guard
+    if not(quality in decimationPresets.keys()):
+        message = "quality '{}' not implemented. Use one of {}".\
+                    format(quality, tuple(decimationPresets.keys()))
+        raise NotImplementedError(message)
+
+    maxFrames = plotSuperKwargs.get("maxFrames", None)
+    maxPixels = plotSuperKwargs.get("maxPixels", None)
+    if maxFrames is None:
+        maxFrames = decimationPresets[quality]["maxFrames"]
+    if maxPixels is None:
+        maxPixels = decimationPresets[quality]["maxPixels"]
+
+    return maxFrames, maxPixels
+#}}}
+
+#{{{decimateTSlice
+def decimateTSlice(paths, tSlice, maxFrames):
+    #{{{docstring
+    """
+    Adds a step to the time slice, so that at most maxFrames are
+    collected.
+
+    Parameters
+    ----------
+    paths : [str|tuple]
+        The path(s) used by the collector to resolve the time slice.
+    tSlice : [None|slice]
+        The time slice.
+    maxFrames : [None|int]
+        The maximum number of frames.
+        If None, tSlice is returned unchanged.
+
+    Returns
+    -------
+    tSlice : [None|slice]
+        The time slice with the step added.
+        NOTE: The start and stop are kept, so that they are resolved
+              by the collector as before.
+    """
+    #}}}
+
+    if maxFrames is None:
+        return tSlice
+
+    if tSlice is None:
+        tSlice = slice(0, None)
+
+    tInd = slicesToIndices(paths, tSlice, "t")
+    step = tInd[2] if len(tInd) == 3 else 1
+    nFrames = (tInd[1] - tInd[0])//step + 1
+
+    stride = int(np.ceil(nFrames/maxFrames))
+    if stride <= 1:
+        return tSlice
+
+    return slice(tSlice.start, tSlice.stop, step*stride)
+#}}}
+
+#{{{getKeptNodes
+def getKeptNodes(n, maxPoints):
+    #{{{docstring
+    """
+    Returns the nodes kept when reducing the number of points.
+
+    The first and the last node are always kept, so that the extent of
+    the data is unchanged.
+
+    Parameters
+    ----------
+    n : int
+        The number of points.
+    maxPoints : int
+        The target number of points.
+
+    Returns
+    -------
+    nodes : [None|array]
+        The indices of the kept nodes.
+        None if no reduction is needed.
+    starts : [None|array]
+        The start of the segment of points averaged onto each kept
+        node.
+        Each segment consists of the points closest to the kept node.
+    """
+    #}}}
+
+    factor = int(np.ceil(n/maxPoints))
+    if factor <= 1:
+        return None, None
+
+    nodes = np.arange(0, n, factor)
+    if nodes[-1] != n - 1:
+        nodes = np.append(nodes, n - 1)
+
+    starts = np.concatenate(((0,), (nodes[:-1] + nodes[1:])//2 + 1))
+
+    return nodes, starts
+#}}}
+
+#{{{segmentAverage
+def segmentAverage(array, starts, axis):
+    #{{{docstring
+    """
+    Averages the array over the segments along an axis.
+
+    Parameters
+    ----------
+    array : array
+        The array to average.
+    starts : array
+        The start index of each segment.
+        The last segment ends at the end of the axis.
+    axis : int
+        The axis to average along.
+
+    Returns
+    -------
+    averaged : array
+        The averaged array, with len(starts) elements along axis.
+    """
+    #}}}
+
+    summed = np.add.reduceat(array, starts, axis=axis)
+    counts = np.diff(np.append(starts, array.shape[axis]))
+
+    shape = [1]*array.ndim
+    shape[axis] = -1
+
+    return summed/counts.reshape(shape)
+#}}}
@@ -6,6 +6,115 @@ Contains helper functions for setting plot limits
 
 import numpy as np
 
+#{{{RunningMaxMin
+class RunningMaxMin(object):
+    """
+    Class which accumulates the max and min of each frame.
+
+    The frames can be added chunk by chunk (for example from
+    collectiveCollectChunks), so that the limits are found in the same
+    pass as the collection, and without holding the data in memory.
+    """
+
+    #{{{constructor
+    def __init__(self):
+        """
+        Constructor for the RunningMaxMin.
+        """
+
+        self._frameMax = []
+        self._frameMin = []
+    #}}}
+
+    #{{{add
+    def add(self, *chunks):
+        #{{{docstring
+        """
+        Adds the next frames.
+
+        Parameters
+        ----------
+        *chunks : nd-arrays
+            The arrays to find the max and min of on the form (t, ...).
+            All chunks must have the same frames.
+            The chunks are concatenated in time with the previous
+            chunks.
+        """
+        #}}}
+
+        nFrames = chunks[0].shape[0]
+        if any(chunk.shape[0] != nFrames for chunk in chunks):
+            message = "All the chunks must have the same number of frames"
+            raise ValueError(message)
+
+        if nFrames == 0:
+            return
+
+        # Reduce along the spatial axes
+        # NOTE: This makes no copies of the arrays
+        self._frameMax.append(\
+            np.maximum.reduce(tuple(_reduceFrames(np.max, chunk)\
+                                    for chunk in chunks)))
+        self._frameMin.append(\
+            np.minimum.reduce(tuple(_reduceFrames(np.min, chunk)\
+                                    for chunk in chunks)))
+    #}}}
+
+    #{{{getMaxMin
+    def getMaxMin(self, fluct, varyMaxMin):
+        #{{{docstring
+        """
+        Returns the max and min for each frame in the animation.
+
+        Parameters
+        ----------
+        fluct : bool
+            Whether or not the max and min should be symmetric around 0.
+        varyMaxMin : bool
+            Whether or not the max and min are allowed to vary from
+            frame to frame.
+
+        Returns
+        -------
+        vMax : tuple
+            The maximum. One per frame
+        vMin : tuple
+            The minimum. One per frame
+        """
+        #}}}
+
+        if len(self._frameMax) == 0:
+            message = "No frames has been added"
+            raise RuntimeError(message)
+
+        vMax = np.concatenate(self._frameMax)
+        vMin = np.concatenate(self._frameMin)
+        nFrames = len(vMax)
+
+        if not(varyMaxMin):
+            # Find the global max and min
+            vMax = np.full(nFrames, np.max(vMax))
+            vMin = np.full(nFrames, np.min(vMin))
+
+        if fluct:
+            # Max and min will be set symmetric
+            absMax = np.maximum(np.abs(vMax), np.abs(vMin))
+            vMax =  absMax
+            vMin = -absMax
+
+        return tuple(vMax), tuple(vMin)
+    #}}}
+#}}}
+
+#{{{_reduceFrames
+def _reduceFrames(func, array):
+    """
+    Reduces the array over all but the first axis
+    """
+
+    return func(array, axis = tuple(range(1, array.ndim)))
+#}}}
+
 #{{{getMaxMinAnimation
 def getMaxMinAnimation(tupleOfArrays, fluct, varyMaxMin):
     #{{{docstring
@@ -14,8 +123,10 @@ def getMaxMinAnimation(tupleOfArrays, fluct, varyMaxMin):
 
     Parameters
     ----------
-    tupleOfArrays : tuple of nd-arrays
+    tupleOfArrays : [tuple of nd-arrays|RunningMaxMin]
         Tuple of the arrays to find the max and min of.
+        Can also be a RunningMaxMin where the frames have been added
+        during the collection.
     fluct : bool
         Whether or not the max and min should be symmetric around 0.
     varyMaxMin : bool
@@ -31,76 +142,13 @@ def getMaxMinAnimation(tupleOfArrays, fluct, varyMaxMin):
     """
     #}}}
 
-    # Get the number of frames
-    nFrames = tupleOfArrays[0].shape[0]
-
-    if not(fluct) and not(varyMaxMin):
-        # Find the global max and min
-        flatArrays = tuple(array.flatten() for array in tupleOfArrays)
-        tupleOfArrays = np.concatenate(flatArrays)
-        vMax = (np.max(tupleOfArrays),)*nFrames
-        vMin = (np.min(tupleOfArrays),)*nFrames
-    elif not(fluct) and varyMaxMin:
-        # Find the max and min for each frame
-        lenTuple = len(tupleOfArrays)
-        vMax = np.zeros(nFrames)
-        vMin = np.zeros(nFrames)
-
-        for frame in range(nFrames):
-            curFrameArrayMax = np.zeros(lenTuple)
-            curFrameArrayMin = np.zeros(lenTuple)
-            for arrayNr in range(lenTuple):
-                curFrameArrayMax[arrayNr] =\
-                    np.max(tupleOfArrays[arrayNr][frame,:,:])
-                curFrameArrayMin[arrayNr] =\
-                    np.min(tupleOfArrays[arrayNr][frame,:,:])
-
-            vMax[frame] = np.max(curFrameArrayMax)
-            vMin[frame] = np.min(curFrameArrayMin)
-
-        vMax = tuple(vMax)
-        vMin = tuple(vMin)
-
-    elif fluct and not(varyMaxMin):
-        # Max and min will be set symmetric
-        flatArrays = tuple(array.flatten() for array in tupleOfArrays)
-        tupleOfArrays = np.concatenate(flatArrays)
-
-        curMax = np.max(tupleOfArrays)
-        curMin = np.min(tupleOfArrays)
-
-        absMax = np.max(np.abs((curMax, curMin)))
-
-        vMax = ( absMax,)*nFrames
-        vMin = (-absMax,)*nFrames
-
-    elif fluct and varyMaxMin:
-        # Find the max and min for each frame
-        lenTuple = len(tupleOfArrays)
-        vMax = np.zeros(nFrames)
-        vMin = np.zeros(nFrames)
-
-        for frame in range(nFrames):
-            curFrameArrayMax = np.zeros(lenTuple)
-            curFrameArrayMin = np.zeros(lenTuple)
-            for arrayNr in range(lenTuple):
-                curFrameArrayMax[arrayNr] =\
-                    np.max(tupleOfArrays[arrayNr][frame,:,:])
-                curFrameArrayMin[arrayNr] =\
-                    np.min(tupleOfArrays[arrayNr][frame,:,:])
-
-            curMax = np.max(curFrameArrayMax)
-            curMin = np.min(curFrameArrayMin)
-
-            absMax = np.max(np.abs((curMax, curMin)))
-
-            vMax[frame] = absMax
-            vMin[frame] = -absMax
-
-        vMax = tuple(vMax)
-        vMin = tuple(vMin)
-
-    return vMax, vMin
+    if isinstance(tupleOfArrays, RunningMaxMin):
+        runningMaxMin = tupleOfArrays
+    else:
+        runningMaxMin = RunningMaxMin()
+        runningMaxMin.add(*tupleOfArrays)
+
+    return runningMaxMin.getMaxMin(fluct, varyMaxMin)
 #}}}
 
 #{{{getLevelsAnimation
@@ -125,21 +173,13 @@ def getLevelsAnimation(vMax, vMin, nCont):
     """
     #}}}
 
-    nFrames = len(vMax)
-    levels = []
+    # The levels on the form (frame, level)
+    levels = np.linspace(vMin, vMax, nCont, endpoint = True, axis = -1)
 
-    for frame in range(nFrames):
-        level = np.linspace(vMin[frame]  ,\
-                            vMax[frame]  ,\
-                            nCont        ,\
-                            endpoint = True)
+    decreasing = np.min(np.diff(levels, axis = -1), axis = -1) < 0.0
 
-        if np.min(np.diff(level)) < 0.0:
-            levels.append(None)
-        else:
-            levels.append(level)
-
-    return tuple(levels)
+    return tuple(None if decreasing[frame] else levels[frame]\
+                 for frame in range(len(levels)))
 #}}}
 
 #{{{getVmaxVminLevels
@@ -157,8 +197,9 @@ def getVmaxVminLevels(plotSuperKwargs,\
     ----------
     plotSuperKwargs : dict
         Keyword arguments for the plot super class.
-    tupleOfArrays : tuple
-        Tuple of the arrays to find the max and min of..
+    tupleOfArrays : [tuple|RunningMaxMin]
+        Tuple of the arrays to find the max and min of.
+        See getMaxMinAnimation for details.
     fluct : bool
         If the variables are fluctuating or not (will symmetrize the max
         and the min).
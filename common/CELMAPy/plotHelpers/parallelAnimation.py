@@ -0,0 +1,219 @@
+#!/usr/bin/env python
+
+"""
+Contains functions for rendering animations in parallel
+"""
+
+from multiprocessing import current_process, get_context
+from subprocess import run
+import matplotlib as mpl
+import matplotlib.animation as animation
+import numpy as np
+import os
+import shutil
+import tempfile
+
+# Environment variable used to configure the number of processes used
+# when rendering the animations. This is inherited by sub processes (and
+# forwarded by the PBSSubmitter)
+renderWorkersEnv = "CELMAPY_RENDER_WORKERS"
+
+# The figure and update function of the animation being rendered
+# NOTE: The workers are forked, so they inherit these without pickling
+_renderJob = {}
+
+#{{{saveAnimationParallel
+def saveAnimationParallel(fig, func, frames, fileName, writerKwargs,\
+                          nWorkers = None):
+    #{{{docstring
+    """
+    Saves an animation by rendering chunks of the frames in parallel.
+
+    The frames are split into one contiguous chunk per worker.
+    Each worker renders its chunk to a segment with the ffmpeg writer,
+    and the segments are concatenated without re-encoding.
+
+    NOTE: The workers are forked from the current process, so each
+          worker draws on its own copy of the figure.
+          This gives the same frames as the serial FuncAnimation as
+          long as func draws the full frame from the frame number
+          alone (as the update functions of the animation plots do).
+
+    Parameters
+    ----------
+    fig : Figure
+        Figure to animate.
+    func : function
+        The function which updates the figure.
+        Called with the frame number as the only argument.
+    frames : int
+        Number of frames.
+    fileName : str
+        Name of the file to save to, including the path and the
+        extension.
+    writerKwargs : dict
+        Keyword arguments given to the ffmpeg writer.
+    nWorkers : [None|int]
+        Number of processes.
+        If None, the number set by setRenderWorkers is used.
+        If less than two, or if forking is not possible, the
+        animation is saved serially through FuncAnimation.
+    """
+    #}}}
+
+    if nWorkers is None:
+        nWorkers = getRenderWorkers()
+    nWorkers = min(nWorkers, frames)
+
+    # NOTE: Daemonic processes (like the workers of a Pool) are not
+    #       allowed to have children
+    if nWorkers < 2 or current_process().daemon or not(_canFork()):
+        anim = animation.FuncAnimation(fig, func, frames = frames, blit = False)
+        writer = animation.writers["ffmpeg"](**writerKwargs)
+        anim.save(fileName, writer = writer)
+        return
+
+    # The start (inclusive) and the stop (exclusive) of the chunks
+    bounds = np.linspace(0, frames, nWorkers + 1).astype(int)
+
+    # Make the segments next to the destination
+    segmentDir = tempfile.mkdtemp(dir = os.path.dirname(fileName) or ".")
+    try:
+        extension = os.path.splitext(fileName)[1]
+        segments = tuple(os.path.join(segmentDir,\
+                                      "segment{}{}".format(nr, extension))\
+                         for nr in range(nWorkers))
+
+        _renderJob.update({"fig"          : fig         ,\
+                           "func"         : func        ,\
+                           "writerKwargs" : writerKwargs,\
+                          })
+        try:
+            with get_context("fork").Pool(nWorkers) as pool:
+                pool.starmap(_renderSegment,\
+                             zip(bounds[:-1], bounds[1:], segments))
+        finally:
+            _renderJob.clear()
+
+        _concatSegments(segments, fileName)
+    finally:
+        shutil.rmtree(segmentDir)
+#}}}
+
+#{{{_renderSegment
+def _renderSegment(start, stop, segmentName):
+    #{{{docstring
+    """
+    Renders the frames from start to stop (exclusive) to a segment.
+
+    Parameters
+    ----------
+    start : int
+        The first frame.
+    stop : int
+        The frame after the last frame.
+    segmentName : str
+        The file to save the segment to.
+    """
+    #}}}
+
+    fig  = _renderJob["fig"]
+    func = _renderJob["func"]
+
+    writer = animation.writers["ffmpeg"](**_renderJob["writerKwargs"])
+
+    # NOTE: As in Animation.save
+    dpi = mpl.rcParams["savefig.dpi"]
+    if dpi == "figure":
+        dpi = fig.dpi
+
+    with mpl.rc_context({"savefig.bbox": None}):
+        with writer.saving(fig, segmentName, dpi):
+            for frame in range(start, stop):
+                func(frame)
+                writer.grab_frame()
+#}}}
+
+#{{{_concatSegments
+def _concatSegments(segments, fileName):
+    #{{{docstring
+    """
+    Concatenates the segments with the ffmpeg concat demuxer.
+
+    The streams are copied, so the segments are not re-encoded.
+
+    Parameters
+    ----------
+    segments : tuple of str
+        The segments in the order they should be played.
+    fileName : str
+        The file to save to.
+    """
+    #}}}
+
+    listName = os.path.join(os.path.dirname(segments[0]), "segments.txt")
+    with open(listName, "w") as f:
+        for segment in segments:
+            f.write("file '{}'\n".format(os.path.abspath(segment)))
+
+    command = (mpl.rcParams["animation.ffmpeg_path"],\
+               "-y", "-loglevel", "error",\
+               "-f", "concat", "-safe", "0", "-i", listName,\
+               "-c", "copy", fileName)
+    run(command, check=True)
+#}}}
+
+#{{{_canFork
+def _canFork():
+    """
+    Returns whether or not the processes can be forked
+    """
+
+    try:
+        get_context("fork")
+    except ValueError:
+        return False
+
+    return True
+#}}}
+
+#{{{setRenderWorkers
+def setRenderWorkers(nWorkers):
+    #{{{docstring
+    """
+    Sets the number of processes used when rendering the animations.
+
+    The setting is stored as an environment variable, so that it is
+    inherited by sub processes.
+
+    Parameters
+    ----------
+    nWorkers : [None|int]
+        Number of processes.
+        If None, the animations are rendered serially.
+    """
+    #}}}
+
+    if nWorkers is None:
+        os.environ.pop(renderWorkersEnv, None)
+    else:
+        if int(nWorkers) < 1:
+            raise ValueError("nWorkers must be a positive integer")
+        os.environ[renderWorkersEnv] = str(int(nWorkers))
+#}}}
+
+#{{{getRenderWorkers
+def getRenderWorkers():
+    #{{{docstring
+    """
+    Returns the number of processes used when rendering the animations.
+
+    Returns
+    -------
+    nWorkers : int
+        The number of processes (1 if unset).
+    """
+    #}}}
+
+    return int(os.environ.get(renderWorkersEnv, 1))
+#}}}
@@ -7,7 +7,6 @@ from ..collectAndCalcHelpers import DDX
 from ..radialProfile import CollectAndCalcRadialProfile
 from .collectAndCalcPoloidalFlow import CollectAndCalcPoloidalFlow
 from .plotPoloidalFlow import PlotPoloidalFlow
-from multiprocessing import Process
 import numpy as np
 
 #{{{driverPoloidalFlow
@@ -201,10 +200,6 @@ class DriverPoloidalFlow(DriverSuperClass):
                  self._mode            ,\
                  self._plotSuperKwargs ,\
                 )
-        if self._useMultiProcess:
-            processes = Process(target = driverPoloidalFlow, args = args)
-            processes.start()
-        else:
-            driverPoloidalFlow(*args)
+        self._runTask(driverPoloidalFlow, args)
     #}}}
 #}}}
@@ -8,7 +8,6 @@ from ..superClasses import DriverPointsSuperClass
 from ..timeTrace import CollectAndCalcTimeTrace
 from .collectAndCalcRadialFlux import CollectAndCalcRadialFlux
 from .plotRadialFlux import PlotRadialFlux
-from multiprocessing import Process
 
 #{{{driverRadialFlux
 def driverRadialFlux(collectPaths     ,\
@@ -188,10 +187,6 @@ class DriverRadialFlux(DriverPointsSuperClass):
                  self._indicesKwargs   ,\
                  self._plotSuperKwargs ,\
                 )
-        if self._useMultiProcess:
-            processes = Process(target = driverRadialFlux, args = args)
-            processes.start()
-        else:
-            driverRadialFlux(*args)
+        self._runTask(driverRadialFlux, args)
     #}}}
 #}}}
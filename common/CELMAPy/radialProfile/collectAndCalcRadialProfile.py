@@ -6,6 +6,8 @@ Contains class for collecting and calculating the radial profiles
 
 from ..fields1D import CollectAndCalcFields1D
 from ..collectAndCalcHelpers import (calcN, calcUIPar, calcUEPar,\
+                                     DDX, RunningMoments,\
+                                     getChunkTIndices, slicesToIndices,\
                                      polAvg, timeAvg)
 import numpy as np
 
@@ -16,10 +18,11 @@ class CollectAndCalcRadialProfile(object):
     """
 
     #{{{constructor
-    def __init__(self  ,\
-                 yInd  ,\
-                 tSlice,\
-                 convertToPhysical):
+    def __init__(self             ,\
+                 yInd             ,\
+                 tSlice           ,\
+                 convertToPhysical,\
+                 chunkSize = 100  ):
         #{{{docstring
         """
         This constructor will:
@@ -33,10 +36,14 @@ class CollectAndCalcRadialProfile(object):
             How the data will be sliced in time
         convertToPhysical : bool
             Whether or not to convert to physical units.
+        chunkSize : int
+            Number of time points to collect at a time in
+            collectAvgStdWrapper.
         """
         #}}}
 
         self._convertToPhysical = convertToPhysical
+        self._chunkSize         = chunkSize
         # Notice the zInd is irrelevant, and will be not be used in the
         # collect
         zInd = 0
@@ -95,6 +102,70 @@ class CollectAndCalcRadialProfile(object):
         return dict1D
     #}}}
 
+    #{{{collectAvgStdWrapper
+    def collectAvgStdWrapper(self, paths, varName):
+        #{{{docstring
+        """
+        Collects the variable chunk by chunk in time, and calculates the
+        average and standard deviation of the variable and its radial
+        derivative.
+
+        The results equal the ones obtained from calcAvgFluctStd, but
+        only one chunk of the time series is held in memory.
+
+        Parameters
+        ----------
+        paths : tuple
+            Tuple of the collect paths
+        varName : str
+            Name of the variable to collect
+
+        Returns
+        -------
+        dict1D : dict
+            Dictionary of the last collected chunk (where varName and
+            "time" are removed).
+            For details, see the documentation of the
+            CollectAndCalcFields1D class.
+        avgStd : dict
+            Dictionary with the keys "varAvg", "varAvgStd", "DDXVarAvg"
+            and "DDXVarAvgStd", where the values are 4d arrays with length
+            1 in the time dimension.
+        """
+        #}}}
+
+        # The statistics are taken over time and theta
+        varMoments    = RunningMoments(axis=(0,3))
+        DDXVarMoments = RunningMoments(axis=(0,3))
+
+        yInd, zInd, tSlice = self._slices[1:]
+        tInd = slicesToIndices(paths, tSlice, "t")
+
+        for chunkTInd in getChunkTIndices(paths, tInd, self._chunkSize):
+            # NOTE: The stop of the time slices is inclusive
+            step = chunkTInd[2] if len(chunkTInd) == 3 else None
+            self._slices =\
+                (None, yInd, zInd, slice(chunkTInd[0], chunkTInd[1], step))
+            dict1D = self.collectWrapper(paths, varName)
+
+            var = dict1D.pop(varName)
+            varMoments   .add(var)
+            DDXVarMoments.add(DDX(var, self.dh.dx))
+
+        # Reset the slices
+        self._slices = (None, yInd, zInd, tSlice)
+
+        dict1D.pop("time")
+
+        avgStd = {"varAvg"       : varMoments   .getMean(),\
+                  "varAvgStd"    : varMoments   .getStd() ,\
+                  "DDXVarAvg"    : DDXVarMoments.getMean(),\
+                  "DDXVarAvgStd" : DDXVarMoments.getStd() ,\
+                 }
+
+        return dict1D, avgStd
+    #}}}
+
     #{{{_specialCollect
     def _specialCollect(self, varName, ccf1D):
         #{{{docstring
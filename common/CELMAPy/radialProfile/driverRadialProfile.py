@@ -6,7 +6,6 @@ from ..superClasses import DriverSuperClass
 from ..collectAndCalcHelpers import DDX
 from .collectAndCalcRadialProfile import CollectAndCalcRadialProfile
 from .plotRadialProfile import PlotProfAndGradCompare
-from multiprocessing import Process
 
 #{{{driverProfAndGradCompare
 def driverProfAndGradCompare(varName          ,\
@@ -48,30 +47,20 @@ def driverProfAndGradCompare(varName          ,\
     # Extract the steady state variable at the last time (but keep the 4d)
     steadyVar = rp[varName][-2:-1,:,:,:]
 
-    # Collect the variable
-    rp = ccrp.collectWrapper(collectPaths, varName)
-    # Extract the variable
-    var = rp[varName]
-
-    varAvg, varAvgFluct, varAvgStd = ccrp.calcAvgFluctStd(var)
+    # Collect the variable and calculate the averages
+    # NOTE: The variable is collected in chunks of time
+    rp, avgStd = ccrp.collectAvgStdWrapper(collectPaths, varName)
 
     # Calculate the derivatives
     dx = ccrp.dh.dx
     DDXSteadyVar = DDX(steadyVar, dx)
-    DDXVar = DDX(var, dx)
-
-    DDXVarAvg, DDXVarAvgFluct, DDXVarAvgStd = ccrp.calcAvgFluctStd(DDXVar)
 
     # Recast to dict
-    # Remove not needed
-    rp.pop("time")
     rp["varName"]      = varName
     rp["steadyVar"]    = steadyVar   [0,:,0,0]
     rp["DDXSteadyVar"] = DDXSteadyVar[0,:,0,0]
-    rp["varAvg"]       = varAvg      [0,:,0,0]
-    rp["varAvgStd"]    = varAvgStd   [0,:,0,0]
-    rp["DDXVarAvg"]    = DDXVarAvg   [0,:,0,0]
-    rp["DDXVarAvgStd"] = DDXVarAvgStd[0,:,0,0]
+    for key in avgStd.keys():
+        rp[key] = avgStd[key][0,:,0,0]
 
     # Plot
     prp = PlotProfAndGradCompare(ccrp.uc, **plotSuperKwargs)
@@ -123,36 +112,24 @@ def driverPosOfFluct(var1Name         ,\
     # Extract the steady state variable at the last time (but keep the 4d)
     steadyVar = rp[var1Name][-1:,:,:,:]
 
-    # Collect first variable
-    rp = ccrp.collectWrapper(collectPaths, var1Name)
-    # Extract the variable
-    var = rp[var1Name]
-    varAvg, varAvgFluct, varAvgStd = ccrp.calcAvgFluctStd(var)
+    # Collect first variable and calculate the averages
+    # NOTE: The variables are collected in chunks of time
+    _, avgStd = ccrp.collectAvgStdWrapper(collectPaths, var1Name)
 
     # Calculate the derivatives of first variable
     DDXSteadyVar = DDX(steadyVar, ccrp.dh.dx)
-    DDXVar = DDX(var, ccrp.dh.dx)
-
-    DDXVarAvg, DDXVarAvgFluct, DDXVarAvgStd = ccrp.calcAvgFluctStd(DDXVar)
 
     # Collect phi
-    rp = ccrp.collectWrapper(collectPaths, var2Name)
-    # Extract the variable
-    var = rp[var2Name]
-    _, _, var2AvgStd = ccrp.calcAvgFluctStd(var)
+    rp, avgStd2 = ccrp.collectAvgStdWrapper(collectPaths, var2Name)
 
     # Recast to dict
-    # Remove not needed
-    rp.pop("time")
     rp["varName"]      = var1Name
     rp["var2Name"]     = var2Name
     rp["steadyVar"]    = steadyVar   [0,:,0,0]
     rp["DDXSteadyVar"] = DDXSteadyVar[0,:,0,0]
-    rp["varAvg"]       = varAvg      [0,:,0,0]
-    rp["varAvgStd"]    = varAvgStd   [0,:,0,0]
-    rp["var2AvgStd"]   = var2AvgStd  [0,:,0,0]
-    rp["DDXVarAvg"]    = DDXVarAvg   [0,:,0,0]
-    rp["DDXVarAvgStd"] = DDXVarAvgStd[0,:,0,0]
+    for key in avgStd.keys():
+        rp[key] = avgStd[key][0,:,0,0]
+    rp["var2AvgStd"]   = avgStd2["varAvgStd"][0,:,0,0]
 
     # Plot
     prp = PlotProfAndGradCompare(ccrp.uc, **plotSuperKwargs)
@@ -242,11 +219,7 @@ class DriverRadialProfile(DriverSuperClass):
                  self._tSlice          ,\
                  self._plotSuperKwargs ,\
                 )
-        if self._useMultiProcess:
-            processes = Process(target = driverProfAndGradCompare, args = args)
-            processes.start()
-        else:
-            driverProfAndGradCompare(*args)
+        self._runTask(driverProfAndGradCompare, args)
     #}}}
 
     #{{{driverPosOfFluct
@@ -266,10 +239,6 @@ class DriverRadialProfile(DriverSuperClass):
                  self._tSlice          ,\
                  self._plotSuperKwargs ,\
                 )
-        if self._useMultiProcess:
-            processes = Process(target = driverPosOfFluct, args = args)
-            processes.start()
-        else:
-            driverPosOfFluct(*args)
+        self._runTask(driverPosOfFluct, args)
     #}}}
 #}}}
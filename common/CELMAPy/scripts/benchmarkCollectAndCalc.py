@@ -0,0 +1,33 @@
+#!/usr/bin/env python
+
+"""
+Benchmarks the collectAndCalc layer on synthetic dump folders.
+
+Reports the wall time, the peak memory and the bytes read of
+collectiveCollect, polAvg, DDX, DDZ, CollectAndCalcFields2D,
+CollectAndCalcBlobs and calcPSD.
+"""
+
+import os, sys
+# If we add to sys.path, then it must be an absolute path
+commonDir = os.path.abspath("./../common")
+# Sys path is a list of system paths
+sys.path.append(commonDir)
+
+from CELMAPy.benchmark import makeSyntheticDumps, runBenchmarks
+import tempfile
+
+# The size of the synthetic data
+dumpKwargs = {"nx"        : 32 ,\
+              "ny"        : 16 ,\
+              "nz"        : 64 ,\
+              "nt"        : 200,\
+              "NXPE"      : 2  ,\
+              "NYPE"      : 2  ,\
+              "nSegments" : 2  ,\
+             }
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as root:
+        paths = makeSyntheticDumps(root, **dumpKwargs)
+        runBenchmarks(paths, repeat = 3)
@@ -6,6 +6,7 @@ of the time traces.
 """
 
 from ..timeTrace import CollectAndCalcTimeTrace
+from ..collectAndCalcHelpers import RunningMoments
 from scipy.stats import kurtosis, skew
 
 #{{{CollectAndCalcSkewnessKurtosis
@@ -51,6 +52,51 @@ class CollectAndCalcSkewnessKurtosis(CollectAndCalcTimeTrace):
         super().__init__(*args, **kwargs)
     #}}}
 
+    #{{{executeCollectAndCalcSkewnessKurtosis
+    def executeCollectAndCalcSkewnessKurtosis(self, chunkSize = 100):
+        #{{{docstring
+        """
+        Collects the time traces chunk by chunk in time, and calculates
+        the skewness and kurtosis incrementally.
+
+        The result equals the one obtained by calling
+        calcSkewnessKurtosis on the output of executeCollectAndCalc, but
+        only one chunk of each time trace is held in memory.
+
+        Parameters
+        ----------
+        chunkSize : int
+            Number of time points to collect at a time.
+
+        Returns
+        -------
+        skewKurt : dict
+            Dictionary where the keys are on the form "rho,theta,z".
+            The value is a dict containing of
+            {varNameSkew:skewness, varNameKurt:kurtosis}
+            NOTE: Fisher's kurtosis (excess) is used, where 3 is subtracted
+                  from Pearson's definition
+        """
+        #}}}
+
+        # Make the keys
+        skewKey = "{}Skew".format(self._varName)
+        kurtKey = "{}Kurt".format(self._varName)
+
+        # Initialize the output
+        skewKurt = {}
+
+        for key, getChunks in self._iterChunks(chunkSize):
+            moments = RunningMoments()
+            for chunk in getChunks():
+                moments.add(chunk)
+
+            skewKurt[key] = {skewKey : moments.getSkewness()[0],\
+                             kurtKey : moments.getKurtosis()[0]}
+
+        return skewKurt
+    #}}}
+
     @staticmethod
     #{{{calcSkewnessKurtosis
     def calcSkewnessKurtosis(timeTraces):
@@ -9,7 +9,6 @@ from ..collectAndCalcHelpers import getGridSizes
 from .collectAndCalcSkewnessKurtosis import CollectAndCalcSkewnessKurtosis
 from .plotSkewnessKurtosis import PlotSkewnessKurtosis
 import numpy as np
-from multiprocessing import Process
 
 #{{{driverSkewnessKurtosis
 def driverSkewnessKurtosis(collectPaths     ,\
@@ -71,12 +70,9 @@ def driverSkewnessKurtosis(collectPaths     ,\
     # Set name
     ccSK.setVarName(varName)
 
-    # Execute the collection
-    tt = ccSK.executeCollectAndCalc()
-    tt = ccSK.convertTo1D(tt)
-
-    # Calculate the skewness and kurtosis
-    skewKurt = ccSK.calcSkewnessKurtosis(tt)
+    # Collect and calculate the skewness and kurtosis
+    # NOTE: The time traces are collected in chunks of time
+    skewKurt = ccSK.executeCollectAndCalcSkewnessKurtosis()
 
     # Recast to position
     keys    = tuple(sorted(list(skewKurt.keys())))
@@ -183,10 +179,6 @@ class DriverSkewnessKurtosis(DriverPointsSuperClass):
                  self._indicesKwargs   ,\
                  self._plotSuperKwargs ,\
                 )
-        if self._useMultiProcess:
-            processes = Process(target = driverSkewnessKurtosis, args = args)
-            processes.start()
-        else:
-            driverSkewnessKurtosis(*args)
+        self._runTask(driverSkewnessKurtosis, args)
     #}}}
 #}}}
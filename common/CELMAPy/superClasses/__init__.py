@@ -8,7 +8,13 @@ from .collectAndCalcFieldsSuperClass import CollectAndCalcFieldsSuperClass
 from .collectAndCalcPointsSuperClass import CollectAndCalcPointsSuperClass
 from .driverPlotFieldsSuperClass import DriverPlotFieldsSuperClass
 from .driverPointsSuperClass import DriverPointsSuperClass
-from .driverSuperClass import DriverSuperClass
+from .driverSuperClass import (DriverSuperClass,\
+                               TaskScheduler,\
+                               getTaskScheduler,\
+                               setDriverWorkers,\
+                               getDriverWorkers,\
+                               setDriverMemory,\
+                               getDriverMemory)
 from .collectAndCalcSuperClass import CollectAndCalcSuperClass
 from .plotSuperClass import PlotSuperClass
 from .plotAnimSuperClasses import (PlotAnimSuperClass,\
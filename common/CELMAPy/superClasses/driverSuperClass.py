@@ -4,7 +4,28 @@
 Contains the super class for the drivers
 """
 
+from ..collectAndCalcHelpers import resetPeakRSS, getRSS
+from multiprocessing import Pipe, Process
+from multiprocessing.connection import wait
 import matplotlib.pyplot as plt
+import atexit
+import os
+import resource
+import sys
+import time
+import traceback
+
+# Environment variables used to configure the number of tasks run at the
+# same time by the drivers, and the memory (in bytes) the tasks can
+# reserve in total. These are inherited by sub processes (and forwarded
+# by the PBSSubmitter)
+driverWorkersEnv = "CELMAPY_DRIVER_WORKERS"
+driverMemoryEnv  = "CELMAPY_DRIVER_MEMORY"
+
+# The scheduler shared by all drivers in the process
+_scheduler = {}
+# Whether or not the process is a task of a scheduler
+_taskState = {"insideTask" : False}
 
 #{{{DriverSuperClass
 class DriverSuperClass(object):
@@ -17,6 +38,7 @@ class DriverSuperClass(object):
                  dmp_folders         ,\
                  useMultiProcess = True,\
                  collectPaths  = None,\
+                 memoryBudget  = None,\
                  ):
         #{{{docstring
         """
@@ -35,6 +57,13 @@ class DriverSuperClass(object):
         useMultiProcess : bool
             Whether each job will be made by a new sub process, if not,
             the jobs will be done in series.
+            The sub processes are run through the TaskScheduler, which
+            limits the number of jobs running at the same time.
+        memoryBudget : [None|int]
+            The memory (in bytes) each job is expected to use.
+            A job is not started before the budget fits within the
+            memory limit of the TaskScheduler.
+            If None, the jobs are only limited by the number of workers.
         """
         #}}}
 
@@ -45,6 +74,7 @@ class DriverSuperClass(object):
         # Set the member data
         self._collectPaths  = collectPaths
         self._useMultiProcess = useMultiProcess
+        self._memoryBudget    = memoryBudget
 
         if self._useMultiProcess:
             #{{{ The multiprocess currently only works with the Agg backend
@@ -57,4 +87,529 @@ class DriverSuperClass(object):
             #}}}
             plt.switch_backend("Agg")
     #}}}
+
+    #{{{_runTask
+    def _runTask(self, target, args = (), kwargs = None):
+        #{{{docstring
+        """
+        Runs a job, either in a sub process or in series.
+
+        NOTE: The sub process is started as soon as a worker is free, and
+              this function returns without waiting for the job to
+              finish.
+
+        Parameters
+        ----------
+        target : function
+            The job to run.
+        args : tuple
+            Positional arguments to target.
+        kwargs : [None|dict]
+            Keyword arguments to target.
+
+        Returns
+        -------
+        task : [None|int]
+            The task number in the TaskScheduler.
+            None if the job was run in series.
+        """
+        #}}}
+
+        if kwargs is None:
+            kwargs = {}
+
+        if self._useMultiProcess:
+            return getTaskScheduler().submit(target,\
+                                             args,\
+                                             kwargs,\
+                                             memoryBudget=self._memoryBudget)
+        else:
+            target(*args, **kwargs)
+            return None
+    #}}}
+
+    #{{{_waitForTasks
+    def _waitForTasks(self, tasks):
+        #{{{docstring
+        """
+        Waits for the jobs started by _runTask to finish.
+
+        Parameters
+        ----------
+        tasks : iterable
+            The output of _runTask.
+        """
+        #}}}
+
+        tasks = tuple(task for task in tasks if task is not None)
+        if len(tasks) > 0:
+            getTaskScheduler().wait(tasks)
+    #}}}
+#}}}
+
+#{{{TaskScheduler
+class TaskScheduler(object):
+    """
+    Class which runs tasks in a bounded number of sub processes.
+
+    A task is started when the number of running tasks is below the
+    number of workers, and its memory budget (if given) fits within the
+    memory limit together with the budgets of the running tasks.
+    The runtime and the peak memory of each task is reported when it
+    finishes. The peak memory is the increase over the memory the task
+    inherited from the driver.
+
+    NOTE: Tasks submitted from inside a task are run in series in the
+          process of that task. The bound on the number of workers and
+          the memory therefore also covers nested tasks (for example
+          the spans collected by a blob driver).
+    """
+
+    #{{{constructor
+    def __init__(self, nWorkers = None, memoryLimit = None):
+        #{{{docstring
+        """
+        Constructor for the TaskScheduler.
+
+        Parameters
+        ----------
+        nWorkers : [None|int]
+            The maximum number of tasks running at the same time.
+            If None, the number set by setDriverWorkers is used.
+        memoryLimit : [None|int]
+            The memory (in bytes) the running tasks can reserve in
+            total.
+            If None, the limit set by setDriverMemory is used.
+        """
+        #}}}
+
+        self._nWorkers    = nWorkers
+        self._memoryLimit = memoryLimit
+
+        # The process owning the tasks
+        self._pid = os.getpid()
+
+        # The running tasks on the form {task:(name, process, budget)}
+        self._running = {}
+        # The receiving end of the pipes of the running tasks
+        self._conns   = {}
+        # The outputs of the finished tasks
+        self._results = {}
+        self._nTasks  = 0
+
+        # The finished tasks on the form (name, exitcode, runtime, peak)
+        self.reports = []
+    #}}}
+
+    #{{{submit
+    def submit(self, target, args = (), kwargs = None, memoryBudget = None):
+        #{{{docstring
+        """
+        Starts a task in a sub process when it fits.
+
+        NOTE: This blocks until a worker (and the memory budget) is
+              available.
+              If called from inside a task, the target is run
+              directly in the process of the task.
+
+        Parameters
+        ----------
+        target : function
+            The function to run.
+        args : tuple
+            Positional arguments to target.
+        kwargs : [None|dict]
+            Keyword arguments to target.
+        memoryBudget : [None|int]
+            The memory (in bytes) the task is expected to use.
+            If None, only the number of workers limits the task.
+
+        Returns
+        -------
+        task : int
+            The task number used in wait and getResult.
+        """
+        #}}}
+
+        if kwargs is None:
+            kwargs = {}
+
+        task = self._nTasks
+        self._nTasks += 1
+
+        if _taskState["insideTask"]:
+            self._results[task] = target(*args, **kwargs)
+            return task
+
+        self._forgetParentTasks()
+        while not(self._fits(memoryBudget)):
+            self._reap()
+        name = "{}-{}".format(getattr(target, "__name__", "task"), task)
+
+        receiver, sender = Pipe(duplex = False)
+        process = Process(target = _runAndReport,\
+                          args   = (sender, target, args, kwargs),\
+                          name   = name)
+        process.start()
+        # NOTE: The parent must close its copy of the sending end, so
+        #       that a crashed task is seen as end of file
+        sender.close()
+
+        self._running[task] = (name, process, memoryBudget)
+        self._conns  [task] = receiver
+
+        return task
+    #}}}
+
+    #{{{wait
+    def wait(self, tasks = None):
+        #{{{docstring
+        """
+        Waits for tasks to finish.
+
+        Parameters
+        ----------
+        tasks : [None|iterable]
+            The tasks to wait for.
+            If None, all running tasks are waited for.
+        """
+        #}}}
+
+        self._forgetParentTasks()
+        if tasks is None:
+            tasks = tuple(self._running.keys())
+
+        while any(task in self._running for task in tasks):
+            self._reap()
+    #}}}
+
+    #{{{getResult
+    def getResult(self, task):
+        #{{{docstring
+        """
+        Returns (and forgets) the output of a finished task.
+
+        Parameters
+        ----------
+        task : int
+            The task number as obtained from submit.
+
+        Returns
+        -------
+        result : object
+            The output of the target of the task.
+        """
+        #}}}
+
+        self.wait((task,))
+
+        if not(task in self._results):
+            message = "Task {} failed or its result was already obtained".\
+                        format(task)
+            raise RuntimeError(message)
+
+        return self._results.pop(task)
+    #}}}
+
+    #{{{starmap
+    def starmap(self, func, argsList, memoryBudget = None, nWorkers = None):
+        #{{{docstring
+        """
+        As Pool.starmap, but with the tasks run through the scheduler.
+
+        Parameters
+        ----------
+        func : function
+            The function to run.
+        argsList : iterable of tuples
+            The positional arguments of each task.
+        memoryBudget : [None|int]
+            The memory (in bytes) each task is expected to use.
+        nWorkers : [None|int]
+            The maximum number of these tasks running at the same time.
+            If None, only the limits of the scheduler apply.
+
+        Returns
+        -------
+        results : list
+            The outputs in the order of argsList.
+        """
+        #}}}
+
+        tasks = []
+        for args in argsList:
+            if nWorkers is not None:
+                while sum(task in self._running for task in tasks) >= nWorkers:
+                    self._reap()
+            tasks.append(self.submit(func, args, memoryBudget = memoryBudget))
+
+        return [self.getResult(task) for task in tasks]
+    #}}}
+
+    #{{{_fits
+    def _fits(self, memoryBudget):
+        """
+        Returns whether or not a task with the budget can be started
+        """
+
+        nWorkers = self._nWorkers if self._nWorkers is not None\
+                   else getDriverWorkers()
+        if len(self._running) >= nWorkers:
+            return False
+
+        # NOTE: A task is always started if nothing else runs, even if
+        #       the budget exceeds the limit
+        if memoryBudget is None or len(self._running) == 0:
+            return True
+
+        memoryLimit = self._memoryLimit if self._memoryLimit is not None\
+                      else getDriverMemory()
+        reserved = sum(budget for _, _, budget in self._running.values()\
+                       if budget is not None)
+
+        return reserved + memoryBudget <= memoryLimit
+    #}}}
+
+    #{{{_forgetParentTasks
+    def _forgetParentTasks(self):
+        """
+        Forgets the tasks of the parent if this is a forked process
+        """
+
+        if self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._running.clear()
+            self._conns  .clear()
+            self._results.clear()
+    #}}}
+
+    #{{{_reap
+    def _reap(self):
+        """
+        Waits until at least one task finishes and collects the reports
+        """
+
+        # NOTE: The output is received before joining, as a large
+        #       output would otherwise block the task when the pipe is
+        #       full
+        readyConns = wait(self._conns.values())
+
+        for task, conn in tuple(self._conns.items()):
+            if not(conn in readyConns):
+                continue
+
+            name, process, budget = self._running.pop(task)
+            self._conns.pop(task)
+
+            try:
+                success, result, runtime, peak = conn.recv()
+            except EOFError:
+                # The task was killed (for example by the OOM killer)
+                success, result, runtime, peak = False, None, None, None
+            conn.close()
+            process.join()
+
+            if success:
+                self._results[task] = result
+            self.reports.append((name, process.exitcode, runtime, peak))
+            self._printReport(name, process.exitcode, runtime, peak, budget)
+    #}}}
+
+    #{{{_printReport
+    def _printReport(self, name, exitcode, runtime, peak, budget):
+        """
+        Prints the runtime and the peak memory of a finished task
+        """
+
+        if runtime is None:
+            print("Task '{}' was killed with exitcode {}".\
+                  format(name, exitcode))
+            return
+
+        status = "finished" if exitcode == 0 else "failed"
+        print("Task '{}' {} in {:.1f} s with a peak memory of {:.0f} MB".\
+              format(name, status, runtime, peak/2**20))
+        if budget is not None and peak > budget:
+            print("    NOTE: The peak memory exceeded the budget of {:.0f} MB".\
+                  format(budget/2**20))
+    #}}}
+#}}}
+
+#{{{_runAndReport
+def _runAndReport(sender, target, args, kwargs):
+    #{{{docstring
+    """
+    Runs the target and sends the output, runtime and peak memory.
+
+    Parameters
+    ----------
+    sender : Connection
+        The sending end of the pipe to the scheduler.
+    target : function
+        The function to run.
+    args : tuple
+        Positional arguments to target.
+    kwargs : dict
+        Keyword arguments to target.
+    """
+    #}}}
+
+    _taskState["insideTask"] = True
+
+    # NOTE: The task is forked from the driver, so the peak is reset in
+    #       order not to include the memory inherited from the driver
+    peakReset = resetPeakRSS()
+    rssStart  = getRSS(peakReset)
+
+    start = time.time()
+    try:
+        result  = target(*args, **kwargs)
+        success = True
+    except Exception:
+        traceback.print_exc()
+        result  = None
+        success = False
+    runtime = time.time() - start
+
+    # NOTE: Sub processes of the task are included. These are forked
+    #       from the task, so the starting size is subtracted from
+    #       their peak as well. ru_maxrss is given in kilobytes on linux.
+    childrenPeak = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss*1024
+    peak = max(getRSS(peakReset, peak=True) - rssStart,\
+               childrenPeak - rssStart                ,\
+               0)
+
+    sender.send((success, result, runtime, peak))
+    sender.close()
+
+    if not(success):
+        sys.exit(1)
+#}}}
+
+#{{{getTaskScheduler
+def getTaskScheduler():
+    #{{{docstring
+    """
+    Returns the scheduler shared by the drivers.
+
+    The scheduler is created on the first call, and waits for its tasks
+    when the interpreter exits.
+
+    Returns
+    -------
+    scheduler : TaskScheduler
+        The shared scheduler.
+    """
+    #}}}
+
+    if not("scheduler" in _scheduler):
+        _scheduler["scheduler"] = TaskScheduler()
+        atexit.register(_scheduler["scheduler"].wait)
+
+    return _scheduler["scheduler"]
+#}}}
+
+#{{{setDriverWorkers
+def setDriverWorkers(nWorkers):
+    #{{{docstring
+    """
+    Sets the number of tasks the drivers run at the same time.
+
+    The setting is stored as an environment variable, so that it is
+    inherited by sub processes.
+
+    Parameters
+    ----------
+    nWorkers : [None|int]
+        Number of tasks.
+        If None, the number of available processors is used.
+    """
+    #}}}
+
+    if nWorkers is None:
+        os.environ.pop(driverWorkersEnv, None)
+    else:
+        if int(nWorkers) < 1:
+            raise ValueError("nWorkers must be a positive integer")
+        os.environ[driverWorkersEnv] = str(int(nWorkers))
+#}}}
+
+#{{{getDriverWorkers
+def getDriverWorkers():
+    #{{{docstring
+    """
+    Returns the number of tasks the drivers run at the same time.
+
+    Returns
+    -------
+    nWorkers : int
+        The number of tasks (the number of available processors if
+        unset).
+    """
+    #}}}
+
+    if driverWorkersEnv in os.environ:
+        return int(os.environ[driverWorkersEnv])
+
+    # NOTE: The affinity respects the processors given by the queue
+    #       system
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count()
+#}}}
+
+#{{{setDriverMemory
+def setDriverMemory(memoryLimit):
+    #{{{docstring
+    """
+    Sets the memory the tasks of the drivers can reserve in total.
+
+    The setting is stored as an environment variable, so that it is
+    inherited by sub processes.
+
+    Parameters
+    ----------
+    memoryLimit : [None|int]
+        The memory in bytes.
+        If None, the available memory of the node is used.
+    """
+    #}}}
+
+    if memoryLimit is None:
+        os.environ.pop(driverMemoryEnv, None)
+    else:
+        if int(memoryLimit) < 1:
+            raise ValueError("memoryLimit must be a positive integer")
+        os.environ[driverMemoryEnv] = str(int(memoryLimit))
+#}}}
+
+#{{{getDriverMemory
+def getDriverMemory():
+    #{{{docstring
+    """
+    Returns the memory the tasks of the drivers can reserve in total.
+
+    Returns
+    -------
+    memoryLimit : int
+        The memory in bytes (the available memory of the node if
+        unset).
+    """
+    #}}}
+
+    if driverMemoryEnv in os.environ:
+        return int(os.environ[driverMemoryEnv])
+
+    # NOTE: MemAvailable includes the memory which can be freed from the
+    #       caches
+    try:
+        with open("/proc/meminfo") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1])*1024
+    except OSError:
+        pass
+
+    return os.sysconf("SC_AVPHYS_PAGES")*os.sysconf("SC_PAGE_SIZE")
 #}}}
@@ -8,7 +8,13 @@ from ..plotHelpers import (plotNumberFormatter,\
                            seqCMap,\
                            seqCMap3,\
                            divCMap)
-from ..plotHelpers import PlotHelper, getMaxMinAnimation, SizeMaker
+from ..plotHelpers import (PlotHelper,\
+                           getMaxMinAnimation,\
+                           getDecimation,\
+                           getKeptNodes,\
+                           segmentAverage,\
+                           saveAnimationParallel,\
+                           SizeMaker)
 from .plotSuperClass import PlotSuperClass
 from matplotlib.gridspec import GridSpec
 from matplotlib.ticker import FuncFormatter
@@ -27,10 +33,13 @@ class PlotAnimSuperClass(PlotSuperClass):
     """
 
     #{{{constructor
-    def __init__(self                     ,\
-                 *args                    ,\
-                 blobOrHole         = None,\
-                 averagedBlobOrHole = None,\
+    def __init__(self                             ,\
+                 *args                            ,\
+                 blobOrHole         = None        ,\
+                 averagedBlobOrHole = None        ,\
+                 quality            = "production",\
+                 maxFrames          = None        ,\
+                 maxPixels          = None        ,\
                  **kwargs):
         #{{{docstring
         """
@@ -50,6 +59,19 @@ class PlotAnimSuperClass(PlotSuperClass):
         averagedBlobOrHole : [None|bool]
             Only in use when looking at blobs.
             Used  when setting the fileName.
+        quality : ["production"|"preview"]
+            The quality of the animation.
+            "production" keeps all the frames at full resolution,
+            whereas "preview" decimates the frames and the resolution.
+            See decimationPresets in plotHelpers.decimation for details.
+        maxFrames : [None|int]
+            The maximum number of frames.
+            If None, the one of the quality is used.
+        maxPixels : [None|int|"auto"]
+            The maximum number of points along each spatial direction.
+            The data is averaged onto fewer points if it has more.
+            "auto" uses the size of the figure in pixels.
+            If None, the one of the quality is used.
         **kwargs : keyword arguments
             See parent constructor for details
         """
@@ -61,6 +83,10 @@ class PlotAnimSuperClass(PlotSuperClass):
         # Set member data
         self._blobOrHole         = blobOrHole
         self._averagedBlobOrHole = averagedBlobOrHole
+        self._maxFrames, self._maxPixels =\
+            getDecimation({"quality"   : quality  ,\
+                           "maxFrames" : maxFrames,\
+                           "maxPixels" : maxPixels})
 
         # Set animation and text options
         self.setAnimationOptions()
@@ -70,7 +96,12 @@ class PlotAnimSuperClass(PlotSuperClass):
     #}}}
 
     #{{{setAnimationOptions
-    def setAnimationOptions(self, bitrate = -1, fps = 10, codec = "h264"):
+    def setAnimationOptions(self             ,\
+                            bitrate  = -1    ,\
+                            fps      = 10    ,\
+                            codec    = "h264",\
+                            nWorkers = None  ,\
+                            ):
         #{{{docstring
         """
         Reset the save destination.
@@ -89,11 +120,90 @@ class PlotAnimSuperClass(PlotSuperClass):
             Default is h264.
             For installation, see
             https://github.com/loeiten/usingLinux/blob/master/installationProcedures/ffmpeg.md
+        nWorkers : [None|int]
+            Number of processes rendering chunks of the frames when
+            saving.
+            If None, the number set by setRenderWorkers is used.
+            See saveAnimationParallel for details.
         """
         #}}}
-        self._bitrate = bitrate
-        self._fps     = fps
-        self._codec   = codec
+        self._bitrate       = bitrate
+        self._fps           = fps
+        self._codec         = codec
+        self._renderWorkers = nWorkers
+    #}}}
+
+    #{{{_decimate
+    def _decimate(self, time, arrays, meshes = (), transposedMeshes = False):
+        #{{{docstring
+        """
+        Decimates the frames and averages the data onto fewer points.
+
+        NOTE: The decimation only depends on the shape of the arrays,
+              so arrays set separately (like phi) are decimated in the
+              same way as the data.
+
+        Parameters
+        ----------
+        time : [None|array]
+            The time array.
+        arrays : tuple
+            The arrays to decimate on the form (t, ...).
+            All the arrays must have the same shape.
+        meshes : tuple
+            The coordinates of the spatial points of the arrays.
+            These are evaluated in the kept points.
+        transposedMeshes : bool
+            Whether the spatial axes of the meshes are in the reversed
+            order of those of the arrays.
+
+        Returns
+        -------
+        time : [None|array]
+            The decimated time.
+        arrays : tuple
+            The decimated arrays.
+        meshes : tuple
+            The decimated meshes.
+        """
+        #}}}
+
+        # Decimate the frames
+        if self._maxFrames is not None:
+            stride = int(np.ceil(arrays[0].shape[0]/self._maxFrames))
+            if stride > 1:
+                if time is not None:
+                    time = time[::stride]
+                arrays = tuple(array[::stride] for array in arrays)
+
+        # Average onto fewer points
+        maxPixels = self._maxPixels
+        if maxPixels == "auto":
+            # NOTE: As in Animation.save
+            dpi = plt.rcParams["savefig.dpi"]
+            if dpi == "figure":
+                dpi = self._fig.dpi
+            maxPixels = int(np.ceil(max(self._fig.get_size_inches())*dpi))
+
+        if maxPixels is not None:
+            nSpatial = arrays[0].ndim - 1
+            for spatialAxis in range(nSpatial):
+                nodes, starts =\
+                    getKeptNodes(arrays[0].shape[spatialAxis + 1], maxPixels)
+                if nodes is None:
+                    continue
+
+                arrays = tuple(segmentAverage(array, starts, spatialAxis + 1)\
+                               for array in arrays)
+
+                if transposedMeshes:
+                    meshAxis = nSpatial - 1 - spatialAxis
+                else:
+                    meshAxis = spatialAxis
+                meshes = tuple(np.take(mesh, nodes, axis = meshAxis)\
+                               for mesh in meshes)
+
+        return time, arrays, meshes
     #}}}
 
     #{{{plotSaveShow
@@ -127,18 +237,11 @@ class PlotAnimSuperClass(PlotSuperClass):
                 fileName += "-{}".format("avg")
 
         if frames > 1:
-            # Animate
-            anim = animation.FuncAnimation(fig            ,\
-                                           func           ,\
-                                           frames = frames,\
-                                           blit   = False ,\
-                                           )
-
             if self._savePlot:
-                FFMpegWriter = animation.writers['ffmpeg']
-                writer = FFMpegWriter(bitrate = self._bitrate,\
-                                      fps     = self._fps    ,\
-                                      codec   = self._codec)
+                writerKwargs = {"bitrate" : self._bitrate,\
+                                "fps"     : self._fps    ,\
+                                "codec"   : self._codec  ,\
+                               }
 
                 # Hard coded magic number
                 self._extension = "mp4"
@@ -157,9 +260,27 @@ class PlotAnimSuperClass(PlotSuperClass):
                     nr = 0
 
                 # Save the animation
+                # NOTE: The frames are rendered serially through
+                #       FuncAnimation if only one worker is used
                 fileName = "{}-{}.{}".format(fileName, nr, self._extension)
-                anim.save(fileName, writer = writer)
+                saveAnimationParallel(fig                           ,\
+                                      func                          ,\
+                                      frames                        ,\
+                                      fileName                      ,\
+                                      writerKwargs                  ,\
+                                      nWorkers = self._renderWorkers,\
+                                      )
                 print("Saved to {}".format(fileName))
+
+            if self._showPlot:
+                # Animate
+                # NOTE: A reference is kept, as the animation stops if
+                #       it is garbage collected
+                self._anim = animation.FuncAnimation(fig            ,\
+                                                     func           ,\
+                                                     frames = frames,\
+                                                     blit   = False ,\
+                                                     )
         else:
             if self._savePlot:
                 if self._extension is None:
@@ -383,6 +504,20 @@ class PlotAnim1DSuperClass(PlotAnimSuperClass):
             self._ddtLines = tuple(self._ddtLines)
     #}}}
 
+    #{{{_decimateVars
+    def _decimateVars(self):
+        """
+        Decimates the frames and the resolution of the variables
+        """
+
+        keys = tuple(self._vars.keys())
+        self._time, arrays, (self._X,) =\
+            self._decimate(self._time,\
+                           tuple(self._vars[key] for key in keys),\
+                           (self._X,))
+        self._vars.update(zip(keys, arrays))
+    #}}}
+
     #{{{_setColors
     def _setColors(self):
         """
@@ -408,7 +543,8 @@ class PlotAnim2DSuperClass(PlotAnimSuperClass):
     #{{{constructor
     def __init__(self,\
                  *args,\
-                 fluct = None,\
+                 fluct      = None      ,\
+                 renderMode = "contourf",\
                  **kwargs):
         #{{{docstring
         """
@@ -427,6 +563,14 @@ class PlotAnim2DSuperClass(PlotAnimSuperClass):
             See parent constructor for details
         fluct: bool
             Whether or not the fluctuations are being plotted.
+        renderMode : ["contourf"|"pcolormesh"]
+            If "contourf" the axes are cleared and the contourf, the
+            colorbar and the text are redrawn every frame.
+            If "pcolormesh" the fields are plotted as quad meshes which
+            are made in the first frame, so that only the data, the
+            color limits and the text are updated in the following
+            frames.
+            This is faster, but gives no contour levels.
         **kwargs : keyword arguments
             See parent constructor for details
         """
@@ -435,12 +579,26 @@ class PlotAnim2DSuperClass(PlotAnimSuperClass):
         # Guard
         if fluct is None:
             raise ValueError("'fluct' must be bool")
+        implemented = ("contourf", "pcolormesh")
+        if not(renderMode in implemented):
+            message = "renderMode '{}' not implemented. Use one of {}".\
+                        format(renderMode, implemented)
+            raise NotImplementedError(message)
 
         # Call the constructor of the parent class
         super().__init__(*args, **kwargs)
 
         # Set memberdata
-        self._fluct = fluct
+        self._fluct      = fluct
+        self._renderMode = renderMode
+
+        # Will toggle if setPhiData or setPhiParData is called
+        self._overplotPhi = False
+
+        # The artists which are reused in the "pcolormesh" mode
+        self._meshes      = {}
+        self._phiContours = {}
+        self._cBar        = None
 
         # Set extra contourf keyword arguments
         self._cfKwargs = {}
@@ -608,6 +766,9 @@ class PlotAnim2DSuperClass(PlotAnimSuperClass):
         """
         #}}}
 
+        # Decimate as the data
+        _, (phi,), _ = self._decimate(None, (phi,))
+
         self._phi         = phi
         self._overplotPhi = True
     #}}}
@@ -627,6 +788,9 @@ class PlotAnim2DSuperClass(PlotAnimSuperClass):
         """
         #}}}
 
+        # Decimate as the data
+        _, (phiPPi,), _ = self._decimate(None, (phiPPi,))
+
         self._phiPPi      = phiPPi
         self._overplotPhi = True
     #}}}
@@ -669,6 +833,127 @@ class PlotAnim2DSuperClass(PlotAnimSuperClass):
                         format = FuncFormatter(plotNumberFormatter))
     #}}}
 
+    #{{{_updateMesh
+    def _updateMesh(self, ax, name, X, Y, Z, tInd, clim = None):
+        #{{{docstring
+        """
+        Plots or updates a quad mesh.
+
+        The mesh is made the first time the name is used.
+        Thereafter only the data and the color limits are updated.
+
+        Parameters
+        ----------
+        ax : Axis
+            The axis to plot the mesh on.
+        name : str
+            The name of the mesh.
+        X : array
+            A 2d mesh of the Cartesian x coordinates.
+        Y : array
+            A 2d mesh of the Cartesian y coordinates.
+        Z : array
+            The 2d values of the current frame.
+        tInd : int
+            The current time index.
+        clim : [None|tuple]
+            The color limits used if vmax and vmin are not set.
+            If None, the max and min of Z is used.
+
+        Returns
+        -------
+        mesh : QuadMesh
+            The updated mesh.
+        """
+        #}}}
+
+        if not(name in self._meshes):
+            # NOTE: Gouraud shading interprets the values at the mesh
+            #       nodes (as contourf does)
+            self._meshes[name] =\
+                ax.pcolormesh(X, Y, Z,\
+                              shading = "gouraud",\
+                              cmap    = self._cfKwargs["cmap"],\
+                              zorder  = self._cfKwargs["zorder"],\
+                              )
+        mesh = self._meshes[name]
+        mesh.set_array(Z)
+
+        if self._iterableLevels:
+            mesh.set_clim(self._vmin[tInd], self._vmax[tInd])
+        elif clim is not None:
+            mesh.set_clim(*clim)
+        else:
+            mesh.set_clim(np.min(Z), np.max(Z))
+
+        return mesh
+    #}}}
+
+    #{{{_updatePhiContours
+    def _updatePhiContours(self, ax, name, planes, **kwargs):
+        #{{{docstring
+        """
+        Replaces the phi contours of the previous frame.
+
+        Parameters
+        ----------
+        ax : Axis
+            The axis to plot the contours on.
+        name : str
+            The name of the contours.
+        planes : tuple of tuples
+            The planes to make contours of on the form
+            ((X1, Y1, phi1), (X2, Y2, phi2), ...)
+        **kwargs : keyword arguments
+            Additional keyword arguments given to contour.
+        """
+        #}}}
+
+        for contour in self._phiContours.pop(name, ()):
+            contour.remove()
+
+        self._phiContours[name] =\
+            tuple(ax.contour(X, Y, phi, **kwargs, **self._cKwargs)\
+                  for X, Y, phi in planes)
+    #}}}
+
+    #{{{_updateMeshColorbar
+    def _updateMeshColorbar(self, fig, mesh, cBarAx, tInd):
+        #{{{docstring
+        """
+        Makes the colorbar in the first frame, and updates the ticks.
+
+        NOTE: The colorbar follows the color limits of the mesh, so it
+              does not need to be redrawn.
+
+        Parameters
+        ----------
+        fig : Figure
+            The figure where the colorbar belongs.
+        mesh : QuadMesh
+            The mesh where the colorbar reads the data from.
+        cBarAx : Axis
+            The axis where the colorbar belongs.
+        tInd : int
+            The current time index.
+        """
+        #}}}
+
+        if self._cBar is None:
+            self._cBar = fig.colorbar(mesh,\
+                            cax    = cBarAx,\
+                            format = FuncFormatter(plotNumberFormatter))
+            self._cBar.set_label(self._varLabel)
+
+        if self._fluct and self._iterableLevels:
+            # Create the ticks (11 with 0 in the center)
+            nTicks = 11
+            ticks  = np.linspace(self._vmin[tInd], self._vmax[tInd], nTicks)
+            # Enforce the center one to be 0 (without round off)
+            ticks[int((nTicks - 1)/2)] = 0
+            self._cBar.set_ticks(ticks)
+    #}}}
+
     #{{{_setFileName
     def _setFileName(self, plotTypeName):
         #{{{docstring
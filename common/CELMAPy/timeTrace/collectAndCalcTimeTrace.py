@@ -12,8 +12,10 @@ from ..collectAndCalcHelpers import (polAvg,\
                                      calcN,\
                                      calcUIPar,\
                                      calcUEPar,\
+                                     getChunkTIndices,\
                                      slicesToIndices,\
                                      )
+from functools import partial
 
 #{{{CollectAndCalcTimeTrace
 class CollectAndCalcTimeTrace(CollectAndCalcPointsSuperClass):
@@ -98,23 +100,14 @@ class CollectAndCalcTimeTrace(CollectAndCalcPointsSuperClass):
             timeTraces[key] = {}
 
             # Collect and slice
+            # NOTE: The step of the slice is dealt with in the collect
             if self._tSlice is not None:
                 t = slicesToIndices(self._collectPaths, self._tSlice[tCounter], "t")
-                tStep = self._tSlice[tCounter].step
             else:
                 t = None
-                tStep = None
 
             var, time = self._collectWrapper(timeTraces,key,x,y,z,t)
 
-            if tStep is not None:
-                # Slice the variables with the step
-                # Make a new slice as the collect dealt with the start and
-                # the stop of the slice
-                newSlice = slice(None, None, tStep)
-                var  = var [newSlice]
-                time = time[newSlice]
-
             if self.uc.convertToPhysical:
                 timeTraces[key][self._varName] =\
                         self.uc.physicalConversion(var , self._varName)
@@ -160,6 +153,75 @@ class CollectAndCalcTimeTrace(CollectAndCalcPointsSuperClass):
         return timeTraces
     #}}}
 
+    #{{{_iterChunks
+    def _iterChunks(self, chunkSize):
+        #{{{docstring
+        """
+        Iterates over the time traces chunk by chunk in time.
+
+        Parameters
+        ----------
+        chunkSize : int
+            Number of time points to collect at a time.
+
+        Yields
+        ------
+        key : str
+            The key on the form "rho,theta,z".
+        getChunks : function
+            Function without arguments returning a generator which
+            yields the 1d chunks of the time trace of the key.
+            The chunks are converted to physical units if
+            convertToPhysical is set.
+            NOTE: Each call starts a new pass through the data, so
+                  the time trace can be iterated over several times.
+        """
+        #}}}
+
+        # Guard
+        if len(self._notCalled) > 0:
+            message = "The following functions were not called:\n{}".\
+                        format("\n".join(self._notCalled))
+            raise RuntimeError(message)
+
+        # Make sure zInd is not None
+        self._zInd =\
+            tuple(zInd if zInd is not None else 0 for zInd in self._zInd)
+
+        for tCounter, (x, y, z) in\
+                enumerate(zip(self._xInd, self._yInd, self._zInd)):
+            rho   = self._dh.rho     [x]
+            theta = self._dh.thetaDeg[z]
+            par   = self._dh.z       [y]
+            key = "{},{},{}".format(rho,theta,par)
+
+            if self._tSlice is not None:
+                t = slicesToIndices(self._collectPaths,\
+                                    self._tSlice[tCounter], "t")
+            else:
+                t = None
+
+            yield key, partial(self._chunksOfPoint, key, x, y, z, t, chunkSize)
+    #}}}
+
+    #{{{_chunksOfPoint
+    def _chunksOfPoint(self, key, x, y, z, t, chunkSize):
+        """
+        Yields the 1d chunks of the time trace in one point
+        """
+
+        for chunkT in getChunkTIndices(self._collectPaths, t, chunkSize):
+            var, _ = self._collectWrapper({key:{}}, key, x, y, z, chunkT)
+
+            if self._mode == "fluct":
+                # The fluctuations does not have a specified z
+                var = var[:,:,:,z:z+1]
+            if self.uc.convertToPhysical:
+                var = self.uc.physicalConversion(var, self._varName)
+
+            yield var.flatten()
+    #}}}
+
     #{{{_collectWrapper
     def _collectWrapper(self,timeTraces,key,x,y,z,t):
         #{{{docstring
@@ -211,7 +273,7 @@ class CollectAndCalcTimeTrace(CollectAndCalcPointsSuperClass):
             var = self._calcNonSolvedVars(collector,indArgs,t)
 
         if self._mode == "fluct":
-            var = (var - polAvg(var))
+            var = (var - polAvg(var, compact=True))
             timeTraces[key]["zInd"] = z
 
         return var, time
@@ -245,23 +307,28 @@ class CollectAndCalcTimeTrace(CollectAndCalcPointsSuperClass):
 
         normalized = True
 
-        lnN = collector(self._collectPaths,\
-                        "lnN"             ,\
+        # Collect all the needed variables in one pass
+        if self._varName == "n":
+            varNames = ("lnN",)
+        elif self._varName == "uIPar":
+            varNames = ("lnN", "momDensPar")
+        else:
+            varNames = ("lnN", "momDensPar", "jPar")
+        var = collector(self._collectPaths,\
+                        varNames          ,\
                         *indArgs, tInd=t)
+
+        lnN = var["lnN"]
         n = calcN(lnN, normalized, uc = self.uc)
         if self._varName == "n":
             return n
         else:
-            momDensPar = collector(self._collectPaths,\
-                                   "momDensPar"      ,\
-                                   *indArgs, tInd=t)
+            momDensPar = var["momDensPar"]
             uIPar = calcUIPar(momDensPar, n)
             if self._varName == "uIPar":
                 return uIPar
             else:
-                jPar = collector(self._collectPaths,\
-                                "jPar"            ,\
-                                *indArgs, tInd=t)
+                jPar = var["jPar"]
                 uEPar = calcUEPar(uIPar     ,\
                                   jPar      ,\
                                   n         ,\
@@ -7,7 +7,6 @@ Contains single driver and driver class for the time traces
 from ..superClasses import DriverPointsSuperClass
 from .collectAndCalcTimeTrace import CollectAndCalcTimeTrace
 from .plotTimeTrace import PlotTimeTrace
-from multiprocessing import Process
 
 #{{{driverTimeTrace
 def driverTimeTrace(collectPaths     ,\
@@ -180,10 +179,6 @@ class DriverTimeTrace(DriverPointsSuperClass):
                  self._indicesKwargs   ,\
                  self._plotSuperKwargs ,\
                 )
-        if self._useMultiProcess:
-            processes = Process(target = driverTimeTrace, args = args)
-            processes.start()
-        else:
-            driverTimeTrace(*args)
+        self._runTask(driverTimeTrace, args)
     #}}}
 #}}}
@@ -4,15 +4,17 @@
 Contains the total flux calculation
 """
 
-from ..calcVelocities import calcRadialExBConstRho
+from ..calcVelocities import calcRadialExBFromPhi
 from ..collectAndCalcHelpers import (DimensionsHelper   ,\
                                      calcUEPar          ,\
                                      calcUIPar          ,\
                                      collectConstZ      ,\
                                      collectConstRho    ,\
                                      collectTime        ,\
+                                     getChunkTIndices   ,\
                                      getGridSizes       ,\
                                      parallelIntegration,\
+                                     polAvg             ,\
                                      poloidalIntegration,\
                                      radialIntegration  ,\
                                      slicesToIndices    ,\
@@ -34,6 +36,7 @@ class CollectAndCalcTotalFlux(object):
                  tSlice            = None    ,\
                  mode              = "normal",\
                  convertToPhysical = True    ,\
+                 chunkSize         = 100     ,\
                  ):
         #{{{docstring
         """
@@ -57,6 +60,9 @@ class CollectAndCalcTotalFlux(object):
             Whether to look at fluctuations or normal data
         convertToPhysical : bool
             Whether or not to convert to physical
+        chunkSize : int
+            Number of time points to collect and calculate at a time.
+            This bounds the memory usage for long time series.
         """
         #}}}
 
@@ -64,6 +70,7 @@ class CollectAndCalcTotalFlux(object):
         self._collectPaths = collectPaths
         self._mode         = mode
         self._tSlice       = tSlice
+        self._chunkSize    = chunkSize
 
         # Set the indices
         if xInd is None:
@@ -90,6 +97,7 @@ class CollectAndCalcTotalFlux(object):
         self._dh = DimensionsHelper(self._collectPaths[0], self.uc)
 
         # Get the tInd trace
+        # NOTE: The step of the slice is dealt with in the collect
         self._tInd = slicesToIndices(self._collectPaths[0], self._tSlice, "t")
     #}}}
 
@@ -130,56 +138,116 @@ class CollectAndCalcTotalFlux(object):
         # Initialize output
         totalFluxes = {}
 
+        # Collect time
+        time = collectTime(self._collectPaths, tInd = self._tInd)
+        if self.convertToPhysical:
+            time = self.uc.physicalConversion(time ,"t")
+
+        # Integration multipliers
+        rho = self._dh.rho[self._xInd]
+        dx = self._dh.dx
+        dy = self._dh.dy
+
+        parElIntFlux  = np.empty(len(time))
+        parIonIntFlux = np.empty(len(time))
+        perpIntFlux   = np.empty(len(time))
+
+        # NOTE: All the calculations are done time point by time point,
+        #       so the time series is processed in chunks in order to
+        #       bound the memory usage
+        outStart = 0
+        for chunkTInd in\
+                getChunkTIndices(self._collectPaths, self._tInd, self._chunkSize):
+            int2Fluxes = self._calcChunk(chunkTInd, rho, dx, dy)
+            outSlice = slice(outStart, outStart + len(int2Fluxes[0]))
+            outStart = outSlice.stop
+
+            parElIntFlux [outSlice] = int2Fluxes[0]
+            parIonIntFlux[outSlice] = int2Fluxes[1]
+            perpIntFlux  [outSlice] = int2Fluxes[2]
+
+        # Integrating over time
+        dt = time[1] - time[0]
+        timeIntRadFluxDens    = parElIntFlux .sum()*dt
+        timeIntParElFluxDens  = parIonIntFlux.sum()*dt
+        timeIntParIonFluxDens = perpIntFlux  .sum()*dt
+
+        # Storing
+        totalFluxes["parElIntFlux"]  = parElIntFlux
+        totalFluxes["parIonIntFlux"] = parIonIntFlux
+        totalFluxes["perpIntFlux"]   = perpIntFlux
+        totalFluxes["timeIntEl"]     = timeIntRadFluxDens
+        totalFluxes["timeIntIon"]    = timeIntParElFluxDens
+        totalFluxes["timeIntPerp"]   = timeIntParIonFluxDens
+        totalFluxes["time"]          = time
+        totalFluxes["rho"]           = rho
+        totalFluxes["z"]             = self._dh.z[self._yInd]
+
+        return totalFluxes
+    #}}}
+
+    #{{{_calcChunk
+    def _calcChunk(self, tInd, rho, dx, dy):
+        #{{{docstring
+        """
+        Collects and calculates the integrated fluxes of a time chunk.
+
+        Parameters
+        ----------
+        tInd : tuple
+            The time indices of the chunk.
+        rho : float
+            The fixed rho value.
+        dx : float
+            The grid spacing in x.
+        dy : float
+            The grid spacing in y.
+
+        Returns
+        -------
+        int2Fluxes : tuple
+            The integrated fluxes of the chunk (as 1d arrays) on the
+            form (parElIntFlux, parIonIntFlux, perpIntFlux).
+        """
+        #}}}
+
         # Collect densities
-        radialN = np.exp(self._collectAndCalcConstRho("lnN"))
-        parN    = np.exp(self._collectAndCalcConstZ("lnN"))
+        # NOTE: The variables in each plane are collected in one pass
+        radialVars = self._collectAndCalcConstRho(("lnN", "phi"), tInd)
+        parVars    =\
+            self._collectAndCalcConstZ(("lnN", "momDensPar", "jPar"), tInd)
+        radialN = np.exp(radialVars["lnN"])
+        parN    = np.exp(parVars["lnN"])
 
         if self.convertToPhysical:
             radialN = self.uc.physicalConversion(radialN, "n")
             parN    = self.uc.physicalConversion(parN   , "n")
 
         # Collect the parallel velocities
-        parMomDensPar = self._collectAndCalcConstZ("momDensPar")
-        parJPar       = self._collectAndCalcConstZ("jPar")
+        parMomDensPar = parVars["momDensPar"]
+        parJPar       = parVars["jPar"]
         parIonVel = calcUIPar(parMomDensPar, parN)
         parElVel  = calcUEPar(parIonVel, parJPar, parN,
                               not(self.convertToPhysical))
 
         if self._mode == "fluct":
-            radialN   = (radialN   - polAvg(radialN))
-            parN      = (parN      - polAvg(parN))
-            parIonVel = (parIonVel - polAvg(parIonVel))
-            parElVel  = (parElVel  - polAvg(parElVel))
-
-        # Collect the perpendicular velocities
-        radialExB = calcRadialExBConstRho(\
-                          self._collectPaths                        ,\
-                          self._xInd                                ,\
-                          self._tSlice                              ,\
-                          mode              = self._mode            ,\
-                          convertToPhysical = self.convertToPhysical,\
-                          )
-
-        # Collect time
-        time = collectTime(self._collectPaths, tInd = self._tInd)
-        if self.convertToPhysical:
-            time = self.uc.physicalConversion(time ,"t")
-
-        if self._tSlice is not None:
-            if type(self._tSlice) == slice:
-                if self._tSlice.step is not None:
-                    time  = time[::self._tSlice.step]
+            radialN   = (radialN   - polAvg(radialN, compact=True))
+            parN      = (parN      - polAvg(parN, compact=True))
+            parIonVel = (parIonVel - polAvg(parIonVel, compact=True))
+            parElVel  = (parElVel  - polAvg(parElVel, compact=True))
+
+        # Calculate the perpendicular velocities
+        radialExB = calcRadialExBFromPhi(radialVars["phi"],\
+                                         rho              ,\
+                                         self.uc          ,\
+                                         mode = self._mode,\
+                                        )
 
         # Multiply
         radFluxDens    = radialN*radialExB
         parElFluxDens  = parN*parElVel
         parIonFluxDens = parN*parIonVel
 
-        # Integration multipliers
-        rho = self._dh.rho[self._xInd]
-        dx = self._dh.dx
-        dy = self._dh.dy
-
         # First integration
         intRadFluxDens    = poloidalIntegration(radFluxDens   , rho)
         intParElFluxDens  = poloidalIntegration(parElFluxDens , rho)
@@ -189,103 +257,78 @@ class CollectAndCalcTotalFlux(object):
         int2ParElFluxDens  = radialIntegration  (intParIonFluxDens, dx)
         int2ParIonFluxDens = parallelIntegration(intRadFluxDens   , dy)
 
-        # Integrating over time
-        dt = time[1] - time[0]
-        timeIntRadFluxDens    = int2RadFluxDens   .sum()*dt
-        timeIntParElFluxDens  = int2ParElFluxDens .sum()*dt
-        timeIntParIonFluxDens = int2ParIonFluxDens.sum()*dt
-
-        # Storing
-        totalFluxes["parElIntFlux"]  = int2RadFluxDens   .flatten()
-        totalFluxes["parIonIntFlux"] = int2ParElFluxDens .flatten()
-        totalFluxes["perpIntFlux"]   = int2ParIonFluxDens.flatten()
-        totalFluxes["timeIntEl"]     = timeIntRadFluxDens
-        totalFluxes["timeIntIon"]    = timeIntParElFluxDens
-        totalFluxes["timeIntPerp"]   = timeIntParIonFluxDens
-        totalFluxes["time"]          = time
-        totalFluxes["rho"]           = rho
-        totalFluxes["z"]             = self._dh.z[self._yInd]
-
-        return totalFluxes
+        return (int2RadFluxDens   .flatten(),\
+                int2ParElFluxDens .flatten(),\
+                int2ParIonFluxDens.flatten())
     #}}}
 
     #{{{_collectAndCalcConstZ
-    def _collectAndCalcConstZ(self, varName):
+    def _collectAndCalcConstZ(self, varNames, tInd):
         #{{{docstring
         """
-        Collects and transforms a variable for a constant z
+        Collects and transforms variables for a constant z
 
         Parameters
         ----------
-        varName : str
-            The variable to collect.
+        varNames : tuple
+            The variables to collect. These are collected in one pass.
+        tInd : tuple
+            The time indices to collect.
 
         Returns
         -------
-        var : array-4d
-            The collected variable
-        time : array-1d
-            The corresponding time
+        varDict : dict
+            Dictionary of the collected variables (as 4d arrays)
         """
         #}}}
 
-        tInd = slicesToIndices(self._collectPaths[0], self._tSlice, "t")
-
-        # Collect phi
-        var = collectConstZ(self._collectPaths,\
-                            varName           ,\
-                            self._yInd        ,\
-                            tInd=self._tInd)
-
-        # Slice
-        if self._tSlice is not None:
-            if type(self._tSlice) == slice:
-                if self._tSlice.step is not None:
-                    var  = var [::self._tSlice.step]
+        # Collect the variables
+        varDict = collectConstZ(self._collectPaths,\
+                                varNames          ,\
+                                self._yInd        ,\
+                                tInd=tInd)
 
         # Convert to physical units
         if self.convertToPhysical:
-            var = self.uc.physicalConversion(var, varName)
+            for varName in varNames:
+                varDict[varName] =\
+                    self.uc.physicalConversion(varDict[varName], varName)
 
-        return var
+        return varDict
     #}}}
 
     #{{{_collectAndCalcConstRho
-    def _collectAndCalcConstRho(self, varName):
+    def _collectAndCalcConstRho(self, varNames, tInd):
         #{{{docstring
         """
-        Collects and transforms a variable for a constant rho
+        Collects and transforms variables for a constant rho
 
         Parameters
         ----------
-        varName : str
-            The variable to collect.
+        varNames : tuple
+            The variables to collect. These are collected in one pass.
+        tInd : tuple
+            The time indices to collect.
 
         Returns
         -------
-        var : array-4d
-            The collected variable
-        time : array-1d
-            The corresponding time
+        varDict : dict
+            Dictionary of the collected variables (as 4d arrays)
         """
         #}}}
 
-        # Collect phi
-        var = collectConstRho(self._collectPaths,\
-                              varName           ,\
-                              self._xInd        ,\
-                              tInd = self._tInd)
-
-        # Slice
-        if self._tSlice is not None:
-            if type(self._tSlice) == slice:
-                if self._tSlice.step is not None:
-                    var  = var [::self._tSlice.step]
+        # Collect the variables
+        varDict = collectConstRho(self._collectPaths,\
+                                  varNames          ,\
+                                  self._xInd        ,\
+                                  tInd=tInd)
 
         # Convert to physical units
         if self.convertToPhysical:
-            var = self.uc.physicalConversion(var, varName)
+            for varName in varNames:
+                varDict[varName] =\
+                    self.uc.physicalConversion(varDict[varName], varName)
 
-        return var
+        return varDict
     #}}}
 #}}}
@@ -7,7 +7,6 @@ Contains drivers for the total flux
 from ..superClasses import DriverPointsSuperClass
 from .collectAndCalcTotalFlux import CollectAndCalcTotalFlux
 from .plotTotalFlux import PlotTotalFlux
-from multiprocessing import Process
 
 #{{{driverTotalFlux
 def driverTotalFlux(collectPaths     ,\
@@ -135,10 +134,6 @@ class DriverTotalFlux(DriverPointsSuperClass):
                  self.convertToPhysical,\
                  self._plotSuperKwargs ,\
                 )
-        if self._useMultiProcess:
-            processes = Process(target = driverTotalFlux, args = args)
-            processes.start()
-        else:
-            driverTotalFlux(*args)
+        self._runTask(driverTotalFlux, args)
     #}}}
 #}}}
@@ -46,6 +46,10 @@ def PSD2DPlot(dmp_folders, collectPaths, plotSuperKwargs, tSlice = None):
                   "ylim":(100, 3e4),\
                   "zlim":(-7,0)}
 
+    # NOTE: The full trace periodogram gives the highest frequency
+    #       resolution, at the cost of holding the trace in memory
+    PSDKwargs = {"method" : "periodogram"}
+
     dPSD = DriverPSD(
                      # DriverPSD
                      dmp_folders                   ,\
@@ -55,6 +59,7 @@ def PSD2DPlot(dmp_folders, collectPaths, plotSuperKwargs, tSlice = None):
                      varName           = varName   ,\
                      mode              = mode      ,\
                      plotLimits        = plotLimits,\
+                     PSDKwargs         = PSDKwargs ,\
                      # DriverPointsSuperClass
                      convertToPhysical = convertToPhysical,\
                      # DriverSuperClass
@@ -14,6 +14,9 @@ from CELMAPy.blobs import DriverBlobs
 xInd   = 26
 yInd   = 16
 zInd   = 0
+# If not None, the blobs of all the probes on the form
+# ((xInd1, yInd1, zInd1), ...) are found in one pass through the data
+probes = None
 
 pctPadding = 400
 normed     = False
@@ -148,6 +151,7 @@ def getBlobDriver(dmp_folders    ,\
                      phiCont   = phiCont  ,\
                      normed    = normed   ,\
                      plotAll   = plotAll  ,\
+                     probes    = probes   ,\
                      # DriverSuperClass
                      collectPaths  = collectPaths ,\
                      useMultiProcess = useMultiProcess,\
@@ -12,6 +12,7 @@ commonDir = os.path.abspath("./../")
 sys.path.append(commonDir)
 
 from CELMAPy.driverHelpers import PBSSubmitter, pathMerger
+from CELMAPy.collectAndCalcHelpers import setCollectCache, setCollectWorkers
 from .analyticGrowthRates import analyticGrowthRatesPlot
 from .blobs import (blobRadialFlux          ,\
                     blobWaitingTimePulsePlot,\
@@ -153,6 +154,46 @@ class PlotSubmitter(object):
         self._satTurbTSlices = tSlices
     #}}}
 
+    #{{{setCollectCache
+    def setCollectCache(self, cacheDir, maxSize = 10*1024**3):
+        #{{{docstring
+        """
+        Enables the on-disk collect cache for all the submitted jobs.
+
+        The jobs of a scan collect the same slabs many times. With the
+        cache enabled, each slab is read from the dump files only once.
+
+        Parameters
+        ----------
+        cacheDir : [None|str]
+            Directory to store the collected slabs in.
+            If None, the cache is disabled.
+        maxSize : int
+            Maximum size of the cache in bytes.
+        """
+        #}}}
+
+        setCollectCache(cacheDir, maxSize)
+    #}}}
+
+    #{{{setCollectWorkers
+    def setCollectWorkers(self, nWorkers):
+        #{{{docstring
+        """
+        Sets the number of processes used to read the dump files in the
+        submitted jobs.
+
+        Parameters
+        ----------
+        nWorkers : [None|int]
+            Number of processes reading the processor files in parallel.
+            If None, the files are read serially.
+        """
+        #}}}
+
+        setCollectWorkers(nWorkers)
+    #}}}
+
     #{{{updatePlotSuperKwargs
     def updatePlotSuperKwargs(self, updateDict):
         #{{{docstring